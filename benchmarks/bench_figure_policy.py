@@ -0,0 +1,150 @@
+# Copyright 2025 The MathWorks, Inc.
+"""
+Compares the size of the figure images sent to Jupyter, the size of a notebook
+which displays them and the time taken by the kernel to process them, under
+several figure policies.
+
+Figures are synthetic PNG images at the default resolution of figures returned
+by the Live Editor: a line plot with few colors, an antialiased line plot and a
+shaded surface plot. Sizes are those of the base64 encoded images, as saved in
+notebooks. Requires Pillow.
+
+Usage:
+    python benchmarks/bench_figure_policy.py [--figures 10] [--policy "format=auto" ...]
+"""
+
+import argparse
+import base64
+import io
+import json
+import random
+import sys
+import time
+
+from jupyter_matlab_kernel.figure_policy import FigurePolicy
+
+_POLICIES = [
+    "format=original",
+    "format=png",
+    "format=jpeg",
+    "format=auto",
+    "format=auto max_width=800",
+    "format=auto max_width=560",
+]
+
+_SIZE = (1120, 840)
+
+
+def line_plot(Image, ImageDraw, antialiased):
+    """Line plot with axes, rendered at 4 times the size and downscaled if antialiased."""
+    scale = 4 if antialiased else 1
+    width, height = _SIZE[0] * scale, _SIZE[1] * scale
+    image = Image.new("RGB", (width, height), "white")
+    draw = ImageDraw.Draw(image)
+    left, top, right, bottom = 0.13 * width, 0.11 * height, 0.9 * width, 0.9 * height
+    draw.rectangle([left, top, right, bottom], outline=(38, 38, 38), width=scale)
+    for tick in range(1, 10):
+        x = left + (right - left) * tick / 10
+        draw.line([(x, top), (x, bottom)], fill=(223, 223, 223), width=scale)
+    for color, phase in [((0, 114, 189), 0), ((217, 83, 25), 1), ((237, 177, 32), 2)]:
+        points = [
+            (
+                left + (right - left) * idx / 200,
+                (top + bottom) / 2
+                + (bottom - top) * 0.4 * ((idx * 7 + phase * 50) % 100 - 50) / 50,
+            )
+            for idx in range(201)
+        ]
+        draw.line(points, fill=color, width=2 * scale)
+    if antialiased:
+        image = image.resize(_SIZE, Image.Resampling.LANCZOS)
+    return image
+
+
+def surface_plot(Image):
+    """Shaded surface, with the gradients and lighting noise of a rendered surface plot."""
+    noise = random.Random(0)
+    width, height = _SIZE
+    image = Image.new("RGB", _SIZE)
+    image.putdata(
+        [
+            (
+                (x * 255) // width,
+                (y * 255) // height,
+                128 + noise.randint(-24, 24),
+            )
+            for y in range(height)
+            for x in range(width)
+        ]
+    )
+    return image
+
+
+def to_output(image):
+    buffer = io.BytesIO()
+    image.save(buffer, "PNG")
+    return {
+        "type": "execute_result",
+        "mimetype": ["image/png"],
+        "value": [base64.b64encode(buffer.getvalue()).decode("ascii")],
+    }
+
+
+def notebook_size(outputs):
+    """Size in bytes of a notebook with one cell for each output, as saved by Jupyter."""
+    cells = [
+        {
+            "cell_type": "code",
+            "execution_count": idx,
+            "metadata": {},
+            "source": "plot(x, y)",
+            "outputs": [
+                {
+                    "output_type": "display_data",
+                    "data": dict(zip(output["mimetype"], output["value"])),
+                    "metadata": {},
+                }
+            ],
+        }
+        for idx, output in enumerate(outputs, 1)
+    ]
+    notebook = {"cells": cells, "metadata": {}, "nbformat": 4, "nbformat_minor": 5}
+    return len(json.dumps(notebook, indent=1).encode("utf-8"))
+
+
+def main(figures, policies):
+    try:
+        from PIL import Image, ImageDraw
+    except ImportError:
+        sys.exit("This benchmark requires Pillow: python3 -m pip install pillow")
+
+    kinds = {
+        "line": to_output(line_plot(Image, ImageDraw, antialiased=False)),
+        "antialiased": to_output(line_plot(Image, ImageDraw, antialiased=True)),
+        "surface": to_output(surface_plot(Image)),
+    }
+
+    print(
+        f"{'figure':>12} {'policy':>28} {'type':>11}"
+        f" {'bytes/figure':>13} {'notebook KB':>12} {'ms/figure':>10}"
+    )
+    for kind, output in kinds.items():
+        for spec in policies:
+            policy = FigurePolicy.parse(spec)
+            start = time.perf_counter()
+            processed = [policy.apply(output) for _ in range(figures)]
+            elapsed = (time.perf_counter() - start) * 1000 / figures
+            size = len(processed[0]["value"][0])
+            print(
+                f"{kind:>12} {spec:>28} {processed[0]['mimetype'][0]:>11}"
+                f" {size:>13,} {notebook_size(processed) / 1024:>12,.0f}"
+                f" {elapsed:>10.1f}"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--figures", type=int, default=10)
+    parser.add_argument("--policy", nargs="+", default=_POLICIES)
+    args = parser.parse_args()
+    main(args.figures, args.policy)
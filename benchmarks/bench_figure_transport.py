@@ -0,0 +1,122 @@
+# Copyright 2025 The MathWorks, Inc.
+"""
+Compares the size of the response to an execution request, the time taken by
+the kernel to decode it and the peak memory allocated while decoding it, when
+figures are returned inline as base64 strings and when they are returned as
+references to images in the figure spool folder.
+
+Usage:
+    python benchmarks/bench_figure_transport.py [--figures 1 5 10 20] [--image-size 200000]
+"""
+
+import argparse
+import base64
+import hashlib
+import json
+import os
+import time
+import tracemalloc
+
+from jupyter_matlab_kernel.figure_spool import FigureSpool
+
+
+def make_inline_response(images):
+    outputs = [
+        {
+            "type": "execute_result",
+            "mimetype": ["image/png"],
+            "value": [base64.b64encode(image).decode("ascii")],
+        }
+        for image in images
+    ]
+    return json.dumps(make_feval_response(outputs)).encode("utf-8")
+
+
+def make_spooled_response(images, spool):
+    outputs = []
+    for idx, image in enumerate(images):
+        path = spool.spool_dir / f"figure_{idx}.png"
+        path.write_bytes(image)
+        outputs.append(
+            {
+                "type": "execute_result",
+                "mimetype": ["image/png"],
+                "value": [""],
+                "spooledFigure": {
+                    "path": str(path),
+                    "size": len(image),
+                    "sha256": hashlib.sha256(image).hexdigest(),
+                },
+            }
+        )
+    return json.dumps(make_feval_response(outputs)).encode("utf-8")
+
+
+def make_feval_response(outputs):
+    return {
+        "messages": {
+            "FEvalResponse": [
+                {"isError": False, "results": [outputs], "messageFaults": []}
+            ]
+        }
+    }
+
+
+def decode_inline(response):
+    outputs = json.loads(response)["messages"]["FEvalResponse"][-1]["results"][0]
+    return [output["value"][0] for output in outputs]
+
+
+def decode_spooled(response, spool):
+    outputs = json.loads(response)["messages"]["FEvalResponse"][-1]["results"][0]
+    return [spool.load(output)["value"][0] for output in outputs]
+
+
+def measure(func, *args):
+    """Returns the time taken in milliseconds and the peak memory allocated in KiB."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    func(*args)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed * 1e3, peak / 1024
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--figures", type=int, nargs="+", default=[1, 5, 10, 20])
+    parser.add_argument("--image-size", type=int, default=200_000)
+    args = parser.parse_args()
+
+    print(
+        f"{'figures':>8} {'inline bytes':>13} {'spooled bytes':>14}"
+        f" {'inline ms':>10} {'spooled ms':>11}"
+        f" {'inline KiB':>11} {'spooled KiB':>12}"
+    )
+    spool = FigureSpool("benchmark")
+    try:
+        for num_figures in args.figures:
+            images = [os.urandom(args.image_size) for _ in range(num_figures)]
+
+            inline_response = make_inline_response(images)
+            inline_time, inline_peak = measure(decode_inline, inline_response)
+
+            # The spooled response also includes the time taken to read and encode
+            # the images, which happens when the outputs are displayed.
+            spooled_response = make_spooled_response(images, spool)
+            spooled_time, spooled_peak = measure(
+                decode_spooled, spooled_response, spool
+            )
+
+            print(
+                f"{num_figures:>8} {len(inline_response):>13} {len(spooled_response):>14}"
+                f" {inline_time:>10.2f} {spooled_time:>11.2f}"
+                f" {inline_peak:>11.0f} {spooled_peak:>12.0f}"
+            )
+    finally:
+        spool.cleanup()
+
+
+if __name__ == "__main__":
+    main()
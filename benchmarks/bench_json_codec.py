@@ -0,0 +1,129 @@
+# Copyright 2025 The MathWorks, Inc.
+"""
+Measures the time taken by each installed JSON codec to decode FEval responses
+containing representative outputs of processOutputs in jupyter.execute, compared
+with decoding the response as a str using the json module of the standard library,
+which is what aiohttp's ClientResponse.json does.
+
+Usage:
+    python benchmarks/bench_json_codec.py [--repeat 20]
+"""
+
+import argparse
+import base64
+import json
+import os
+import time
+
+from jupyter_matlab_kernel import json_codec
+
+
+def process_text(text):
+    return {
+        "type": "execute_result",
+        "mimetype": ["text/html", "text/plain"],
+        "value": [f"<html><body><pre>{text}</pre></body></html>", text],
+    }
+
+
+def make_text_outputs():
+    return [
+        {
+            "type": "stream",
+            "content": {"name": "stdout", "text": f"Iteration {idx} completed\n"},
+        }
+        for idx in range(2000)
+    ]
+
+
+def make_matrix_outputs():
+    rows = "\n".join(
+        "  ".join(f"{row * col / 7:10.4f}" for col in range(30)) for row in range(500)
+    )
+    return [process_text(f"A = 500x30 double\n{rows}")]
+
+
+def make_figure_outputs():
+    return [
+        {
+            "type": "execute_result",
+            "mimetype": ["image/png"],
+            "value": [base64.b64encode(os.urandom(150 * 1024)).decode("ascii")],
+        }
+        for _ in range(10)
+    ]
+
+
+def make_symbolic_outputs():
+    return [
+        {
+            "type": "execute_result",
+            "mimetype": ["text/latex"],
+            "value": [
+                f"$y_{{{idx}}} = \\frac{{x^{{{idx}}}}}{{{idx} + 1}} + \\sin\\left(x\\right)$"
+            ],
+        }
+        for idx in range(500)
+    ]
+
+
+PAYLOADS = {
+    "text": make_text_outputs,
+    "matrix": make_matrix_outputs,
+    "10 figures": make_figure_outputs,
+    "symbolic": make_symbolic_outputs,
+}
+
+
+def make_feval_response(outputs):
+    response = {
+        "messages": {
+            "FEvalResponse": [
+                {"isError": False, "results": [outputs], "messageFaults": []}
+            ]
+        }
+    }
+    return json.dumps(response).encode("utf-8")
+
+
+def stdlib_from_str(data):
+    return json.loads(data.decode("utf-8"))
+
+
+def measure(loads, data, repeat):
+    """Returns the best time in milliseconds taken to decode data."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        loads(data)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main(repeat):
+    decoders = {"json (str)": stdlib_from_str}
+    for name in ("json", "orjson", "msgspec"):
+        codec = json_codec.get_codec(name)
+        if codec.name == name:
+            decoders[f"{name} (bytes)"] = codec.loads
+        else:
+            print(f"{name} is not installed, skipping it")
+
+    print(
+        f"{'payload':>12} {'size KiB':>10}"
+        + "".join(f" {name + ' ms':>18}" for name in decoders)
+    )
+    for payload, make_outputs in PAYLOADS.items():
+        data = make_feval_response(make_outputs())
+        times = [measure(loads, data, repeat) for loads in decoders.values()]
+        print(
+            f"{payload:>12} {len(data) / 1024:>10.1f}"
+            + "".join(f" {t:>18.3f}" for t in times)
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+    main(args.repeat)
@@ -0,0 +1,115 @@
+# Copyright 2025 The MathWorks, Inc.
+"""
+Compares the number of iopub messages and the end-to-end time taken to deliver
+and render the outputs of a cell which prints many lines, when each output is
+sent as a separate message and when adjacent stream outputs are coalesced.
+
+Messages are serialized with the Jupyter message protocol and sent over a ZeroMQ
+socket on the loopback interface, like the iopub channel. The receiver stands in
+for the front-end: it deserializes each message and appends stream text to the
+output area, as notebook front-ends do for adjacent stream outputs.
+
+Usage:
+    python benchmarks/bench_output_coalescing.py [--lines 100 1000 10000] [--interval 0.05]
+"""
+
+import argparse
+import threading
+import time
+
+import zmq
+from jupyter_client.session import Session
+
+from jupyter_matlab_kernel.output_coalescer import OutputCoalescer
+
+_DONE = "done"
+
+
+def make_outputs(lines):
+    """Outputs of a loop which calls disp once for each line."""
+    return [
+        {"type": "stream", "content": {"name": "stdout", "text": f"Iteration {idx}\n"}}
+        for idx in range(lines)
+    ]
+
+
+def render(session, socket):
+    """Receives messages until the end of the cell, and returns the output area."""
+    output_area = []
+    while True:
+        _, frames = session.feed_identities(socket.recv_multipart(copy=True))
+        msg = session.deserialize(frames)
+        if msg["msg_type"] == _DONE:
+            return output_area
+        content = msg["content"]
+        if output_area and output_area[-1]["name"] == content["name"]:
+            output_area[-1]["text"] += content["text"]
+        else:
+            output_area.append(dict(content))
+
+
+def run(outputs, coalesce, interval):
+    """Returns the number of messages sent, and the time in milliseconds to render them."""
+    context = zmq.Context.instance()
+    sender = context.socket(zmq.PUSH)
+    receiver = context.socket(zmq.PULL)
+    port = receiver.bind_to_random_port("tcp://127.0.0.1")
+    sender.connect(f"tcp://127.0.0.1:{port}")
+    session = Session(key=b"benchmark")
+
+    sent = []
+
+    def send_output(output):
+        sent.append(output)
+        session.send(sender, output["type"], output["content"])
+
+    result = {}
+    thread = threading.Thread(
+        target=lambda: result.update(area=render(session, receiver))
+    )
+    thread.start()
+
+    start = time.perf_counter()
+    if coalesce:
+        coalescer = OutputCoalescer(send_output, interval=interval)
+        for output in outputs:
+            coalescer.add(output)
+        coalescer.flush()
+    else:
+        for output in outputs:
+            send_output(output)
+    session.send(sender, _DONE, {})
+    thread.join()
+    elapsed = time.perf_counter() - start
+
+    sender.close(linger=0)
+    receiver.close(linger=0)
+    expected = "".join(output["content"]["text"] for output in outputs)
+    assert result["area"] == [{"name": "stdout", "text": expected}]
+    return len(sent), elapsed * 1000
+
+
+def main(lines, interval, repeat):
+    print(
+        f"{'lines':>8} {'messages':>10} {'coalesced':>10}"
+        f" {'render ms':>12} {'coalesced ms':>14} {'speedup':>8}"
+    )
+    for count in lines:
+        outputs = make_outputs(count)
+        before = [run(outputs, False, interval) for _ in range(repeat)]
+        after = [run(outputs, True, interval) for _ in range(repeat)]
+        messages, before_ms = before[0][0], min(t for _, t in before)
+        coalesced, after_ms = after[0][0], min(t for _, t in after)
+        print(
+            f"{count:>8} {messages:>10} {coalesced:>10}"
+            f" {before_ms:>12.1f} {after_ms:>14.1f} {before_ms / after_ms:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--lines", type=int, nargs="+", default=[100, 1000, 10000])
+    parser.add_argument("--interval", type=float, default=0.05)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    main(args.lines, args.interval, args.repeat)
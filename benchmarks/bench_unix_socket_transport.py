@@ -0,0 +1,91 @@
+# Copyright 2025 The MathWorks, Inc.
+"""
+Compares the latency of small requests sent by the kernel to a local stand-in
+for matlab-proxy over loopback TCP and over a Unix domain socket.
+
+Usage:
+    python benchmarks/bench_unix_socket_transport.py [--requests 2000]
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+
+from aiohttp import web
+
+from jupyter_matlab_kernel.mwi_comm_helpers import MWICommHelper
+
+
+async def get_status(request):
+    return web.json_response(
+        {
+            "licensing": {"type": "existing_license"},
+            "matlab": {"status": "up"},
+            "error": None,
+        }
+    )
+
+
+async def measure(comm_helper, num_requests):
+    """Returns the latencies in microseconds of fetching the matlab-proxy status."""
+    latencies = []
+    for _ in range(num_requests):
+        start = time.perf_counter()
+        await comm_helper.fetch_matlab_proxy_status()
+        latencies.append((time.perf_counter() - start) * 1e6)
+    return latencies
+
+
+def report(name, latencies):
+    latencies = sorted(latencies)
+    p99 = latencies[int(len(latencies) * 0.99) - 1]
+    print(
+        f"{name:>12} {statistics.mean(latencies):>10.1f} {statistics.median(latencies):>10.1f}"
+        f" {p99:>10.1f}"
+    )
+
+
+async def main(num_requests):
+    app = web.Application()
+    app.router.add_get("/get_status", get_status)
+    runner = web.AppRunner(app)
+    await runner.setup()
+
+    with tempfile.TemporaryDirectory() as socket_dir:
+        socket_path = os.path.join(socket_dir, "matlab-proxy.sock")
+        await web.UnixSite(runner, socket_path).start()
+        tcp_site = web.TCPSite(runner, "127.0.0.1", 0)
+        await tcp_site.start()
+        port = tcp_site._server.sockets[0].getsockname()[1]
+
+        loop = asyncio.get_running_loop()
+        tcp_helper = MWICommHelper("bench", f"http://127.0.0.1:{port}", loop, loop, {})
+        unix_helper = MWICommHelper(
+            "bench", "http://matlab-proxy", loop, loop, {}, unix_socket=socket_path
+        )
+
+        await tcp_helper.connect()
+        await unix_helper.connect()
+        try:
+            # Warm up both transports before measuring.
+            await measure(tcp_helper, 50)
+            await measure(unix_helper, 50)
+
+            print(f"{'transport':>12} {'mean us':>10} {'median us':>10} {'p99 us':>10}")
+            report("tcp", await measure(tcp_helper, num_requests))
+            report("unix socket", await measure(unix_helper, num_requests))
+        finally:
+            await tcp_helper.disconnect()
+            await unix_helper.disconnect()
+
+    await runner.cleanup()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--requests", type=int, default=2000)
+    args = parser.parse_args()
+    asyncio.run(main(args.requests))
@@ -8,9 +8,11 @@ backend MATLAB proxy servers.
 2. MATLAB Kernels that uses proxy manager to start backend matlab proxy servers
 """
 
+import asyncio
 import os
 import sys
 import time
+import uuid
 from logging import Logger
 from pathlib import Path
 from typing import Optional
@@ -19,16 +21,58 @@ import aiohttp
 import aiohttp.client_exceptions
 import ipykernel.kernelbase
 import psutil
-from matlab_proxy import settings as mwi_settings
+from ipykernel.comm import CommManager
 from matlab_proxy import util as mwi_util
 
+from jupyter_matlab_kernel import environment_variables as mwi_env
+from jupyter_matlab_kernel import mwi_logger
+from jupyter_matlab_kernel import startup_monitor
+from jupyter_matlab_kernel.completion_scheduler import CompletionScheduler
+from jupyter_matlab_kernel.figure_deduplicator import FigureDeduplicator
+from jupyter_matlab_kernel.figure_policy import FigurePolicy
+from jupyter_matlab_kernel.figure_spool import FigureSpool, is_spooled_figure
+from jupyter_matlab_kernel.figure_store import DEFAULT_STORE_DIR, FigureStore, is_figure
 from jupyter_matlab_kernel.magic_execution_engine import (
     MagicExecutionEngine,
     get_completion_result_for_magics,
 )
+from jupyter_matlab_kernel.mathml import symbolic_output
 from jupyter_matlab_kernel.mwi_exceptions import MATLABConnectionError
-
-_MATLAB_STARTUP_TIMEOUT = mwi_settings.get_process_startup_timeout()
+from jupyter_matlab_kernel.output_coalescer import OutputCoalescer
+from jupyter_matlab_kernel.output_limiter import OutputLimiter
+from jupyter_matlab_kernel.output_pager import PAGER_COMM_TARGET, OutputPager
+from jupyter_matlab_kernel.output_transformer import (
+    is_raw_outputs,
+    transform_raw_outputs,
+)
+from jupyter_matlab_kernel.startup_monitor import MATLABStartupMonitor
+
+# No-op cell executed to warm up MATLAB. It does not leave any variable in the workspace.
+_DEFAULT_WARMUP_CODE = "jupyterWarmup = [];\nclear jupyterWarmup"
+
+# Keywords of the MATLAB language, used for completion while MATLAB is starting
+_MATLAB_KEYWORDS = (
+    "break",
+    "case",
+    "catch",
+    "classdef",
+    "continue",
+    "else",
+    "elseif",
+    "end",
+    "for",
+    "function",
+    "global",
+    "if",
+    "otherwise",
+    "parfor",
+    "persistent",
+    "return",
+    "spmd",
+    "switch",
+    "try",
+    "while",
+)
 
 
 def _fetch_jupyter_base_url(parent_pid: str, logger: Logger) -> str:
@@ -97,6 +141,36 @@ def _get_parent_pid() -> int:
     return parent_pid
 
 
+def _get_keyword_completion_results(code, cursor_pos):
+    """
+    Completes the MATLAB keywords matching the word before the cursor, without MATLAB.
+
+    Args:
+        code (str): Code on which Tab completion is requested.
+        cursor_pos (int): Position of the cursor when Tab completion is requested.
+
+    Returns:
+        dict: Completion results in the format returned by MATLAB.
+    """
+    start = cursor_pos
+    while start > 0 and (code[start - 1].isalnum() or code[start - 1] == "_"):
+        start -= 1
+    word = code[start:cursor_pos]
+
+    matches = [
+        keyword for keyword in _MATLAB_KEYWORDS if word and keyword.startswith(word)
+    ]
+    return {
+        "matches": matches,
+        "start": start,
+        "end": cursor_pos,
+        "completions": [
+            {"type": "keyword", "text": match, "start": start, "end": cursor_pos}
+            for match in matches
+        ],
+    }
+
+
 class BaseMATLABKernel(ipykernel.kernelbase.Kernel):
     # Required variables for Jupyter Kernel to function
     # banner is shown only for Jupyter Console.
@@ -141,9 +215,134 @@ class BaseMATLABKernel(ipykernel.kernelbase.Kernel):
         # Communication helper for interaction with backend MATLAB proxy
         self.mwi_comm_helper = None
 
+        # Send outputs to Jupyter while MATLAB is still executing the cell
+        self.stream_outputs = mwi_env.is_output_streaming_enabled()
+
+        # Folder into which MATLAB writes figure images, instead of returning them
+        # in the response to the execution request.
+        self.figure_spool = (
+            FigureSpool(self.kernel_id, self.log)
+            if mwi_env.is_figure_spool_enabled()
+            else None
+        )
+
+        # Folder beside the notebook into which figure images are written, so that
+        # notebooks reference the images instead of embedding them.
+        self.figure_store = (
+            FigureStore(
+                mwi_env.get_figure_store_dir(DEFAULT_STORE_DIR), logger=self.log
+            )
+            if mwi_env.is_figure_store_enabled()
+            else None
+        )
+
+        # Format and resolution of the figure images sent to Jupyter. The policy of
+        # the kernel can be replaced for a single cell using the figure_policy magic.
+        self.figure_policy = None
+        self.cell_figure_policy = None
+        if mwi_env.get_figure_policy():
+            try:
+                self.figure_policy = FigurePolicy.parse(
+                    mwi_env.get_figure_policy(), logger=self.log
+                )
+            except ValueError as e:
+                self.log.error(
+                    f"Ignoring the figure policy set in {mwi_env.get_env_name_figure_policy()}: {e}"
+                )
+
+        # Replaces figures identical to a recently displayed figure with a reference
+        # to it, so that cells which display the same figure repeatedly send it once.
+        dedup_options = mwi_env.get_figure_dedup_options()
+        self.figure_deduplicator = (
+            FigureDeduplicator(**dedup_options, logger=self.log)
+            if dedup_options is not None
+            else None
+        )
+        self._cell_id = None
+
+        # Skips completion requests superseded while they wait for their turn
+        self.completion_scheduler = CompletionScheduler(logger=self.log)
+
+        # Follows the startup of MATLAB in the background, so that the kernel can
+        # answer requests which do not need MATLAB while it is starting.
+        self.startup_monitor = MATLABStartupMonitor(self.log)
+
+        # Prime MATLAB and the Live Editor in the background as soon as MATLAB is up,
+        # so that the first cell does not pay for their initialization.
+        self.warmup_enabled = mwi_env.is_warmup_enabled()
+        self.warmup_timings = None
+        self._warmup_task = None
+
+        # Display which shows the position of the cell in the queue of a MATLAB shared
+        # with other kernels, while the cell is waiting for MATLAB.
+        self._queue_display_id = None
+
+        # Display figures after the other outputs of a cell, in placeholders which
+        # are updated with the images once they are displayed.
+        self.defer_figures = mwi_env.is_figure_deferral_enabled()
+        self._figure_display_prefix = None
+
+        # Convert the MathML of symbolic outputs to LaTeX in the kernel, instead of
+        # in a webwindow on the MATLAB thread.
+        self.convert_symbolic = mwi_env.is_symbolic_conversion_enabled()
+
+        # Transform the outputs of the Live Editor API into Jupyter outputs in the
+        # kernel, instead of post-processing them on the MATLAB thread.
+        self.raw_outputs = mwi_env.is_raw_outputs_enabled()
+
+        # Merges adjacent stream outputs, so that a cell which prints many lines
+        # does not send one iopub message for each line.
+        self.output_coalescer = (
+            OutputCoalescer(
+                self._send_output,
+                interval=mwi_env.get_coalesce_interval(),
+                logger=self.log,
+            )
+            if mwi_env.is_output_coalescing_enabled()
+            else None
+        )
+
+        # Collapses repeated lines and limits the stream outputs of each cell, so
+        # that a cell which floods its output does not freeze the notebook.
+        self.output_limiter = (
+            OutputLimiter(**mwi_env.get_output_limit_options(), logger=self.log)
+            if mwi_env.is_output_limit_enabled()
+            else None
+        )
+
+        # Sends only the first page of large text outputs to Jupyter, and serves the
+        # other pages on demand to the JupyterLab extension over a comm.
+        self.output_pager = None
+        if mwi_env.is_output_paging_enabled():
+            self.output_pager = OutputPager(
+                page_size=mwi_env.get_output_page_size(), logger=self.log
+            )
+            self._register_comm_target(PAGER_COMM_TARGET, self.output_pager.open_comm)
+
+    def start(self):
+        """
+        Starts the kernel and follows the startup of MATLAB in the background, if a
+        matlab-proxy server was assigned to the kernel during initialization.
+        """
+        super().start()
+        self._start_startup_monitor()
+
     # ipykernel Interface API
     # https://ipython.readthedocs.io/en/stable/development/wrapperkernels.html
 
+    async def shell_main(self, subshell_id, msg):
+        """
+        Registers completion requests when they are received, before they wait for
+        the shell messages received earlier to be handled, so that completion
+        requests superseded in the meantime are not sent to MATLAB.
+        """
+        msg_id = self._register_completion_request(msg)
+        try:
+            await super().shell_main(subshell_id, msg)
+        finally:
+            if msg_id is not None:
+                self.completion_scheduler.handled(msg_id)
+
     async def interrupt_request(self, stream, ident, parent):
         """
         Custom handling of interrupt request sent by Jupyter. For more info, look at
@@ -207,7 +406,13 @@ class BaseMATLABKernel(ipykernel.kernelbase.Kernel):
         Used by ipykernel infrastructure for execution. For more info, look at
         https://jupyter-client.readthedocs.io/en/stable/messaging.html#execute
         """
-        self.log.debug(f"Received execution request from Jupyter with code:\n{code}")
+        self.log.debug(
+            "Received execution request from Jupyter with code:\n%s",
+            mwi_logger.payload(code, "code"),
+        )
+        self._cell_id = cell_id
+        if self.figure_deduplicator is not None:
+            self.figure_deduplicator.start_cell(cell_id)
         try:
             accumulated_magic_outputs = []
             performed_startup_checks = False
@@ -245,31 +450,39 @@ class BaseMATLABKernel(ipykernel.kernelbase.Kernel):
                     for output in accumulated_magic_outputs:
                         self.display_output(output)
 
-                # Perform execution and categorization of outputs in MATLAB. Blocks
-                # until execution results are received from MATLAB.
-                outputs = await self.mwi_comm_helper.send_execution_request_to_matlab(
-                    code
+                # Perform execution and categorization of outputs in MATLAB. The
+                # startup message is cleared once the first output is received.
+                clear_startup_output = (
+                    performed_startup_checks and not accumulated_magic_outputs
                 )
+                idx = 0
+                async for data in self._fetch_execution_outputs(code):
+                    if clear_startup_output:
+                        self.log.debug(
+                            "Received outputs after execution in MATLAB. Clearing output area"
+                        )
+                        self.display_output(
+                            {"type": "clear_output", "content": {"wait": False}}
+                        )
+                        clear_startup_output = False
 
-                if performed_startup_checks and not accumulated_magic_outputs:
-                    self.display_output(
-                        {"type": "clear_output", "content": {"wait": False}}
+                    idx += 1
+                    self.log.debug(
+                        "Displaying output %d:\n%s",
+                        idx,
+                        mwi_logger.payload(data, "output"),
                     )
 
-                self.log.debug(
-                    "Received outputs after execution in MATLAB. Clearing output area"
-                )
-
-                # Display all the outputs produced during the execution of code.
-                for idx in range(len(outputs)):
-                    data = outputs[idx]
-                    self.log.debug(f"Displaying output {idx+1}:\n{data}")
-
                     # Ignore empty values returned from MATLAB.
                     if not data:
                         continue
                     self.display_output(data)
 
+                if clear_startup_output:
+                    self.display_output(
+                        {"type": "clear_output", "content": {"wait": False}}
+                    )
+
             # Execute post execution of MAGICs
             for output in self.magic_engine.process_after_cell_execution():
                 self.handle_magic_output(output)
@@ -288,8 +501,10 @@ class BaseMATLABKernel(ipykernel.kernelbase.Kernel):
                 e = MATLABConnectionError()
 
                 # Since MATLAB is not available, we need to perform the startup
-                # checks for subsequent execution requests
+                # checks and the session handshake for subsequent execution requests
                 self.startup_checks_completed = False
+                self.mwi_comm_helper.invalidate_session()
+                self._start_startup_monitor(restart=True)
 
             # Clearing lingering message "Executing..." before displaying the error message
             if performed_startup_checks and not accumulated_magic_outputs:
@@ -306,6 +521,14 @@ class BaseMATLABKernel(ipykernel.kernelbase.Kernel):
                     },
                 }
             )
+
+        # Send the outputs which are held back before replying that the cell is done.
+        if self.output_limiter is not None:
+            for output in self.output_limiter.end_cell():
+                self._emit_output(output)
+        if self.output_coalescer is not None:
+            self.output_coalescer.flush()
+        self.cell_figure_policy = None
         return {
             "status": "ok",
             "execution_count": self.execution_count,
@@ -323,7 +546,9 @@ class BaseMATLABKernel(ipykernel.kernelbase.Kernel):
               the licensing window.
         """
         self.log.debug(
-            f"Received completion request from Jupyter with cursor position {cursor_pos} and code:\n{code}"
+            "Received completion request from Jupyter with cursor position %d and code:\n%s",
+            cursor_pos,
+            mwi_logger.payload(code, "code"),
         )
         # Default completion results. It is modelled after ipkernel.py#do_complete
         # implementation to provide metadata for JupyterLab.
@@ -342,12 +567,20 @@ class BaseMATLABKernel(ipykernel.kernelbase.Kernel):
         )
 
         self.log.debug(
-            f"Received Completion results from MAGIC:\n{magic_completion_results}"
+            "Received Completion results from MAGIC:\n%s",
+            mwi_logger.payload(magic_completion_results, "response"),
         )
 
         if magic_completion_results:
             completion_results = magic_completion_results
-        else:
+        elif self.startup_monitor.state != startup_monitor.UP:
+            # Do not wait for MATLAB while it is starting
+            completion_results = _get_keyword_completion_results(code, cursor_pos)
+        # Requests superseded by a newer request for the same cell, which is waiting
+        # for its turn, are answered with empty results.
+        elif self.completion_scheduler.should_send(
+            self.get_parent("shell").get("header", {}).get("msg_id")
+        ):
             try:
                 completion_results = (
                     await self.mwi_comm_helper.send_completion_request_to_matlab(
@@ -363,7 +596,8 @@ class BaseMATLABKernel(ipykernel.kernelbase.Kernel):
                 )
 
             self.log.debug(
-                f"Received completion results from MATLAB:\n{completion_results}"
+                "Received completion results from MATLAB:\n%s",
+                mwi_logger.payload(completion_results, "response"),
             )
 
         return {
@@ -376,11 +610,47 @@ class BaseMATLABKernel(ipykernel.kernelbase.Kernel):
             },
         }
 
+    def _cancel_on_shell_loop(self, task):
+        """
+        Cancels a task which runs on the shell loop. Shutdown requests are handled on
+        the control thread, so the task must not be cancelled from there directly.
+
+        Args:
+            task (asyncio.Future): Task created on the shell loop.
+        """
+        self.io_loop.asyncio_loop.call_soon_threadsafe(task.cancel)
+
+    def do_shutdown(self, restart):
+        """
+        Cleans up the resources held by the kernel process. Derived classes are
+        expected to shut down their MATLAB session before calling this method.
+        """
+        self.startup_monitor.stop()
+        if self._warmup_task is not None:
+            self._cancel_on_shell_loop(self._warmup_task)
+        if self.figure_spool is not None:
+            self.figure_spool.cleanup()
+        if self.figure_deduplicator is not None:
+            self.log.debug(f"Figure deduplication: {self.figure_deduplicator.counters}")
+        return super().do_shutdown(restart)
+
     async def do_is_complete(self, code):
         # TODO: Seems like indentation rules. https://jupyter-client.readthedocs.io/en/stable/messaging.html#code-completeness
         return super().do_is_complete(code)
 
     async def do_inspect(self, code, cursor_pos, detail_level=0, omit_sections=...):
+        # While MATLAB is starting, report the progress of the startup.
+        if self.startup_monitor.state != startup_monitor.UP:
+            return {
+                "status": "ok",
+                "found": True,
+                "data": {
+                    "text/plain": f"MATLAB is not available yet (state: {self.startup_monitor.state}, "
+                    f"elapsed time: {self.startup_monitor.elapsed_time:.0f} seconds)."
+                },
+                "metadata": {},
+            }
+
         # TODO: Implement Shift+Tab functionality. Can be used to provide any contextual information.
         return super().do_inspect(code, cursor_pos, detail_level, omit_sections)
 
@@ -404,6 +674,143 @@ class BaseMATLABKernel(ipykernel.kernelbase.Kernel):
 
     # Helper functions
 
+    def _register_completion_request(self, msg):
+        """
+        Registers a shell message with the completion scheduler if it is a
+        completion request.
+
+        Args:
+            msg (list): Serialized shell message, as received by shell_main.
+
+        Returns:
+            str: ID of the completion request, or None for other messages.
+        """
+        # The message is peeked without unpacking its content, which would record its
+        # signature and make ipykernel reject the message as a duplicate.
+        try:
+            _, frames = self.session.feed_identities(msg, copy=False)
+            request = self.session.deserialize(frames, content=False, copy=False)
+            if request["header"].get("msg_type") != "complete_request":
+                return None
+            content = self.session.unpack(request["content"])
+        except Exception:
+            return None
+
+        msg_id = request["header"]["msg_id"]
+        self.completion_scheduler.received(
+            msg_id, content["code"], content["cursor_pos"]
+        )
+        return msg_id
+
+    async def _fetch_execution_outputs(self, code):
+        """
+        Sends the code to MATLAB for execution and yields the outputs. When output
+        streaming is enabled, outputs are yielded while MATLAB is still executing,
+        otherwise they are yielded after the execution has finished.
+
+        Args:
+            code (str): MATLAB code to be executed.
+
+        Yields:
+            dict: The next output produced during the execution of code.
+        """
+        options = self._get_execution_options()
+        self._queue_display_id = None
+        # Figure IDs are reused by MATLAB across cells, so the display IDs of the
+        # figures of a cell are made unique to avoid updating the outputs of other cells.
+        self._figure_display_prefix = uuid.uuid4().hex
+        if self.stream_outputs:
+            async for output in self.mwi_comm_helper.stream_execution_request_to_matlab(
+                code, options, on_wait=self._display_queue_position
+            ):
+                for transformed_output in self._transform_output(output):
+                    yield transformed_output
+        else:
+            # Blocks until execution results are received from MATLAB.
+            outputs = await self.mwi_comm_helper.send_execution_request_to_matlab(
+                code, options, on_wait=self._display_queue_position
+            )
+            for output in outputs:
+                for transformed_output in self._transform_output(output):
+                    yield transformed_output
+
+    def _transform_output(self, output):
+        """
+        Transforms the raw outputs of the Live Editor API returned by MATLAB, when
+        raw outputs are enabled, into Jupyter outputs.
+
+        Args:
+            output (dict): Output returned by MATLAB.
+
+        Returns:
+            list: The outputs to display.
+        """
+        if not is_raw_outputs(output):
+            return [output]
+        return transform_raw_outputs(
+            output, defer_figures=self.defer_figures, logger=self.log
+        )
+
+    def _display_queue_position(self, ahead):
+        """
+        Shows the number of requests ahead of the cell while it waits for a MATLAB
+        shared with other kernels. The message is emptied once the cell is executed.
+
+        Args:
+            ahead (int): Number of requests ahead of the cell, or 0 once it is executed.
+        """
+        if self._queue_display_id is None:
+            if not ahead:
+                return
+            self._queue_display_id = uuid.uuid4().hex
+            msg_type = "display_data"
+        else:
+            msg_type = "update_display_data"
+
+        text = ""
+        if ahead:
+            text = f"Waiting for MATLAB behind {ahead} request(s) from other notebooks ...\n"
+        self.display_output(
+            {
+                "type": msg_type,
+                "content": {
+                    "data": {"text/plain": text},
+                    "metadata": {},
+                    "transient": {"display_id": self._queue_display_id},
+                },
+            }
+        )
+
+    def _register_comm_target(self, target_name, callback):
+        """
+        Registers a callback for the comms opened by the front-end with target_name.
+        Unlike the IPython kernel, the base kernel of ipykernel does not handle comms,
+        so the comm manager is created when the first target is registered.
+        """
+        if not hasattr(self, "comm_manager"):
+            self.comm_manager = CommManager(parent=self, kernel=self)
+            for msg_type in ("comm_open", "comm_msg", "comm_close"):
+                self.shell_handlers[msg_type] = getattr(self.comm_manager, msg_type)
+        self.comm_manager.register_target(target_name, callback)
+
+    def _get_execution_options(self):
+        """
+        Returns the options sent to MATLAB along with each execution request.
+
+        Returns:
+            dict: Execution options supported by jupyter.execute.
+        """
+        options = {}
+        if self.figure_spool is not None:
+            options["figureSpoolDir"] = str(self.figure_spool.spool_dir)
+        if self.defer_figures:
+            options["deferFigures"] = True
+        if self.convert_symbolic:
+            options["rawSymbolic"] = True
+        if self.raw_outputs:
+            options["rawOutputs"] = True
+        return options
+
     def display_output(self, out):
         """
         Common function to send execution outputs to Jupyter UI.
@@ -428,8 +835,56 @@ class BaseMATLABKernel(ipykernel.kernelbase.Kernel):
         Args:
             out (dict): A dictionary containing the type of output and the content of the output.
         """
+        if self.output_limiter is None:
+            self._emit_output(out)
+            return
+        for output in self.output_limiter.filter(out):
+            self._emit_output(output)
+
+    def _emit_output(self, out):
+        """Sends an output to Jupyter, through the output coalescer if it is enabled."""
+        if self.output_coalescer is not None:
+            self.output_coalescer.add(out)
+        else:
+            self._send_output(out)
+
+    def _send_output(self, out):
+        """Sends an output to Jupyter on the iopub channel."""
+        # Deferred figures update the placeholder displayed at their position.
+        display_id = out.get("displayId")
+        if display_id is not None:
+            display_id = f"{self._figure_display_prefix}-{display_id}"
+
+        # Symbolic outputs returned as MathML are displayed as LaTeX.
+        if out["type"] == "symbolic":
+            out = symbolic_output(out, self.log)
+        # Images of spooled figures are read and encoded only when they are displayed.
+        if is_spooled_figure(out):
+            out = self.figure_spool.load(out)
+        if self.figure_deduplicator is not None and is_figure(out):
+            out = self.figure_deduplicator.deduplicate(
+                out, self.execution_count, self._cell_id
+            )
+            if out is None:
+                if display_id is None:
+                    return
+                # The placeholder of a skipped deferred figure is emptied.
+                out = {
+                    "type": "execute_result",
+                    "mimetype": ["text/plain"],
+                    "value": [""],
+                }
+        figure_policy = self.cell_figure_policy or self.figure_policy
+        if figure_policy is not None and is_figure(out):
+            out = figure_policy.apply(out)
+        if self.figure_store is not None and is_figure(out):
+            out = self.figure_store.store(out)
+
         msg_type = out["type"]
         if msg_type == "execute_result":
+            # Only the first page of large text outputs is sent to Jupyter.
+            if self.output_pager is not None:
+                out = self.output_pager.paginate(out)
             assert len(out["mimetype"]) == len(out["value"])
             response = {
                 # Use zip to create a tuple of KV pair of mimetype and value.
@@ -437,6 +892,17 @@ class BaseMATLABKernel(ipykernel.kernelbase.Kernel):
                 "metadata": {},
                 "execution_count": self.execution_count,
             }
+            if display_id is not None:
+                msg_type = "update_display_data"
+                del response["execution_count"]
+                response["transient"] = {"display_id": display_id}
+        elif msg_type == "figure_placeholder":
+            msg_type = "display_data"
+            response = {
+                "data": {"text/plain": "Rendering figure ..."},
+                "metadata": {},
+                "transient": {"display_id": display_id},
+            }
         else:
             response = out["content"]
         self.send_response(self.iopub_socket, msg_type, response)
@@ -458,11 +924,8 @@ class BaseMATLABKernel(ipykernel.kernelbase.Kernel):
             self.log.error(f"Found a startup error: {self.startup_error}")
             raise self.startup_error
 
-        (
-            is_matlab_licensed,
-            matlab_status,
-            matlab_proxy_has_error,
-        ) = await self.mwi_comm_helper.fetch_matlab_proxy_status()
+        self._start_startup_monitor()
+        await self.startup_monitor.wait_for_status()
 
         # Display iframe containing matlab-proxy to show login window if MATLAB
         # is not licensed using matlab-proxy. The iframe is removed after MATLAB
@@ -472,23 +935,24 @@ class BaseMATLABKernel(ipykernel.kernelbase.Kernel):
         # as src for iframe to avoid hardcoding any hostname/domain information. This is done to
         # ensure the kernel works in Jupyter deployments. VS Code however does not work the same way
         # as other browser based Jupyter clients.
-        if not is_matlab_licensed:
+        if self.startup_monitor.state in (
+            startup_monitor.UNLICENSED,
+            startup_monitor.LICENSING,
+        ):
             if not jupyter_base_url:
                 # happens for non-jupyter environments (like VSCode), we expect licensing to
                 # be completed before hand
                 self.log.debug(
                     "MATLAB is not licensed and is in a non-jupyter environment. licensing via other means required."
                 )
-                raise MATLABConnectionError(
-                    """
+                raise MATLABConnectionError("""
                     Error: Cannot start MATLAB as no licensing information was found. 
                     Resolution: Set the environment variable MLM_LICENSE_FILE to provide a network license manager, 
                     or set MWI_USE_EXISTING_LICENSE to True if the installed MATLAB is already licensed. 
                     See https://github.com/mathworks/matlab-proxy/blob/main/Advanced-Usage.md for more information.
                     To use Online licensing, start a MATLAB Kernel in a Jupyter notebook and login using the web interface 
                     shown upon execution of any code.
-                    """
-                )
+                    """)
             self.log.debug(
                 "MATLAB is not licensed. Displaying HTML output to enable licensing."
             )
@@ -503,24 +967,13 @@ class BaseMATLABKernel(ipykernel.kernelbase.Kernel):
                     },
                 }
             )
+            self.startup_monitor.set_licensing()
 
         # Wait until MATLAB is started before sending requests.
-        await self.poll_for_matlab_startup(
-            is_matlab_licensed, matlab_status, matlab_proxy_has_error
-        )
+        await self.wait_for_matlab_startup()
 
-    async def poll_for_matlab_startup(
-        self, is_matlab_licensed, matlab_status, matlab_proxy_has_error
-    ):
-        """Wait until MATLAB has started or time has run out"
-
-        Args:
-        is_matlab_licensed (bool): A flag indicating whether MATLAB is
-            licensed and eligible to start.
-        matlab_status (str): A string representing the current status
-            of the MATLAB startup process.
-        matlab_proxy_has_error (bool): A flag indicating whether there
-            is an error in the MATLAB proxy process during startup.
+    async def wait_for_matlab_startup(self):
+        """Wait until MATLAB has started or time has run out
 
         Raises:
             MATLABConnectionError: If an error occurs while attempting to
@@ -528,49 +981,86 @@ class BaseMATLABKernel(ipykernel.kernelbase.Kernel):
             within the expected timeframe.
         """
         self.log.debug("Waiting until MATLAB is started")
-        timeout = 0
-        while (
-            matlab_status != "up"
-            and timeout != _MATLAB_STARTUP_TIMEOUT
-            and not matlab_proxy_has_error
-        ):
-            if is_matlab_licensed:
-                if timeout == 0:
-                    self.log.debug("Licensing completed. Clearing output area")
-                    self.display_output(
-                        {"type": "clear_output", "content": {"wait": False}}
-                    )
-                    self.display_output(
-                        {
-                            "type": "stream",
-                            "content": {
-                                "name": "stdout",
-                                "text": "Starting MATLAB ...\n",
-                            },
-                        }
-                    )
-                timeout += 1
-            time.sleep(1)
-            (
-                is_matlab_licensed,
-                matlab_status,
-                matlab_proxy_has_error,
-            ) = await self.mwi_comm_helper.fetch_matlab_proxy_status()
-
-        # If MATLAB is not available after 15 seconds of licensing information
-        # being available either through user input or through matlab-proxy cache,
-        # then display connection error to the user.
-        if timeout == _MATLAB_STARTUP_TIMEOUT:
-            self.log.error(
-                f"MATLAB has not started after {_MATLAB_STARTUP_TIMEOUT} seconds."
+        await self.startup_monitor.wait_until_licensed()
+
+        if self.startup_monitor.state == startup_monitor.STARTING:
+            self.log.debug("Licensing completed. Clearing output area")
+            self.display_output({"type": "clear_output", "content": {"wait": False}})
+            self.display_output(
+                {
+                    "type": "stream",
+                    "content": {
+                        "name": "stdout",
+                        "text": "Starting MATLAB ...\n",
+                    },
+                }
             )
-            raise MATLABConnectionError
 
-        if matlab_proxy_has_error:
-            self.log.error("matlab-proxy encountered error.")
-            raise MATLABConnectionError
+        await self.startup_monitor.wait_until_ready()
+        self.log.debug(
+            f"MATLAB is running after {self.startup_monitor.elapsed_time:.2f} seconds, startup checks completed."
+        )
 
-        self.log.debug("MATLAB is running, startup checks completed.")
+    def _start_startup_monitor(self, restart=False):
+        """
+        Follows the startup of the MATLAB assigned to this kernel in the background.
+
+        Args:
+            restart (bool, optional): Follow the startup again even if MATLAB was
+                found to be up. Defaults to False.
+        """
+        if self.mwi_comm_helper is None or self.startup_error is not None:
+            return
+        if restart or self.startup_monitor.state != startup_monitor.UP:
+            self.startup_monitor.start(self.mwi_comm_helper)
+            if self.warmup_enabled:
+                self._start_warmup()
+
+    def _start_warmup(self):
+        """Warms up MATLAB in the background, unless a warm-up is already pending."""
+        if self._warmup_task is None or self._warmup_task.done():
+            self._warmup_task = asyncio.ensure_future(self._warm_up_matlab())
+
+    async def _warm_up_matlab(self):
+        """
+        Executes a no-op cell, an optional preload script and optionally primes the
+        renderer of symbolic outputs once MATLAB is up. The time taken is logged and
+        stored in warmup_timings.
+        """
+        try:
+            await self.startup_monitor.wait_until_ready()
+        except Exception:
+            # Startup errors are displayed by the next execution request.
+            return
+
+        options = {
+            "preloadScript": mwi_env.get_warmup_preload_script(),
+            "primeSymbolic": mwi_env.is_warmup_symbolic_enabled(),
+        }
+        self.log.debug(f"Warming up MATLAB with options: {options}")
+        start_time = time.monotonic()
+        try:
+            timings = await self.mwi_comm_helper.send_warmup_request_to_matlab(
+                mwi_env.get_warmup_code(_DEFAULT_WARMUP_CODE), options
+            )
+        except Exception as e:
+            self.log.error(f"Exception occurred while warming up MATLAB:\n{e}")
+            return
+
+        if not isinstance(timings, dict):
+            self.log.error(f"Unable to warm up MATLAB:\n{timings}")
+            return
+
+        self.warmup_timings = dict(timings, total=time.monotonic() - start_time)
+        self.log.info(
+            "Warmed up MATLAB in %.2f seconds (execute: %.2f, preload: %.2f, symbolic: %.2f)",
+            self.warmup_timings["total"],
+            timings.get("execute", 0),
+            timings.get("preload", 0),
+            timings.get("symbolic", 0),
+        )
+        if timings.get("hasError"):
+            self.log.warning("An error occurred in MATLAB while warming up")
 
     def _extract_kernel_id_from_sys_args(self, args) -> str:
         """
@@ -0,0 +1,109 @@
+# Copyright 2025 The MathWorks, Inc.
+# Scheduling of tab completion requests sent to MATLAB
+
+import itertools
+
+from jupyter_matlab_kernel import mwi_logger
+
+_logger = mwi_logger.get()
+
+
+def _get_cell_key(code, cursor_pos):
+    """
+    Identifies the cell on which completion is requested. Jupyter does not send the
+    cell id along with completion requests, so the code outside of the line being
+    edited is used instead, as typing only modifies the line containing the cursor.
+
+    Args:
+        code (str): Code of the cell on which completion is requested.
+        cursor_pos (int): Position of the cursor in the code.
+
+    Returns:
+        tuple: Key which is equal for requests on the same line of the same cell.
+    """
+    line_start = code.rfind("\n", 0, cursor_pos) + 1
+    line_end = code.find("\n", cursor_pos)
+    if line_end == -1:
+        line_end = len(code)
+    return code[:line_start], code[line_end:]
+
+
+class CompletionScheduler:
+    """
+    Limits the number of completion requests sent to MATLAB, which is single-threaded
+    and possibly shared with other kernels.
+
+    ipykernel handles the shell messages of a kernel one at a time, so completion
+    requests sent while typing wait for the requests received before them. A request
+    is registered when it is received, before it waits for its turn, and is skipped
+    when its turn comes if a newer request for the same cell has been received in
+    the meantime. Jupyter only displays the results of the newest request anyway.
+
+    Skipped requests are answered with empty completion results by the caller.
+
+    Args:
+        logger (Logger, optional): Instance of Logger. Defaults to _logger.
+    """
+
+    def __init__(self, logger=_logger):
+        self.logger = logger
+        self._generations = itertools.count(1)
+
+        # Key and generation of each pending request, and generation of the newest
+        # request received for each cell.
+        self._pending = {}
+        self._latest = {}
+
+        self._counters = {"issued": 0, "superseded": 0}
+
+    @property
+    def counters(self):
+        """Number of requests sent to MATLAB and skipped because they were superseded."""
+        return dict(self._counters)
+
+    def received(self, msg_id, code, cursor_pos):
+        """
+        Registers a completion request when it is received.
+
+        Args:
+            msg_id (str): ID of the completion request message.
+            code (str): Code of the cell on which completion is requested.
+            cursor_pos (int): Position of the cursor in the code.
+        """
+        key = _get_cell_key(code, cursor_pos)
+        generation = next(self._generations)
+        self._pending[msg_id] = (key, generation)
+        self._latest[key] = generation
+
+    def handled(self, msg_id):
+        """
+        Unregisters a completion request once it has been answered.
+
+        Args:
+            msg_id (str): ID of the completion request message.
+        """
+        key, generation = self._pending.pop(msg_id, (None, None))
+        if key is not None and self._latest.get(key) == generation:
+            del self._latest[key]
+
+    def should_send(self, msg_id):
+        """
+        Checks if a completion request should be sent to MATLAB when its turn comes.
+
+        Args:
+            msg_id (str): ID of the completion request message.
+
+        Returns:
+            bool: False if a newer request for the same cell was received after this
+                  request, True otherwise, including for unregistered requests.
+        """
+        key, generation = self._pending.get(msg_id, (None, None))
+        if key is not None and self._latest.get(key) != generation:
+            self._count("superseded")
+            return False
+        self._count("issued")
+        return True
+
+    def _count(self, counter):
+        self._counters[counter] += 1
+        self.logger.debug(f"Completion requests: {self._counters}")
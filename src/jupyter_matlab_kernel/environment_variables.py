@@ -0,0 +1,346 @@
+# Copyright 2025 The MathWorks, Inc.
+"""This file lists and exposes the environment variables which are used by the MATLAB Kernel."""
+
+import os
+
+
+def _is_env_set_to_true(env_name: str) -> bool:
+    """Helper function that returns True if the environment variable specified is set to True.
+
+    Args:
+        env_name (str): Name of the environment variable to check the state for.
+
+    Returns:
+        bool: True if the value of the environment variable is a case insensitive match to the string "True"
+    """
+    return os.environ.get(env_name, "false").lower().strip() == "true"
+
+
+def _get_env_number(env_name: str, default: float) -> float:
+    """Helper function that returns the value of the environment variable specified as a number.
+
+    Args:
+        env_name (str): Name of the environment variable.
+        default (float): Value returned if the environment variable is not set or is not a number.
+
+    Returns:
+        float: The value of the environment variable, or default.
+    """
+    try:
+        return float(os.environ.get(env_name, default))
+    except ValueError:
+        return default
+
+
+def get_env_name_stream_outputs():
+    """Enables streaming of cell outputs while MATLAB is still executing the cell"""
+    return "MWI_JUPYTER_STREAM_OUTPUTS"
+
+
+def is_output_streaming_enabled() -> bool:
+    """Returns True if outputs should be streamed to Jupyter while MATLAB is executing"""
+    return _is_env_set_to_true(get_env_name_stream_outputs())
+
+
+def get_env_name_figure_spool():
+    """Enables the transport of figure images through files instead of the JSON response"""
+    return "MWI_JUPYTER_FIGURE_SPOOL"
+
+
+def is_figure_spool_enabled() -> bool:
+    """Returns True if MATLAB should write figure images to a spool folder of the kernel"""
+    return _is_env_set_to_true(get_env_name_figure_spool())
+
+
+def get_env_name_test_unix_socket():
+    """Specifies the Unix domain socket of the matlab-proxy server started by the tests"""
+    return "MWI_JUPYTER_TEST_UNIX_SOCKET"
+
+
+def get_env_name_json_codec():
+    """Specifies the JSON codec used to communicate with matlab-proxy: orjson, msgspec or json"""
+    return "MWI_JUPYTER_JSON_CODEC"
+
+
+def get_json_codec() -> str:
+    """Returns the name of the requested JSON codec, or an empty string to use the fastest available"""
+    return os.environ.get(get_env_name_json_codec(), "").lower().strip()
+
+
+def get_env_name_warmup():
+    """Enables the warm-up of MATLAB in the background before the first cell is executed"""
+    return "MWI_JUPYTER_WARMUP"
+
+
+def is_warmup_enabled() -> bool:
+    """Returns True if MATLAB should be warmed up as soon as it is available"""
+    return _is_env_set_to_true(get_env_name_warmup())
+
+
+def get_env_name_warmup_code():
+    """Specifies the no-op MATLAB code executed to warm up MATLAB"""
+    return "MWI_JUPYTER_WARMUP_CODE"
+
+
+def get_env_name_warmup_preload_script():
+    """Specifies the path of a MATLAB script executed while warming up MATLAB"""
+    return "MWI_JUPYTER_WARMUP_PRELOAD_SCRIPT"
+
+
+def get_env_name_warmup_symbolic():
+    """Enables loading the renderer for symbolic outputs while warming up MATLAB"""
+    return "MWI_JUPYTER_WARMUP_SYMBOLIC"
+
+
+def is_warmup_symbolic_enabled() -> bool:
+    """Returns True if the renderer for symbolic outputs should be loaded while warming up MATLAB"""
+    return _is_env_set_to_true(get_env_name_warmup_symbolic())
+
+
+def get_warmup_code(default: str) -> str:
+    """Returns the no-op MATLAB code executed to warm up MATLAB, or default if it is not set"""
+    return os.environ.get(get_env_name_warmup_code(), "").strip() or default
+
+
+def get_warmup_preload_script() -> str:
+    """Returns the path of the MATLAB script executed while warming up MATLAB, or an empty string"""
+    return os.environ.get(get_env_name_warmup_preload_script(), "").strip()
+
+
+def get_env_name_eager_matlab_assignment():
+    """Enables the assignment of a MATLAB to the kernel as soon as the kernel starts"""
+    return "MWI_JUPYTER_EAGER_MATLAB_ASSIGNMENT"
+
+
+def is_eager_matlab_assignment_enabled() -> bool:
+    """Returns True if the kernel should start matlab-proxy in the background when it starts"""
+    return _is_env_set_to_true(get_env_name_eager_matlab_assignment())
+
+
+def get_env_name_matlab_pool():
+    """Enables leasing isolated MATLAB sessions from a warm pool to the kernels of a Jupyter server"""
+    return "MWI_JUPYTER_MATLAB_POOL"
+
+
+def is_matlab_pool_enabled() -> bool:
+    """Returns True if kernels should lease an isolated MATLAB session from the warm pool"""
+    return _is_env_set_to_true(get_env_name_matlab_pool())
+
+
+def get_env_name_matlab_pool_min_size():
+    """Specifies the number of idle MATLAB sessions which are kept ready in the pool"""
+    return "MWI_JUPYTER_MATLAB_POOL_MIN_SIZE"
+
+
+def get_env_name_matlab_pool_max_size():
+    """Specifies the maximum number of MATLAB sessions in the pool"""
+    return "MWI_JUPYTER_MATLAB_POOL_MAX_SIZE"
+
+
+def get_env_name_matlab_pool_idle_timeout():
+    """Specifies the time in seconds after which idle MATLAB sessions above the minimum size are shut down"""
+    return "MWI_JUPYTER_MATLAB_POOL_IDLE_TIMEOUT"
+
+
+def get_matlab_pool_options() -> dict:
+    """Returns the minimum size, maximum size and idle timeout of the MATLAB pool"""
+    return {
+        "min_size": int(_get_env_number(get_env_name_matlab_pool_min_size(), 1)),
+        "max_size": int(_get_env_number(get_env_name_matlab_pool_max_size(), 4)),
+        "idle_timeout": _get_env_number(get_env_name_matlab_pool_idle_timeout(), 600),
+    }
+
+
+def get_env_name_request_scheduling():
+    """Enables fair scheduling of the requests sent by the kernels which share a MATLAB"""
+    return "MWI_JUPYTER_REQUEST_SCHEDULING"
+
+
+def is_request_scheduling_enabled() -> bool:
+    """Returns True if requests should be queued and served fairly across kernels sharing a MATLAB"""
+    return _is_env_set_to_true(get_env_name_request_scheduling())
+
+
+def get_env_name_hibernate_after():
+    """Specifies the idle time in seconds after which the kernel saves the workspace and releases MATLAB"""
+    return "MWI_JUPYTER_HIBERNATE_AFTER"
+
+
+def get_hibernation_timeout() -> float:
+    """Returns the idle time in seconds after which MATLAB is released, or 0 if it is never released"""
+    return max(_get_env_number(get_env_name_hibernate_after(), 0), 0)
+
+
+def get_env_name_fast_restart():
+    """Enables keeping MATLAB running when the kernel is restarted"""
+    return "MWI_JUPYTER_FAST_RESTART"
+
+
+def is_fast_restart_enabled() -> bool:
+    """Returns True if a restarted kernel should attach to the MATLAB of the previous kernel process"""
+    return _is_env_set_to_true(get_env_name_fast_restart())
+
+
+def get_env_name_coalesce_outputs():
+    """Enables merging of adjacent stream outputs before they are sent to Jupyter"""
+    return "MWI_JUPYTER_COALESCE_OUTPUTS"
+
+
+def is_output_coalescing_enabled() -> bool:
+    """Returns True if adjacent stream outputs should be merged into fewer messages"""
+    return _is_env_set_to_true(get_env_name_coalesce_outputs())
+
+
+def get_env_name_coalesce_interval():
+    """Time in seconds for which stream outputs are held back to be merged"""
+    return "MWI_JUPYTER_COALESCE_INTERVAL"
+
+
+def get_coalesce_interval() -> float:
+    """Returns the time in seconds for which stream outputs are held back to be merged"""
+    return max(_get_env_number(get_env_name_coalesce_interval(), 0.05), 0)
+
+
+def get_env_name_output_limit():
+    """Enables flood control of the stream outputs of each cell"""
+    return "MWI_JUPYTER_OUTPUT_LIMIT"
+
+
+def is_output_limit_enabled() -> bool:
+    """Returns True if repeated lines should be collapsed and stream outputs limited for each cell"""
+    return _is_env_set_to_true(get_env_name_output_limit())
+
+
+def get_env_name_output_limit_bytes():
+    """Number of bytes of stream outputs displayed for each cell"""
+    return "MWI_JUPYTER_OUTPUT_LIMIT_BYTES"
+
+
+def get_env_name_output_limit_outputs():
+    """Number of stream outputs displayed for each cell"""
+    return "MWI_JUPYTER_OUTPUT_LIMIT_OUTPUTS"
+
+
+def get_env_name_output_limit_repeats():
+    """Number of identical consecutive lines or outputs displayed before they are collapsed"""
+    return "MWI_JUPYTER_OUTPUT_LIMIT_REPEATS"
+
+
+def get_env_name_output_spill_dir():
+    """Folder into which the full stream outputs of limited cells are written"""
+    return "MWI_JUPYTER_OUTPUT_SPILL_DIR"
+
+
+def get_output_limit_options() -> dict:
+    """Returns the budget of each cell and the spill folder used for flood control of outputs"""
+    return {
+        "max_bytes": int(_get_env_number(get_env_name_output_limit_bytes(), 1048576)),
+        "max_outputs": int(_get_env_number(get_env_name_output_limit_outputs(), 10000)),
+        "min_repeats": int(_get_env_number(get_env_name_output_limit_repeats(), 100)),
+        "spill_dir": os.environ.get(get_env_name_output_spill_dir()) or None,
+    }
+
+
+def get_env_name_page_outputs():
+    """Enables paging of large text outputs"""
+    return "MWI_JUPYTER_PAGE_OUTPUTS"
+
+
+def is_output_paging_enabled() -> bool:
+    """Returns True if only the first page of large text outputs should be sent to Jupyter"""
+    return _is_env_set_to_true(get_env_name_page_outputs())
+
+
+def get_env_name_output_page_size():
+    """Number of characters in a page of a paged text output"""
+    return "MWI_JUPYTER_OUTPUT_PAGE_SIZE"
+
+
+def get_output_page_size() -> int:
+    """Returns the number of characters in a page of a paged text output"""
+    return max(int(_get_env_number(get_env_name_output_page_size(), 20000)), 1)
+
+
+def get_env_name_figure_store():
+    """Enables storing figure images beside the notebook instead of embedding them"""
+    return "MWI_JUPYTER_FIGURE_STORE"
+
+
+def is_figure_store_enabled() -> bool:
+    """Returns True if figure images should be written to the figure store and referenced by notebooks"""
+    return _is_env_set_to_true(get_env_name_figure_store())
+
+
+def get_env_name_figure_store_dir():
+    """Folder of the figure store, relative to the notebook folder"""
+    return "MWI_JUPYTER_FIGURE_STORE_DIR"
+
+
+def get_figure_store_dir(default: str) -> str:
+    """Returns the folder of the figure store, relative to the notebook folder"""
+    return os.environ.get(get_env_name_figure_store_dir()) or default
+
+
+def get_env_name_defer_figures():
+    """Enables displaying figures after the other outputs of a cell, in placeholders"""
+    return "MWI_JUPYTER_DEFER_FIGURES"
+
+
+def is_figure_deferral_enabled() -> bool:
+    """Returns True if figures should be displayed in placeholders after the other outputs of a cell"""
+    return _is_env_set_to_true(get_env_name_defer_figures())
+
+
+def get_env_name_figure_policy():
+    """Specifies the format and resolution of the figure images sent to Jupyter"""
+    return "MWI_JUPYTER_FIGURE_POLICY"
+
+
+def get_figure_policy() -> str:
+    """Returns the figure policy, such as "format=auto, max_width=1200", or an empty string"""
+    return os.environ.get(get_env_name_figure_policy(), "").strip()
+
+
+def get_env_name_deduplicate_figures():
+    """Enables replacing figures identical to a recently displayed figure with a reference, or skipping them"""
+    return "MWI_JUPYTER_DEDUPLICATE_FIGURES"
+
+
+def get_env_name_figure_dedup_entries():
+    """Number of recently displayed figures remembered for deduplication"""
+    return "MWI_JUPYTER_FIGURE_DEDUP_ENTRIES"
+
+
+def get_figure_dedup_options() -> dict:
+    """Returns the options of figure deduplication, or None if it is disabled"""
+    mode = os.environ.get(get_env_name_deduplicate_figures(), "false").lower().strip()
+    if mode == "true":
+        mode = "reference"
+    if mode not in ("reference", "skip"):
+        return None
+    return {
+        "mode": mode,
+        "max_entries": max(
+            int(_get_env_number(get_env_name_figure_dedup_entries(), 64)), 1
+        ),
+    }
+
+
+def get_env_name_convert_symbolic():
+    """Enables converting the MathML of symbolic outputs to LaTeX in the kernel instead of MATLAB"""
+    return "MWI_JUPYTER_CONVERT_SYMBOLIC"
+
+
+def is_symbolic_conversion_enabled() -> bool:
+    """Returns True if MATLAB should return symbolic outputs as MathML, which the kernel converts to LaTeX"""
+    return _is_env_set_to_true(get_env_name_convert_symbolic())
+
+
+def get_env_name_raw_outputs():
+    """Enables transforming the outputs of the Live Editor API into Jupyter outputs in the kernel instead of MATLAB"""
+    return "MWI_JUPYTER_RAW_OUTPUTS"
+
+
+def is_raw_outputs_enabled() -> bool:
+    """Returns True if MATLAB should return the raw outputs of the Live Editor API, which the kernel transforms"""
+    return _is_env_set_to_true(get_env_name_raw_outputs())
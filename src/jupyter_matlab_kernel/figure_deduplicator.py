@@ -0,0 +1,135 @@
+# Copyright 2025 The MathWorks, Inc.
+# Deduplication of the identical figures displayed during a kernel session
+
+import hashlib
+import html
+from collections import OrderedDict
+
+from jupyter_matlab_kernel import mwi_logger
+
+_logger = mwi_logger.get()
+
+# Ways to send a figure identical to a figure displayed recently:
+#   reference - A short note which references the output that displays the figure.
+#   skip      - Nothing.
+MODES = ("reference", "skip")
+
+# Default number of figures remembered by the deduplicator
+_MAX_ENTRIES = 64
+
+
+class FigureDeduplicator:
+    """
+    Avoids sending the same image to Jupyter again, when a cell displays identical
+    figures in a loop, or a figure identical to the figure of another cell.
+
+    1. The hashes of the images of the most recently displayed figures are kept in
+       a bounded LRU, along with the execution count and the ID of their cell.
+    2. A figure whose image matches one of these figures is a hit, and is replaced
+       by a reference to the output which displays the image, or skipped.
+    3. Figures displayed by an earlier execution of a cell are forgotten when the
+       cell is executed again, since Jupyter clears its outputs. Without the ID of
+       the cell, only figures of the same execution are hits.
+
+    Args:
+        mode (str, optional): One of MODES. Defaults to "reference".
+        max_entries (int, optional): Number of figures remembered. Defaults to _MAX_ENTRIES.
+        logger (Logger, optional): Instance of Logger. Defaults to _logger.
+    """
+
+    def __init__(self, mode="reference", max_entries=_MAX_ENTRIES, logger=_logger):
+        if mode not in MODES:
+            raise ValueError(f"Unknown deduplication mode: {mode}. Use one of {MODES}")
+        self.mode = mode
+        self.max_entries = max_entries
+        self.logger = logger
+
+        # Execution count and cell ID of each figure, from the least to the most
+        # recently displayed.
+        self._figures = OrderedDict()
+        self._counters = {"hits": 0, "misses": 0, "evictions": 0, "bytes_saved": 0}
+
+    @property
+    def counters(self):
+        """Number of figures found and not found in the LRU, figures evicted from it, and bytes not sent."""
+        return dict(self._counters)
+
+    def start_cell(self, cell_id):
+        """
+        Forgets the figures displayed by the earlier executions of a cell, whose
+        outputs Jupyter clears when the cell is executed again.
+
+        Args:
+            cell_id (str): ID of the cell being executed, or None if the front-end
+                does not send it.
+        """
+        if cell_id is None:
+            return
+        for key in [
+            key
+            for key, (_, figure_cell_id) in self._figures.items()
+            if figure_cell_id == cell_id
+        ]:
+            del self._figures[key]
+
+    def deduplicate(self, output, execution_count, cell_id=None):
+        """
+        Checks if a figure is identical to a figure displayed recently.
+
+        Args:
+            output (dict): Figure output containing a single base64 encoded image.
+            execution_count (int): Execution count of the cell which displays the figure.
+            cell_id (str, optional): ID of the cell which displays the figure, if the
+                front-end sends it. Defaults to None.
+
+        Returns:
+            dict: The output to send, which is output itself if the figure was not
+                displayed recently, or None if the figure is skipped.
+        """
+        encoded = output["value"][0]
+        key = hashlib.sha256(encoded.encode("ascii")).hexdigest()
+        previous = self._figures.get(key)
+        self._figures[key] = (execution_count, cell_id)
+        self._figures.move_to_end(key)
+
+        if previous is None or not self._is_displayed(
+            previous, execution_count, cell_id
+        ):
+            self._counters["misses"] += 1
+            while len(self._figures) > self.max_entries:
+                self._figures.popitem(last=False)
+                self._counters["evictions"] += 1
+            return output
+
+        self._counters["hits"] += 1
+        self._counters["bytes_saved"] += len(encoded)
+        # The figure stays referenced by the output which first displayed it.
+        self._figures[key] = previous
+        self.logger.debug(
+            f"Figure identical to the figure displayed by [{previous[0]}], counters: {self._counters}"
+        )
+        if self.mode == "skip":
+            return None
+
+        if previous[0] == execution_count:
+            note = "Identical to the figure displayed above."
+        else:
+            note = f"Identical to the figure displayed by Out [{previous[0]}]."
+        return {
+            "type": "execute_result",
+            "mimetype": ["text/plain", "text/html"],
+            "value": [f"<MATLAB figure: {note}>", f"<i>{html.escape(note)}</i>"],
+        }
+
+    # Helper functions
+
+    def _is_displayed(self, previous, execution_count, cell_id):
+        """Checks if a figure displayed earlier is still displayed by the notebook."""
+        previous_count, previous_cell_id = previous
+        if previous_count == execution_count:
+            return True
+        return (
+            previous_cell_id is not None
+            and cell_id is not None
+            and previous_cell_id != cell_id
+        )
@@ -0,0 +1,261 @@
+# Copyright 2025 The MathWorks, Inc.
+# Policy for the format and resolution of the figure images sent to Jupyter
+
+import base64
+import io
+import re
+
+from jupyter_matlab_kernel import mwi_logger
+
+_logger = mwi_logger.get()
+
+# Formats of the images sent to Jupyter:
+#   original - The image produced by MATLAB is sent unchanged.
+#   png      - The image is sent as a PNG image, compressed at the highest level.
+#   jpeg     - The image is sent as a JPEG image.
+#   auto     - Simple images, such as line plots, which have few colors, are sent as
+#              PNG images with a palette, which are lossless unless the images are
+#              downscaled. Other images, such as surface plots, are sent as JPEG images.
+FORMATS = ("original", "png", "jpeg", "auto")
+
+_MIMETYPES = {"png": "image/png", "jpeg": "image/jpeg"}
+
+# Options of a policy and the function which parses their values
+_OPTIONS = {
+    "format": str,
+    "max_width": int,
+    "max_height": int,
+    "max_colors": int,
+    "jpeg_quality": int,
+    "min_size": int,
+}
+
+
+def _load_pillow():
+    from PIL import Image
+
+    return Image
+
+
+class FigurePolicy:
+    """
+    Chooses the format, resolution and compression of the figure images sent to
+    Jupyter. MATLAB renders figures as PNG images at the resolution of the Live
+    Editor, which are often larger than needed to be displayed in a notebook.
+
+    1. Images wider than max_width or higher than max_height are downscaled,
+       keeping their aspect ratio.
+    2. Images are converted to the format of the policy. With the "auto" format,
+       images with at most max_colors colors are considered simple and are sent
+       as PNG images with a palette, and other images as JPEG images.
+    3. Images smaller than min_size bytes, which are cheap to send, are not
+       processed, and an image is never replaced by a larger image unless it was
+       downscaled.
+
+    Policies are written as a list of options, separated by commas or spaces:
+
+        format=auto, max_width=1200, max_height=900
+
+    Processing images requires Pillow. Without Pillow, images are sent unchanged.
+
+    Args:
+        format (str, optional): One of FORMATS. Defaults to "original".
+        max_width (int, optional): Maximum width of images in pixels. Defaults to None.
+        max_height (int, optional): Maximum height of images in pixels. Defaults to None.
+        max_colors (int, optional): Maximum number of colors of simple images, at most
+            256. Defaults to 256.
+        jpeg_quality (int, optional): Quality of JPEG images, from 1 to 95. Defaults to 85.
+        min_size (int, optional): Size in bytes under which images are not processed.
+            Defaults to 0.
+        logger (Logger, optional): Instance of Logger. Defaults to _logger.
+    """
+
+    def __init__(
+        self,
+        format="original",
+        max_width=None,
+        max_height=None,
+        max_colors=256,
+        jpeg_quality=85,
+        min_size=0,
+        logger=_logger,
+    ):
+        if format not in FORMATS:
+            raise ValueError(f"Unknown figure format: {format}. Use one of {FORMATS}")
+        for name, value in (("max_width", max_width), ("max_height", max_height)):
+            if value is not None and value < 1:
+                raise ValueError(f"{name} must be a positive number of pixels")
+        if not 1 <= max_colors <= 256:
+            raise ValueError("max_colors must be between 1 and 256")
+        if not 1 <= jpeg_quality <= 95:
+            raise ValueError("jpeg_quality must be between 1 and 95")
+
+        self.format = format
+        self.max_width = max_width
+        self.max_height = max_height
+        self.max_colors = max_colors
+        self.jpeg_quality = jpeg_quality
+        self.min_size = min_size
+        self.logger = logger
+        self._warned_no_pillow = False
+        self._counters = {"figures": 0, "processed": 0, "bytes_in": 0, "bytes_out": 0}
+
+    @classmethod
+    def parse(cls, spec, logger=_logger):
+        """
+        Creates a policy from its written form.
+
+        Args:
+            spec (str): Options of the policy, such as "format=auto, max_width=1200".
+                An empty string gives the default policy.
+            logger (Logger, optional): Instance of Logger. Defaults to _logger.
+
+        Raises:
+            ValueError: If an option is unknown or its value is invalid.
+
+        Returns:
+            FigurePolicy: The policy.
+        """
+        options = {}
+        for item in re.split(r"[,\s]+", spec.strip()):
+            if not item:
+                continue
+            name, sep, value = item.partition("=")
+            if not sep or name not in _OPTIONS:
+                raise ValueError(
+                    f"Invalid figure policy option: {item}. "
+                    f"Use <option>=<value> with one of {list(_OPTIONS)}"
+                )
+            try:
+                options[name] = _OPTIONS[name](value)
+            except ValueError:
+                raise ValueError(
+                    f"Invalid value for figure policy option {name}: {value}"
+                )
+        return cls(**options, logger=logger)
+
+    @property
+    def is_original(self):
+        """True if the policy sends images unchanged."""
+        return (
+            self.format == "original"
+            and self.max_width is None
+            and self.max_height is None
+        )
+
+    @property
+    def counters(self):
+        """Number of figures received and processed, and their size in bytes before and after processing."""
+        return dict(self._counters)
+
+    def apply(self, output):
+        """
+        Applies the policy to the image of a figure.
+
+        Args:
+            output (dict): Figure output containing a single base64 encoded image.
+
+        Returns:
+            dict: The output with the image to send to Jupyter, which is output itself
+                if the image is not processed or cannot be decoded.
+        """
+        self._counters["figures"] += 1
+        mimetype = output["mimetype"][0]
+        encoded = output["value"][0]
+        size = len(encoded) * 3 // 4
+        self._counters["bytes_in"] += size
+        if (
+            self.is_original
+            or mimetype not in _MIMETYPES.values()
+            or size < self.min_size
+        ):
+            self._counters["bytes_out"] += size
+            return output
+
+        try:
+            Image = _load_pillow()
+        except ImportError:
+            if not self._warned_no_pillow:
+                self.logger.warning(
+                    "Pillow is not installed, figures are sent unchanged. "
+                    "Install Pillow to apply the figure policy."
+                )
+                self._warned_no_pillow = True
+            self._counters["bytes_out"] += size
+            return output
+
+        try:
+            original = base64.b64decode(encoded)
+            image = Image.open(io.BytesIO(original))
+            image.load()
+            resized = self._resize(image, Image)
+            candidates = self._encode(image, resized, mimetype, Image)
+        except (OSError, ValueError, Image.DecompressionBombError) as e:
+            # Images which Pillow cannot decode, including PIL.UnidentifiedImageError,
+            # are sent unchanged rather than failing the output of the cell.
+            self.logger.warning(
+                f"Unable to apply the figure policy, figure sent unchanged: {e}"
+            )
+            self._counters["bytes_out"] += size
+            return output
+        if resized is image:
+            # An image which was not downscaled is never replaced by a larger one.
+            candidates.append((mimetype, original))
+        mimetype, data = min(candidates, key=lambda candidate: len(candidate[1]))
+
+        self._counters["processed"] += 1
+        self._counters["bytes_out"] += len(data)
+        self.logger.debug(
+            f"Figure of {image.width}x{image.height} pixels and {size} bytes sent as "
+            f"{mimetype} of {resized.width}x{resized.height} pixels and {len(data)} bytes"
+        )
+        return {
+            **output,
+            "mimetype": [mimetype],
+            "value": [base64.b64encode(data).decode("ascii")],
+        }
+
+    # Helper functions
+
+    def _resize(self, image, Image):
+        """Downscales the image to fit into the maximum width and height."""
+        width = min(image.width, self.max_width or image.width)
+        height = min(image.height, self.max_height or image.height)
+        scale = min(width / image.width, height / image.height)
+        if scale >= 1:
+            return image
+        size = (max(round(image.width * scale), 1), max(round(image.height * scale), 1))
+        return image.resize(size, Image.Resampling.LANCZOS)
+
+    def _encode(self, image, resized, mimetype, Image):
+        """Returns the candidate encodings of the resized image for the format of the policy."""
+        if self.format == "original":
+            # Only downscaled images are processed, and keep the format of MATLAB.
+            format = next(key for key, value in _MIMETYPES.items() if value == mimetype)
+            return [(mimetype, self._save(resized, format))]
+        if self.format in _MIMETYPES:
+            return [(_MIMETYPES[self.format], self._save(resized, self.format))]
+
+        # The "auto" format. Simple images are recognized before they are downscaled,
+        # which blends their colors, and are sent as PNG images with a palette.
+        colors = image.convert("RGB").getcolors(self.max_colors)
+        if colors is not None:
+            # Downscaling blends the edges of lines and text, which need a few shades
+            # of each color rather than a full palette.
+            palette = resized.convert("RGB").quantize(
+                colors=min(self.max_colors, 4 * len(colors)),
+                method=Image.Quantize.FASTOCTREE,
+            )
+            return [("image/png", self._save(palette, "png"))]
+        return [("image/jpeg", self._save(resized, "jpeg"))]
+
+    def _save(self, image, format):
+        """Encodes the image as a PNG or JPEG image."""
+        buffer = io.BytesIO()
+        if format == "jpeg":
+            image.convert("RGB").save(
+                buffer, "JPEG", quality=self.jpeg_quality, optimize=True
+            )
+        else:
+            image.save(buffer, "PNG", optimize=True)
+        return buffer.getvalue()
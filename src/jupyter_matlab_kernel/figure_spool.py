@@ -0,0 +1,100 @@
+# Copyright 2025 The MathWorks, Inc.
+# Out-of-band transport for figure images written by MATLAB to a spool folder
+
+import base64
+import mmap
+import shutil
+import tempfile
+from pathlib import Path
+
+from jupyter_matlab_kernel import mwi_logger
+
+_logger = mwi_logger.get()
+
+
+def is_spooled_figure(output):
+    """
+    Checks if an output returned by MATLAB refers to a figure image in the spool folder.
+
+    Args:
+        output (dict): Output returned by MATLAB.
+
+    Returns:
+        bool: True if the image data of the output is stored in a file.
+    """
+    return isinstance(output, dict) and "spooledFigure" in output
+
+
+def read_spooled_figure(reference):
+    """
+    Reads the image of a spooled figure and returns its encoded value for Jupyter.
+    The file is memory-mapped so that the bytes are encoded without an intermediate copy.
+
+    Args:
+        reference (dict): Reference to the spooled figure containing "path" and "size".
+
+    Returns:
+        bytes: Image data encoded using base64.
+    """
+    with open(reference["path"], "rb") as f:
+        if reference.get("size", 1) == 0:
+            return b""
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as image:
+            return base64.b64encode(image)
+
+
+class FigureSpool:
+    """
+    Manages the spool folder into which MATLAB writes the images of figures
+    produced by this kernel. Only a reference to the image is returned in the
+    response to the execution request, and the image is read and encoded once,
+    when the output is sent to Jupyter.
+
+    Args:
+        kernel_id (str): Unique identifier corresponding to the Jupyter kernel instance.
+        logger (Logger, optional): Instance of Logger. Defaults to _logger.
+    """
+
+    def __init__(self, kernel_id, logger=_logger):
+        self.logger = logger
+        self.spool_dir = Path(
+            tempfile.mkdtemp(prefix=f"jupyter_matlab_kernel_figures_{kernel_id}_")
+        )
+        self.logger.debug(f"Created figure spool folder: {self.spool_dir}")
+
+    def load(self, output):
+        """
+        Replaces the reference to a spooled figure in an output with the image data.
+        The image file is deleted once it is read.
+
+        Args:
+            output (dict): Output returned by MATLAB containing a spooled figure.
+
+        Returns:
+            dict: Output with the base64 encoded image, as returned by MATLAB when
+                  the spool folder is not used.
+        """
+        reference = output["spooledFigure"]
+        mimetype = output["mimetype"][0]
+        path = Path(reference["path"])
+
+        # Only read files from the spool folder of this kernel
+        if path.parent.resolve() != self.spool_dir.resolve():
+            raise ValueError(f"Spooled figure is outside the spool folder: {path}")
+
+        encoded_image = read_spooled_figure(reference)
+        try:
+            path.unlink()
+        except OSError as e:
+            self.logger.debug(f"Unable to delete spooled figure {path}: {e}")
+
+        return {
+            "type": output["type"],
+            "mimetype": [mimetype],
+            "value": [encoded_image.decode("ascii")],
+        }
+
+    def cleanup(self):
+        """Deletes the spool folder along with any figures which were not displayed."""
+        self.logger.debug(f"Deleting figure spool folder: {self.spool_dir}")
+        shutil.rmtree(self.spool_dir, ignore_errors=True)
@@ -0,0 +1,164 @@
+# Copyright 2025 The MathWorks, Inc.
+# Content-addressed store for figure images, which are referenced by notebooks instead of embedded
+
+import base64
+import hashlib
+import html
+import os
+import re
+import tempfile
+import time
+from pathlib import Path
+
+from jupyter_matlab_kernel import mwi_logger
+
+_logger = mwi_logger.get()
+
+# Default folder of the store, relative to the folder of the notebook
+DEFAULT_STORE_DIR = "matlab_figures"
+
+# Age (in seconds) under which images are never collected, so that images displayed
+# in a notebook which was not saved yet are kept.
+_GC_MIN_AGE = 24 * 60 * 60
+
+_EXTENSIONS = {
+    "image/png": ".png",
+    "image/jpeg": ".jpg",
+    "image/gif": ".gif",
+    "image/svg+xml": ".svg",
+}
+
+_IMAGE_NAME_PATTERN = re.compile(r"[0-9a-f]{64}\.[a-z]+")
+
+
+def is_figure(output):
+    """
+    Checks if an output returned by MATLAB is a figure image encoded using base64.
+
+    Args:
+        output (dict): Output returned by MATLAB.
+
+    Returns:
+        bool: True if the output contains a single image which can be stored.
+    """
+    return (
+        isinstance(output, dict)
+        and output.get("type") == "execute_result"
+        and len(output.get("mimetype", [])) == 1
+        and output["mimetype"][0] in _EXTENSIONS
+    )
+
+
+class FigureStore:
+    """
+    Keeps figure images out of notebooks. Each image is written once to a folder
+    beside the notebook, under a name derived from a hash of its content, and the
+    output displayed in the notebook only references the image by its path. Jupyter
+    serves the image from this path when the output is displayed.
+
+    Identical figures, across cells and executions, are stored once. Images which
+    are no longer referenced by any notebook in the folder of the store are removed
+    by collect_garbage.
+
+    Args:
+        store_dir (str, optional): Folder of the store, relative to the notebook folder
+            in which the kernel is started. Defaults to DEFAULT_STORE_DIR.
+        notebook_dir (str, optional): Folder of the notebook. Defaults to the current
+            working directory, in which Jupyter starts the kernel.
+        logger (Logger, optional): Instance of Logger. Defaults to _logger.
+    """
+
+    def __init__(self, store_dir=DEFAULT_STORE_DIR, notebook_dir=None, logger=_logger):
+        self.logger = logger
+        self.notebook_dir = Path(notebook_dir or os.getcwd())
+        self.store_dir = self.notebook_dir / store_dir
+        self._counters = {"stored": 0, "deduplicated": 0, "bytes_written": 0}
+
+    @property
+    def counters(self):
+        """Number of images stored, images which were already in the store, and bytes written."""
+        return dict(self._counters)
+
+    def store(self, output):
+        """
+        Writes the image of a figure to the store, unless it is already there.
+
+        Args:
+            output (dict): Figure output, as returned by MATLAB.
+
+        Returns:
+            dict: Output which references the stored image instead of embedding it.
+        """
+        mimetype = output["mimetype"][0]
+        image = base64.b64decode(output["value"][0])
+        name = hashlib.sha256(image).hexdigest() + _EXTENSIONS[mimetype]
+        path = self.store_dir / name
+
+        if path.exists():
+            # Refresh the modification time, so that the image is not collected
+            # before the notebook which now references it is saved.
+            path.touch()
+            self._counters["deduplicated"] += 1
+        else:
+            self.store_dir.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.store_dir, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(image)
+            os.replace(tmp_path, path)
+            self._counters["stored"] += 1
+            self._counters["bytes_written"] += len(image)
+            self.logger.debug(f"Stored figure of {len(image)} bytes in {path}")
+
+        url = Path(os.path.relpath(path, self.notebook_dir)).as_posix()
+        return {
+            "type": "execute_result",
+            "mimetype": ["text/html", "text/plain"],
+            "value": [
+                f'<img src="{html.escape(url)}" alt="MATLAB figure"/>',
+                f"<MATLAB figure: {url}>",
+            ],
+        }
+
+    def collect_garbage(self, min_age=_GC_MIN_AGE):
+        """
+        Removes the images which are not referenced by any notebook in the notebook
+        folder or its subfolders, including the checkpoints of the notebooks.
+
+        Args:
+            min_age (float, optional): Images modified more recently than this number
+                of seconds are kept. Defaults to _GC_MIN_AGE.
+
+        Returns:
+            dict: Number of images kept and removed, and number of bytes freed.
+        """
+        result = {"kept": 0, "removed": 0, "freed_bytes": 0}
+        if not self.store_dir.is_dir():
+            return result
+
+        referenced = set()
+        for notebook in self.notebook_dir.rglob("*.ipynb"):
+            try:
+                referenced.update(
+                    _IMAGE_NAME_PATTERN.findall(
+                        notebook.read_text(encoding="utf-8", errors="ignore")
+                    )
+                )
+            except OSError as e:
+                self.logger.debug(f"Unable to read notebook {notebook}: {e}")
+
+        now = time.time()
+        for path in self.store_dir.iterdir():
+            if not _IMAGE_NAME_PATTERN.fullmatch(path.name):
+                continue
+            stat = path.stat()
+            if path.name in referenced or now - stat.st_mtime < min_age:
+                result["kept"] += 1
+                continue
+            path.unlink()
+            result["removed"] += 1
+            result["freed_bytes"] += stat.st_size
+
+        self.logger.debug(
+            f"Collected unreferenced figures in {self.store_dir}: {result}"
+        )
+        return result
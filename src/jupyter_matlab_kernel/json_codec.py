@@ -0,0 +1,116 @@
+# Copyright 2025 The MathWorks, Inc.
+# JSON codec used for the requests sent to and the responses received from matlab-proxy
+
+import json
+from collections import namedtuple
+
+from jupyter_matlab_kernel import environment_variables as mwi_env
+from jupyter_matlab_kernel import mwi_logger
+
+_logger = mwi_logger.get()
+
+JSONCodec = namedtuple("JSONCodec", ["name", "loads", "dumps"])
+
+
+def _stdlib_loads(data):
+    # The stdlib decoder accepts bytes, but not other buffers such as memoryview.
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    return json.loads(data)
+
+
+def _stdlib_dumps(obj):
+    return json.dumps(obj).encode("utf-8")
+
+
+def _get_orjson_codec():
+    import orjson
+
+    return JSONCodec("orjson", orjson.loads, orjson.dumps)
+
+
+def _get_msgspec_codec():
+    import msgspec
+
+    decoder = msgspec.json.Decoder()
+    encoder = msgspec.json.Encoder()
+    return JSONCodec("msgspec", decoder.decode, encoder.encode)
+
+
+def _get_stdlib_codec():
+    return JSONCodec("json", _stdlib_loads, _stdlib_dumps)
+
+
+# Codecs in the order of preference
+_CODEC_FACTORIES = {
+    "orjson": _get_orjson_codec,
+    "msgspec": _get_msgspec_codec,
+    "json": _get_stdlib_codec,
+}
+
+
+def get_codec(name=None, logger=_logger):
+    """
+    Returns a JSON codec. Codecs decode directly from bytes or any other buffer, and
+    encode to bytes, so that responses are not copied into an intermediate str.
+
+    Args:
+        name (str, optional): One of "orjson", "msgspec" or "json". Defaults to the
+            fastest codec which is installed.
+        logger (Logger, optional): Instance of Logger. Defaults to _logger.
+
+    Returns:
+        JSONCodec: The codec, which falls back to the json module of the standard
+                   library if the requested codec is not installed.
+    """
+    if name:
+        if name not in _CODEC_FACTORIES:
+            logger.warning(f"Unknown JSON codec: {name}, using the fastest available")
+        else:
+            try:
+                return _CODEC_FACTORIES[name]()
+            except ImportError:
+                logger.warning(f"JSON codec {name} is not installed")
+
+    for factory in _CODEC_FACTORIES.values():
+        try:
+            return factory()
+        except ImportError:
+            pass
+
+
+_codec = None
+
+
+def _get_default_codec():
+    global _codec
+    if _codec is None:
+        _codec = get_codec(mwi_env.get_json_codec())
+        _logger.debug(f"Using JSON codec: {_codec.name}")
+    return _codec
+
+
+def loads(data):
+    """
+    Decodes JSON using the codec selected for the kernel.
+
+    Args:
+        data (bytes | bytearray | memoryview | str): The encoded JSON.
+
+    Returns:
+        Any: The decoded value.
+    """
+    return _get_default_codec().loads(data)
+
+
+def dumps(obj):
+    """
+    Encodes a value as JSON using the codec selected for the kernel.
+
+    Args:
+        obj (Any): The value to encode.
+
+    Returns:
+        bytes: The UTF-8 encoded JSON.
+    """
+    return _get_default_codec().dumps(obj)
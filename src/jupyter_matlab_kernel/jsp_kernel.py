@@ -1,4 +1,4 @@
-# Copyright 2024 The MathWorks, Inc.
+# Copyright 2024-2025 The MathWorks, Inc.
 
 """This module contains derived class implementation of MATLABKernel that uses
 Jupyter Server to manage interactions with matlab-proxy & MATLAB.
@@ -178,7 +178,13 @@ class MATLABKernelUsingJSP(base.BaseMATLABKernel):
             shell_loop = asyncio.get_event_loop()
             control_loop = self.control_thread.io_loop.asyncio_loop
             self.mwi_comm_helper = MWICommHelper(
-                self.kernel_id, murl, shell_loop, control_loop, headers, self.log
+                self.kernel_id,
+                murl,
+                shell_loop,
+                control_loop,
+                headers,
+                self.log,
+                unix_socket=test_utils.get_unix_socket_for_testing(),
             )
             shell_loop.run_until_complete(self.mwi_comm_helper.connect())
         except MATLABConnectionError as err:
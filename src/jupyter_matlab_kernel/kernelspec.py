@@ -11,10 +11,13 @@ from datetime import datetime
 
 from jupyter_client import kernelspec
 
+from jupyter_matlab_kernel import environment_variables as mwi_env
+from jupyter_matlab_kernel.figure_policy import FigurePolicy
+
 STANDARD_PYTHON_EXECUTABLE = "python3"
 
 
-def get_kernel_spec(executable=None) -> dict:
+def get_kernel_spec(executable=None, figure_policy=None) -> dict:
     """
     Generate and return the kernelspec JSON for the MATLAB Kernel.
 
@@ -28,6 +31,8 @@ def get_kernel_spec(executable=None) -> dict:
 
     Args:
         executable (str, optional): The Python executable to use. Defaults to python3.
+        figure_policy (str, optional): The figure policy of the kernels started from the
+            kernelspec, such as "format=auto, max_width=1200". Defaults to None.
 
     Returns:
         dict: A dictionary containing the kernelspec configuration for the MATLAB Kernel.
@@ -35,6 +40,10 @@ def get_kernel_spec(executable=None) -> dict:
     if not executable:
         executable = STANDARD_PYTHON_EXECUTABLE
 
+    env = {}
+    if figure_policy:
+        env[mwi_env.get_env_name_figure_policy()] = figure_policy
+
     copyright_start_year = 2023
     copyright_end_year = datetime.now().year
 
@@ -49,7 +58,7 @@ def get_kernel_spec(executable=None) -> dict:
         "display_name": "MATLAB Kernel",
         "language": "matlab",
         "interrupt_mode": "message",
-        "env": {},
+        "env": env,
         "metadata": {
             "debugger": False,
             "copyright": f"Copyright {copyright_start_year}-{copyright_end_year} The MathWorks, Inc.",
@@ -60,7 +69,11 @@ def get_kernel_spec(executable=None) -> dict:
 
 
 def install_kernel_spec(
-    kernel_name: str, executable: str, kernelspec_dir, register_with_jupyter=True
+    kernel_name: str,
+    executable: str,
+    kernelspec_dir,
+    register_with_jupyter=True,
+    figure_policy=None,
 ):
     """
     Install the MATLAB Kernel kernelspec to the specified directory.
@@ -71,11 +84,12 @@ def install_kernel_spec(
         kernelspec_dir (Path | str): The directory to install the kernelspec.
         register_with_jupyter (bool): Whether to register the kernelspec with Jupyter. Defaults to True. If True,
                                       the kernelspec will be installed to <prefix>/share/jupyter/kernels/<kernel_name>.
+        figure_policy (str, optional): The figure policy of the kernels started from the kernelspec. Defaults to None.
 
     Returns:
         tuple: A tuple containing the destination path of the installed kernelspec and the kernelspec dictionary.
     """
-    kernelspec_dict = get_kernel_spec(executable)
+    kernelspec_dict = get_kernel_spec(executable, figure_policy)
     kernel_json_path = pathlib.Path(kernelspec_dir) / "kernel.json"
 
     # Copy kernelspec resources to the target directory
@@ -104,6 +118,7 @@ def main():
 
     The function supports the following options:
         --reset: Reset the kernelspec to use the standard Python executable.
+        --figure-policy: Set the format and resolution of the figure images sent by the kernel.
 
     If no option is provided, it installs the kernelspec using the current Python executable.
 
@@ -125,8 +140,19 @@ def main():
         action="store_true",
         help="Preview the changes made to kernelspec",
     )
+    parser.add_argument(
+        "--figure-policy",
+        metavar="POLICY",
+        help='Format and resolution of the figure images sent by the kernel, such as "format=auto, max_width=1200"',
+    )
     args = parser.parse_args()
 
+    if args.figure_policy:
+        try:
+            FigurePolicy.parse(args.figure_policy)
+        except ValueError as e:
+            parser.error(str(e))
+
     kernel_name = str(pathlib.Path(__file__).parent.name)
     if args.reset:
         executable = STANDARD_PYTHON_EXECUTABLE
@@ -144,6 +170,7 @@ def main():
             executable=executable,
             kernelspec_dir=kernelspec_dir,
             register_with_jupyter=register_kernelspec_with_jupyter,
+            figure_policy=args.figure_policy,
         )
     except OSError as e:
         if e.errno == errno.EACCES:
@@ -0,0 +1,47 @@
+# Copyright 2025 The MathWorks, Inc.
+
+from jupyter_matlab_kernel.figure_policy import FORMATS, FigurePolicy
+from jupyter_matlab_kernel.magics.base.matlab_magic import MATLABMagic
+from jupyter_matlab_kernel.mwi_exceptions import MagicError
+
+
+class figure_policy(MATLABMagic):
+
+    info_about_magic = """Set the format and resolution of the figure images displayed by the cell, instead of the figure policy of the kernel set in MWI_JUPYTER_FIGURE_POLICY.
+Options:
+    format: original, png, jpeg or auto. With auto, simple figures such as line plots are sent as lossless PNG images with few colors, and other figures as JPEG images. Figures which are not downscaled keep their original image if it is smaller.
+    max_width, max_height: Maximum size of the images in pixels. Larger images are downscaled.
+    max_colors: Maximum number of colors of the simple figures of the auto format, up to 256.
+    jpeg_quality: Quality of JPEG images, from 1 to 95.
+    min_size: Size in bytes under which images are sent unchanged.
+Example:
+    %%figure_policy format=auto max_width=800
+Processing figures requires the Pillow package in the Python environment of the kernel."""
+
+    options = [
+        "format=",
+        "max_width=",
+        "max_height=",
+        "max_colors=",
+        "jpeg_quality=",
+        "min_size=",
+    ]
+
+    def before_cell_execute(self):
+        if len(self.parameters) == 0:
+            raise MagicError(
+                f"The figure_policy magic expects options as arguments, such as format=auto. Available options: {self.options}"
+            )
+        try:
+            policy = FigurePolicy.parse(" ".join(self.parameters), logger=self.logger)
+        except ValueError as e:
+            raise MagicError(str(e)) from e
+        yield {"type": "modify_kernel", "cell_figure_policy": policy}
+
+    def do_complete(self, parameters, parameter_pos, cursor_pos):
+        prefix = parameters[parameter_pos - 1][:cursor_pos]
+        if prefix.startswith("format="):
+            candidates = [f"format={format}" for format in FORMATS]
+        else:
+            candidates = self.options
+        return [option for option in candidates if option.startswith(prefix)]
@@ -0,0 +1,51 @@
+# Copyright 2025 The MathWorks, Inc.
+
+from jupyter_matlab_kernel import environment_variables as mwi_env
+from jupyter_matlab_kernel.figure_store import DEFAULT_STORE_DIR, FigureStore
+from jupyter_matlab_kernel.magics.base.matlab_magic import MATLABMagic
+from jupyter_matlab_kernel.mwi_exceptions import MagicError
+
+
+class figures(MATLABMagic):
+
+    info_about_magic = """Manage the figure store, the folder beside the notebook in which figure images are stored when MWI_JUPYTER_FIGURE_STORE is set to true.
+Example:
+    %%figures gc
+Remove the images in the figure store which are not referenced by any notebook in the notebook folder or its subfolders. Images modified in the last 24 hours are kept, so that the figures of notebooks which are not saved yet are not removed."""
+
+    skip_matlab_execution = True
+
+    commands = ["gc"]
+
+    def before_cell_execute(self):
+        if len(self.parameters) != 1 or self.parameters[0] not in self.commands:
+            raise MagicError(
+                f"The figures magic expects a single command as a argument: {self.commands}."
+            )
+        store = FigureStore(
+            mwi_env.get_figure_store_dir(DEFAULT_STORE_DIR), logger=self.logger
+        )
+        try:
+            result = store.collect_garbage()
+        except OSError as e:
+            raise MagicError(
+                f"An error occurred while removing images from the figure store '{store.store_dir}':\n{e}"
+            ) from e
+        output = (
+            f"Removed {result['removed']} unreferenced image(s) from the figure store, "
+            f"freeing {result['freed_bytes']} bytes. {result['kept']} image(s) were kept."
+        )
+        yield {
+            "type": "execute_result",
+            "mimetype": ["text/plain", "text/html"],
+            "value": [output, f"<html><body><pre>{output}</pre></body></html>"],
+        }
+
+    def do_complete(self, parameters, parameter_pos, cursor_pos):
+        if parameter_pos != 1:
+            return []
+        return [
+            command
+            for command in self.commands
+            if command.startswith(parameters[0][:cursor_pos])
+        ]
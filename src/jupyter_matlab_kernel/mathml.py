@@ -0,0 +1,348 @@
+# Copyright 2025 The MathWorks, Inc.
+# Conversion of the MathML of symbolic outputs to LaTeX, in the kernel process
+
+import functools
+import html.entities
+import re
+import xml.etree.ElementTree as ET
+
+from jupyter_matlab_kernel import mwi_logger
+
+_logger = mwi_logger.get()
+
+# Number of converted expressions kept in memory
+_CACHE_SIZE = 1024
+
+# LaTeX for the characters of MathML which are not written as themselves
+_SYMBOLS = {
+    # Greek letters
+    "α": r"\alpha", "β": r"\beta", "γ": r"\gamma", "δ": r"\delta",
+    "ϵ": r"\epsilon", "ε": r"\varepsilon", "ζ": r"\zeta", "η": r"\eta",
+    "θ": r"\theta", "ϑ": r"\vartheta", "ι": r"\iota", "κ": r"\kappa",
+    "λ": r"\lambda", "μ": r"\mu", "ν": r"\nu", "ξ": r"\xi", "π": r"\pi",
+    "ϖ": r"\varpi", "ρ": r"\rho", "ϱ": r"\varrho", "σ": r"\sigma",
+    "ς": r"\varsigma", "τ": r"\tau", "υ": r"\upsilon", "ϕ": r"\phi",
+    "φ": r"\varphi", "χ": r"\chi", "ψ": r"\psi", "ω": r"\omega",
+    "Γ": r"\Gamma", "Δ": r"\Delta", "Θ": r"\Theta", "Λ": r"\Lambda",
+    "Ξ": r"\Xi", "Π": r"\Pi", "Σ": r"\Sigma", "Υ": r"\Upsilon",
+    "Φ": r"\Phi", "Ψ": r"\Psi", "Ω": r"\Omega",
+    # Operators and relations
+    "−": "-", "±": r"\pm", "∓": r"\mp", "×": r"\times", "÷": r"\div",
+    "·": r"\cdot", "⋅": r"\cdot", "∘": r"\circ", "∗": "*", "≠": r"\neq",
+    "≤": r"\leq", "≥": r"\geq", "≈": r"\approx", "≡": r"\equiv",
+    "∼": r"\sim", "≃": r"\simeq", "∝": r"\propto", "<": "<", ">": ">",
+    "∈": r"\in", "∉": r"\notin", "⊂": r"\subset", "⊆": r"\subseteq",
+    "∪": r"\cup", "∩": r"\cap", "∧": r"\wedge", "∨": r"\vee", "¬": r"\neg",
+    "∀": r"\forall", "∃": r"\exists", "→": r"\rightarrow",
+    "←": r"\leftarrow", "⇒": r"\Rightarrow", "⇔": r"\Leftrightarrow",
+    "↦": r"\mapsto", "∑": r"\sum", "∏": r"\prod", "∫": r"\int",
+    "∬": r"\iint", "∮": r"\oint", "∂": r"\partial", "∇": r"\nabla",
+    "√": r"\surd",
+    # Fences
+    "{": r"\{", "}": r"\}", "⟨": r"\langle", "⟩": r"\rangle",
+    "⌊": r"\lfloor", "⌋": r"\rfloor", "⌈": r"\lceil", "⌉": r"\rceil",
+    "∣": "|", "‖": r"\|",
+    # Constants and letters
+    "∞": r"\infty", "∅": r"\emptyset", "ℏ": r"\hbar", "ℓ": r"\ell",
+    "ℝ": r"\mathbb{R}", "ℂ": r"\mathbb{C}", "ℤ": r"\mathbb{Z}",
+    "ℕ": r"\mathbb{N}", "ℚ": r"\mathbb{Q}", "ⅈ": r"\mathrm{i}",
+    "ⅉ": r"\mathrm{j}", "ⅇ": r"\mathrm{e}", "ⅆ": r"\mathrm{d}",
+    # Punctuation and spaces
+    "′": "'", "″": "''", "…": r"\ldots", "⋯": r"\cdots", "⋮": r"\vdots",
+    "⋱": r"\ddots", "°": r"^{\circ}", " ": r"\ ",
+    # Invisible operators: function application, times, separator and plus
+    "⁡": "", "⁢": "", "⁣": "", "⁤": "",
+    # Characters with a special meaning in LaTeX
+    "#": r"\#", "$": r"\$", "%": r"\%", "&": r"\&", "_": r"\_",
+    "~": r"\sim", "^": r"\hat{}", "\\": r"\backslash",
+}  # fmt: skip
+
+# Functions written in upright letters by LaTeX
+_FUNCTIONS = {
+    "sin", "cos", "tan", "cot", "sec", "csc", "arcsin", "arccos", "arctan",
+    "sinh", "cosh", "tanh", "coth", "exp", "log", "ln", "lg", "det", "dim",
+    "gcd", "max", "min", "sup", "inf", "lim", "liminf", "limsup", "arg",
+    "deg", "ker", "Pr", "hom",
+}  # fmt: skip
+
+# Operators whose limits are written as subscripts and superscripts
+_LARGE_OPERATORS = {r"\sum", r"\prod", r"\int", r"\iint", r"\oint", r"\lim"}
+
+# Accents written over their base by munder and mover
+_ACCENTS = {
+    "¯": r"\overline", "‾": r"\overline", "^": r"\hat", "ˆ": r"\hat",
+    "~": r"\tilde", "˜": r"\tilde", "˙": r"\dot", "¨": r"\ddot",
+    "→": r"\vec", "⃗": r"\vec",
+}  # fmt: skip
+
+_UNDER_ACCENTS = {"_": r"\underline", "¯": r"\underline"}
+
+# Fences which grow with the matrices and fractions they enclose
+_OPEN_FENCES = {"(", "[", "{", "|", "‖", "⟨", "⌊", "⌈"}
+_CLOSE_FENCES = {")", "]", "}", "|", "‖", "⟩", "⌋", "⌉"}
+_TALL_ELEMENTS = {"mtable", "mfrac", "munderover"}
+
+_XML_ENTITIES = {"amp", "lt", "gt", "quot", "apos"}
+
+_ENTITY_PATTERN = re.compile(r"&([A-Za-z][A-Za-z0-9]*);")
+
+# A control word, which must be separated from a following letter
+_TRAILING_COMMAND_PATTERN = re.compile(r"\\[A-Za-z]+$")
+
+
+def _replace_entity(match):
+    """Replaces the named HTML entities, which are not defined in XML, with their characters."""
+    name = match.group(1)
+    if name in _XML_ENTITIES:
+        return match.group(0)
+    return html.entities.html5.get(f"{name};", match.group(0))
+
+
+def _local_name(element):
+    """Returns the name of an element without its namespace."""
+    return element.tag.rsplit("}", 1)[-1]
+
+
+def _join(parts):
+    """Concatenates LaTeX, separating control words from the letters which follow them."""
+    result = ""
+    for part in parts:
+        if part and part[0].isalpha() and _TRAILING_COMMAND_PATTERN.search(result):
+            result += " "
+        result += part
+    return result
+
+
+def _group(latex):
+    """Wraps LaTeX in braces, unless it is a single character or control word."""
+    if len(latex) == 1 or re.fullmatch(r"\\[A-Za-z]+", latex):
+        return latex
+    return f"{{{latex}}}"
+
+
+def _text(element):
+    return "".join(element.itertext()).strip()
+
+
+def _symbols(text):
+    return _join(_SYMBOLS.get(char, char) for char in text)
+
+
+class _Converter:
+    """Converts an element of presentation MathML, and its children, to LaTeX."""
+
+    def convert(self, element):
+        handler = getattr(self, f"_{_local_name(element)}", None)
+        if handler is None:
+            return self._mrow(element)
+        return handler(element)
+
+    def _children(self, element):
+        return [self.convert(child) for child in element]
+
+    # Token elements
+
+    def _mi(self, element):
+        text = _text(element)
+        if len(text) == 1:
+            latex = _symbols(text)
+            if element.get("mathvariant") == "normal" and text.isalpha():
+                return rf"\mathrm{{{latex}}}"
+            return latex
+        if text in _FUNCTIONS:
+            return f"\\{text}"
+        return rf"\mathrm{{{_symbols(text)}}}"
+
+    def _mn(self, element):
+        return _symbols(_text(element))
+
+    def _mo(self, element):
+        return _symbols(_text(element))
+
+    def _mtext(self, element):
+        text = _text(element)
+        if not text:
+            return ""
+        return rf"\textrm{{{_symbols(text)}}}"
+
+    def _ms(self, element):
+        return self._mtext(element)
+
+    def _mspace(self, element):
+        return r"\,"
+
+    # Layout elements
+
+    def _mrow(self, element):
+        children = list(element)
+        if (
+            len(children) >= 2
+            and _local_name(children[0]) == "mo"
+            and _local_name(children[-1]) == "mo"
+            and _text(children[0]) in _OPEN_FENCES
+            and _text(children[-1]) in _CLOSE_FENCES
+            and any(_local_name(child) in _TALL_ELEMENTS for child in element.iter())
+        ):
+            # Fences around matrices and fractions grow with their content.
+            return _join(
+                [
+                    rf"\left{self.convert(children[0])}",
+                    *(self.convert(child) for child in children[1:-1]),
+                    rf"\right{self.convert(children[-1])}",
+                ]
+            )
+        return _join(self._children(element))
+
+    def _semantics(self, element):
+        # The first child is the presentation MathML, followed by annotations.
+        children = list(element)
+        return self.convert(children[0]) if children else ""
+
+    def _annotation(self, element):
+        return ""
+
+    def _mphantom(self, element):
+        return rf"\phantom{{{self._mrow(element)}}}"
+
+    def _mfrac(self, element):
+        numerator, denominator = self._children(element)[:2]
+        if element.get("linethickness") in ("0", "0px", "0pt"):
+            return rf"\genfrac{{}}{{}}{{0pt}}{{}}{{{numerator}}}{{{denominator}}}"
+        return rf"\frac{{{numerator}}}{{{denominator}}}"
+
+    def _msqrt(self, element):
+        return rf"\sqrt{{{self._mrow(element)}}}"
+
+    def _mroot(self, element):
+        base, index = self._children(element)[:2]
+        return rf"\sqrt[{index}]{{{base}}}"
+
+    def _mfenced(self, element):
+        open_fence = _symbols(element.get("open", "("))
+        close_fence = _symbols(element.get("close", ")"))
+        separators = re.sub(r"\s", "", element.get("separators", ","))
+        parts = []
+        for idx, child in enumerate(self._children(element)):
+            if idx and separators:
+                parts.append(_symbols(separators[min(idx - 1, len(separators) - 1)]))
+            parts.append(child)
+        return _join(
+            [rf"\left{open_fence or '.'}", *parts, rf"\right{close_fence or '.'}"]
+        )
+
+    def _menclose(self, element):
+        content = self._mrow(element)
+        if "box" in element.get("notation", ""):
+            return rf"\boxed{{{content}}}"
+        return content
+
+    # Scripts and limits
+
+    def _msub(self, element):
+        base, subscript = self._children(element)[:2]
+        return f"{_group(base)}_{{{subscript}}}"
+
+    def _msup(self, element):
+        base, superscript = self._children(element)[:2]
+        return f"{_group(base)}^{{{superscript}}}"
+
+    def _msubsup(self, element):
+        base, subscript, superscript = self._children(element)[:3]
+        return f"{_group(base)}_{{{subscript}}}^{{{superscript}}}"
+
+    def _munder(self, element):
+        base, under = self._children(element)[:2]
+        if base in _LARGE_OPERATORS:
+            return f"{base}_{{{under}}}"
+        accent = _text(element[1])
+        if accent in _UNDER_ACCENTS:
+            return rf"{_UNDER_ACCENTS[accent]}{{{base}}}"
+        return rf"\underset{{{under}}}{{{base}}}"
+
+    def _mover(self, element):
+        base, over = self._children(element)[:2]
+        accent = _text(element[1])
+        if accent in _ACCENTS:
+            return rf"{_ACCENTS[accent]}{{{base}}}"
+        if base in _LARGE_OPERATORS:
+            return f"{base}^{{{over}}}"
+        return rf"\overset{{{over}}}{{{base}}}"
+
+    def _munderover(self, element):
+        base, under, over = self._children(element)[:3]
+        if base in _LARGE_OPERATORS:
+            return f"{base}_{{{under}}}^{{{over}}}"
+        return rf"\underset{{{under}}}{{\overset{{{over}}}{{{base}}}}}"
+
+    # Tables
+
+    def _mtable(self, element):
+        rows = [
+            [self.convert(cell) for cell in row if _local_name(cell) == "mtd"]
+            for row in element
+            if _local_name(row) in ("mtr", "mlabeledtr")
+        ]
+        columns = max((len(row) for row in rows), default=0)
+        body = r" \\ ".join(" & ".join(row) for row in rows)
+        return rf"\begin{{array}}{{{'c' * columns}}} {body} \end{{array}}"
+
+    def _mtd(self, element):
+        return self._mrow(element)
+
+
+@functools.lru_cache(maxsize=_CACHE_SIZE)
+def mathml_to_latex(mathml):
+    """
+    Converts presentation MathML, such as the MathML of symbolic outputs returned by
+    MATLAB, to LaTeX. Conversions are memoized, so that expressions displayed
+    repeatedly, for example by a cell executed again, are converted once.
+
+    Args:
+        mathml (str): A MathML <math> element.
+
+    Raises:
+        ValueError: If mathml is not well-formed XML.
+
+    Returns:
+        str: The LaTeX of the expression, without delimiters.
+    """
+    try:
+        root = ET.fromstring(_ENTITY_PATTERN.sub(_replace_entity, mathml))
+    except ET.ParseError as e:
+        raise ValueError(f"Invalid MathML: {e}") from e
+    latex = _Converter().convert(root)
+    return re.sub(r"\s+", " ", latex).strip()
+
+
+def symbolic_output(output, logger=_logger):
+    """
+    Converts a symbolic output returned by MATLAB as MathML to the LaTeX output which
+    MATLAB returns when it converts symbolic outputs itself.
+
+    Args:
+        output (dict): Output of type "symbolic", with the "name" of the variable and
+            the MathML "value" of the expression.
+        logger (Logger, optional): Instance of Logger. Defaults to _logger.
+
+    Returns:
+        dict: Output of type execute_result with the LaTeX of the expression, or with
+            the MathML embedded in HTML if it cannot be converted.
+    """
+    name, mathml = output.get("name"), output["value"]
+    try:
+        latex = mathml_to_latex(mathml)
+    except ValueError as e:
+        logger.debug(f"Unable to convert symbolic output to LaTeX: {e}")
+        # Like MATLAB, embed the MathML in HTML, which JupyterLab can render.
+        return {
+            "type": "execute_result",
+            "mimetype": ["text/html", "text/plain"],
+            "value": [f"<html><body><pre>{mathml}</pre></body></html>", mathml],
+        }
+    if name:
+        latex = f"{name} = {latex}"
+    return {
+        "type": "execute_result",
+        "mimetype": ["text/latex"],
+        "value": [f"${latex}$"],
+    }
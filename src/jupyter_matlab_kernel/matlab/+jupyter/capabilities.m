@@ -0,0 +1,53 @@
+% IMPORTANT NOTICE:
+% This file may contain calls to MathWorks internal APIs which are subject to
+% change without any prior notice. Usage of these undocumented APIs outside of
+% these files is not supported.
+
+function caps = capabilities()
+% CAPABILITIES A helper function which returns the capabilities of the current
+% MATLAB session. The record is computed once per MATLAB process and is cached
+% for the lifetime of the session, so that later requests do not need to query
+% the MATLAB release or the Live Editor API version again.
+%   Outputs:
+%       caps - struct
+%           - release              - string  - MATLAB release. For example "2024b"
+%           - isOlderThanR2022b    - logical - true for MATLAB versions < R2022b
+%           - isOlderThanR2023b    - logical - true for MATLAB versions < R2023b
+%           - isOlderThanR2025b    - logical - true for MATLAB versions < R2025b
+%           - liveEditorApiVersion - double  - Version of the synchronous Live
+%                                              Editor API. 0 for MATLAB versions < R2023b
+%           - pathRegistered       - logical - true if the MATLAB code shipped
+%                                              with the kernel is on the path
+%           - sessionEpoch         - string  - Identifier which is unique to this
+%                                              MATLAB process
+
+% Copyright 2025 The MathWorks, Inc.
+
+% Lock the function on the first use to prevent the cached record from being
+% cleared from the memory
+mlock;
+
+persistent cachedCapabilities;
+
+if isempty(cachedCapabilities)
+    cachedCapabilities.release = string(version('-release'));
+    cachedCapabilities.isOlderThanR2022b = isMATLABReleaseOlderThan("R2022b");
+    cachedCapabilities.isOlderThanR2023b = isMATLABReleaseOlderThan("R2023b");
+    cachedCapabilities.isOlderThanR2025b = isMATLABReleaseOlderThan("R2025b");
+
+    if cachedCapabilities.isOlderThanR2023b
+        cachedCapabilities.liveEditorApiVersion = 0;
+    else
+        cachedCapabilities.liveEditorApiVersion = matlab.internal.editor.getApiVersion('synchronous');
+    end
+
+    cachedCapabilities.pathRegistered = ~isempty(which('processJupyterKernelRequest'));
+
+    % The process ID together with the time of the first call identifies this
+    % MATLAB session. The kernel uses it to detect a restart of MATLAB.
+    cachedCapabilities.sessionEpoch = string(sprintf('%d-%s', feature('getpid'), ...
+        char(datetime('now', 'Format', 'yyyyMMddHHmmssSSS'))));
+end
+
+caps = cachedCapabilities;
+end
@@ -3,7 +3,7 @@
 % change without any prior notice. Usage of these undocumented APIs outside of
 % these files is not supported.
 
-function result = execute(code, kernelId)
+function [result, hasError] = execute(code, kernelId, options)
 % EXECUTE A helper function for handling execution of MATLAB code and post-processing
 % the outputs to conform to Jupyter API. We use the Live Editor API for majority
 % of the work.
@@ -11,13 +11,42 @@ function result = execute(code, kernelId)
 % The entire MATLAB code given by user is treated as code within a single cell
 % of a unique Live Script. Hence, each execution request can be considered as
 % creating and running a new Live Script file.
+%
+% The second output 'hasError' is true if the execution of the code produced an
+% error. It is used by jupyter.executeStreaming to stop executing further sections.
+%
+% The optional input 'options' is a struct (or its JSON encoding) sent by the
+% kernel with the execution request. Supported fields:
+%   - figureSpoolDir - string - If not empty, figure images are written to this
+%                               folder and only a reference is returned to the kernel.
+%   - deferFigures   - logical - If true, each figure is returned as a placeholder
+%                               at its position, and its image is returned after all
+%                               the other outputs, with the display ID of the
+%                               placeholder.
+%   - rawSymbolic    - logical - If true, symbolic outputs are returned as MathML,
+%                               which the kernel converts to LaTeX, instead of
+%                               being converted in MATLAB.
+%   - rawOutputs     - logical - If true, the response of the Live Editor API is
+%                               returned without being decoded or post-processed,
+%                               and the kernel transforms it into Jupyter outputs.
+%                               The other options are then applied by the kernel,
+%                               and figures are returned inline.
 
 % Copyright 2023-2025 The MathWorks, Inc.
 
+% Release and Live Editor API information is computed once per MATLAB session.
+caps = jupyter.capabilities();
+
+if nargin < 3 || isempty(options)
+    options = struct();
+elseif ~isstruct(options)
+    options = jsondecode(options);
+end
+
 % Embed user MATLAB code in a try-catch block for MATLAB versions less than R2022b.
 % This is will disable inbuilt ErrorRecovery mechanism. Any exceptions created in
 % user code would be handled by +jupyter/getOrStashExceptions.m
-if isMATLABReleaseOlderThan("R2022b")
+if caps.isOlderThanR2022b
     code = sprintf(['try\n'...
         '%s\n'...
         'catch JupyterKernelME\n'...
@@ -40,7 +69,7 @@ request = struct('requestId', 'jupyter_matlab_kernel',...
     'fullFilePath', fileToShowErrors);
 
 % Update additional fields in the request based on MATLAB and LiveEditor API version.
-request = updateRequest(request, code);
+request = updateRequest(request, code, caps);
 
 % Disable Hotlinks in the output captured. The hotlinks do not have a purpose
 % in Jupyter notebooks.
@@ -49,22 +78,27 @@ hotlinksCleanupObj = onCleanup(@() feature('hotlinks', hotlinksPreviousState));
 
 % Figures hang in MATLAB versions >= R2025a for certain workflows. The following
 % workaround fixes the issue in MATLAB versions >= R2025b.
-if ~isMATLABReleaseOlderThan("R2025b")
+if ~caps.isOlderThanR2025b
     forceIndependentlyHostedFiguresProp = addprop(groot, "ForceIndependentlyHostedFigures");
     propCleanupObj = onCleanup(@() delete(forceIndependentlyHostedFiguresProp));
 end
 
 % Use the Live editor API for execution of MATLAB code and capturing the outputs
-resp = jsondecode(matlab.internal.editor.evaluateSynchronousRequest(request));
+response = matlab.internal.editor.evaluateSynchronousRequest(request);
 
-% Post-process the outputs to conform to Jupyter API.
-result = processOutputs(resp.outputs);
+% Post-process the outputs to conform to Jupyter API, or leave it to the kernel.
+if isfield(options, 'rawOutputs') && options.rawOutputs
+    [result, hasError] = processRawResponse(response);
+else
+    resp = jsondecode(response);
+    [result, hasError] = processOutputs(resp.outputs, options);
+end
 
 % Helper function to update fields in the request based on MATLAB and LiveEditor
 % API version.
-function request = updateRequest(request, code)
+function request = updateRequest(request, code, caps)
 % Support for MATLAB version <= R2023a.
-if isMATLABReleaseOlderThan("R2023b")
+if caps.isOlderThanR2023b
     request = updateRequestFromBefore23b(request, code);
 else
     % Support for MATLAB version >= R2023b.
@@ -72,7 +106,7 @@ else
     % To maintain backwards compatibility, each case in the switch
     % encodes conversion from the version number in the case
     % to the current version.
-    switch matlab.internal.editor.getApiVersion('synchronous')
+    switch caps.liveEditorApiVersion
         case 1
             request = updateRequestFromVersion1(request, code);
         case 2
@@ -112,9 +146,12 @@ request = updateRequestFromVersion1(request, code);
 request.preferBasicOutputs = true;
 
 % Helper function to process different types of outputs given by LiveEditor API.
-function result = processOutputs(outputs)
+function [result, hasError] = processOutputs(outputs, options)
 result =cell(1,length(outputs));
+hasError = false;
 figureTrackingMap = containers.Map;
+deferFigures = isfield(options, 'deferFigures') && options.deferFigures;
+deferredFigures = {};
 
 % Post process each captured output based on its type.
 for ii = 1:length(outputs)
@@ -128,9 +165,14 @@ for ii = 1:length(outputs)
         case 'variableString'
             result{ii} = processVariableString(outputData);
         case 'symbolic'
-            result{ii} = processSymbolic(outputData);
+            if isfield(options, 'rawSymbolic') && options.rawSymbolic
+                result{ii} = processRawSymbolic(outputData);
+            else
+                result{ii} = processSymbolic(outputData);
+            end
         case 'error'
             result{ii} = processStream('stderr', outputData.text);
+            hasError = true;
         case 'warning'
             result{ii} = processStream('stderr', outputData.text);
         case 'text'
@@ -155,7 +197,16 @@ for ii = 1:length(outputs)
                 else
                     idx = ii;
                 end
-                result{idx} = processFigure(outputData.figureImage);
+                figureResult = processFigure(outputData.figureImage, options);
+                if deferFigures
+                    % Keep the position of the figure with a placeholder, and send
+                    % the image after all the other outputs.
+                    result{idx} = processFigurePlaceholder(id);
+                    figureResult.displayId = id;
+                    deferredFigures{end+1} = figureResult; %#ok<AGROW>
+                else
+                    result{idx} = figureResult;
+                end
             end
         case 'text/html'
             result{ii} = processHtml(outputData);
@@ -165,7 +216,26 @@ end
 ME = jupyter.getOrStashExceptions([], true);
 if ~isempty(ME)
     result{end+1} = processStream('stderr', ME.message);
+    hasError = true;
 end
+result = [result, deferredFigures];
+
+% Helper function to return the response of the Live Editor API as JSON, which
+% the kernel transforms into Jupyter outputs (see
+% jupyter_matlab_kernel.output_transformer). Errors are detected without decoding
+% the response: quotes are escaped inside JSON strings, so the pattern only
+% matches the type of an output.
+function [result, hasError] = processRawResponse(response)
+hasError = ~isempty(regexp(response, '"type"\s*:\s*"error"', 'once'));
+record.type = 'live_editor_response';
+record.response = response;
+record.stashedError = '';
+ME = jupyter.getOrStashExceptions([], true);
+if ~isempty(ME)
+    record.stashedError = ME.message;
+    hasError = true;
+end
+result = {record};
 
 % Helper functions to post process output of type 'matrix', 'variable' and
 % 'variableString'. These outputs are of HTML type due to various HTML tags
@@ -258,6 +328,14 @@ result.type = 'execute_result';
 result.mimetype = {"text/latex"};
 result.value = {latexcode};
 
+% Helper function for returning symbolic outputs as MathML. The kernel converts
+% the MathML to LaTeX, which keeps the webwindow used by processSymbolic off the
+% MATLAB thread.
+function result = processRawSymbolic(output)
+result.type = 'symbolic';
+result.name = output.name;
+result.value = output.value;
+
 % Helper function for processing outputs of stream type such as 'stdout' and 'stderr'
 function result = processStream(stream, text)
 result.type = 'stream';
@@ -266,15 +344,51 @@ result.content.text = text;
 
 % Helper function for processing figure outputs.
 % base64Data will be 'data:image/png;base64,<base64_value>'
-function result = processFigure(base64Data)
+function result = processFigure(base64Data, options)
 pattern = "data:(?<mimetype>.*);base64,(?<value>.*)";
 result = builtin('regexp', base64Data, pattern, 'names');
 assert(builtin('startsWith', result.mimetype, 'image'), 'Error in processFigure. ''mimetype'' is not an image');
 assert(~isempty(result.value), 'Error in processFigure. ''value'' is empty');
+if isfield(options, 'figureSpoolDir') && ~isempty(options.figureSpoolDir)
+    result = spoolFigure(result, options.figureSpoolDir);
+    return
+end
 result.mimetype = {result.mimetype};
 result.value = {result.value};
 result.type = 'execute_result';
 
+% Helper function for the placeholder of a figure whose image is sent after the
+% other outputs of the cell. The kernel replaces the placeholder with the image
+% using the display ID.
+function result = processFigurePlaceholder(displayId)
+result.type = 'figure_placeholder';
+result.displayId = displayId;
+
+% Helper function to write the bytes of a figure image to the spool folder of the
+% kernel. Only a reference to the file along with its size and SHA-256 hash is
+% returned, which keeps the image data out of the JSON response.
+function result = spoolFigure(figure, spoolDir)
+bytes = matlab.net.base64decode(figure.value);
+[~, extension] = builtin('strtok', figure.mimetype, '/');
+extension = regexprep(extension(2:end), '\+.*$', '');
+filePath = [tempname(spoolDir) '.' extension];
+fid = fopen(filePath, 'w');
+fwrite(fid, bytes, 'uint8');
+fclose(fid);
+
+try
+    digest = java.security.MessageDigest.getInstance('SHA-256');
+    hash = lower(reshape(dec2hex(typecast(digest.digest(typecast(bytes, 'int8')), 'uint8'))', 1, []));
+catch
+    % Java is not available. The kernel computes the hash when required.
+    hash = '';
+end
+
+result.type = 'execute_result';
+result.mimetype = {figure.mimetype};
+result.value = {''};
+result.spooledFigure = struct('path', filePath, 'size', numel(bytes), 'sha256', hash);
+
 % Helper function for processing text/html mime-type outputs.
 function result = processHtml(text)
 result.type = 'execute_result';
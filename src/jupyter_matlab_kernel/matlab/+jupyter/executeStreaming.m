@@ -0,0 +1,112 @@
+function executeStreaming(code, kernelId, options)
+% EXECUTESTREAMING A helper function which starts the execution of MATLAB code
+% in the background and streams the outputs to the output queue of the kernel.
+%
+% The code is split into sections which are executed one at a time from a timer.
+% MATLAB returns to the prompt between two sections, which allows the kernel to
+% fetch the outputs of completed sections with "poll_outputs" requests while the
+% remaining sections are still running. Only section breaks at the top level of
+% the code are used, so that each section runs as it would within the whole code.
+% The queue is closed once all the sections have been executed or a section has
+% produced an error, after which no further section is executed. See
+% jupyter.execute for the supported execution options.
+
+% Copyright 2025 The MathWorks, Inc.
+
+if nargin < 3
+    options = '';
+end
+
+sections = splitIntoSections(code);
+jupyter.outputQueue('open', kernelId);
+
+runner = timer('Name', ['jupyter_stream_' char(kernelId)], ...
+    'ExecutionMode', 'fixedSpacing', ...
+    'Period', 0.001, ...
+    'TasksToExecute', numel(sections), ...
+    'BusyMode', 'queue', ...
+    'UserData', struct('next', 1, 'hasError', false));
+runner.TimerFcn = @(t, ~) runNextSection(t, sections, kernelId, options);
+runner.StopFcn = @(t, ~) finishExecution(t, kernelId);
+start(runner);
+
+% Helper function to split the code at the section breaks ("%%" at the start of a
+% line) which are at the top level of the code. A section break inside a block
+% comment, or inside a block such as for, if, function or try, is kept within its
+% section: the code before it would not run on its own. The code is executed as a
+% single section if it cannot be parsed or defines local functions, which must be
+% in the same code as their callers.
+function sections = splitIntoSections(code)
+code = char(code);
+lines = cellstr(builtin('split', string(code), newline));
+isSectionBreak = ~cellfun(@isempty, regexp(lines, '^\s*%%(\s|$)', 'once'));
+isSectionBreak(1) = false;
+if ~any(isSectionBreak) || ~isCompleteCode(code) || definesFunctions(code)
+    sections = {code};
+    return
+end
+
+% Block comments start and end with "%{" and "%}" alone on their line.
+isBlockCommentStart = ~cellfun(@isempty, regexp(lines, '^\s*%\{\s*$', 'once'));
+isBlockCommentEnd = ~cellfun(@isempty, regexp(lines, '^\s*%\}\s*$', 'once'));
+isInBlockComment = cumsum(isBlockCommentStart) - cumsum(isBlockCommentEnd) > 0;
+isSectionBreak = isSectionBreak & ~isInBlockComment;
+
+% A section break is at the top level if the code of the section before it is
+% complete on its own.
+sections = {};
+sectionStart = 1;
+for ii = find(isSectionBreak(:)')
+    section = strjoin(lines(sectionStart:ii - 1), newline);
+    if isCompleteCode(section)
+        sections{end+1} = section; %#ok<AGROW>
+        sectionStart = ii;
+    end
+end
+sections{end+1} = strjoin(lines(sectionStart:end), newline);
+
+% Helper function to check that code parses on its own, without unterminated blocks.
+function tf = isCompleteCode(code)
+try
+    tree = mtree(code);
+    tf = ~(tree.count == 1 && strcmp(tree.kind, 'ERR'));
+catch
+    tf = false;
+end
+
+% Helper function to check if code defines local functions.
+function tf = definesFunctions(code)
+try
+    tf = mtfind(mtree(code), 'Kind', 'FUNCTION').count > 0;
+catch
+    tf = true;
+end
+
+% Helper function to execute the next section and append its outputs to the queue.
+function runNextSection(runner, sections, kernelId, options)
+state = runner.UserData;
+if state.hasError || state.next > numel(sections)
+    % A task which was already scheduled when a section errored out.
+    return
+end
+try
+    [outputs, hasError] = jupyter.execute(sections{state.next}, kernelId, options);
+catch ME
+    errorMessage.type = 'stream';
+    errorMessage.content.name = 'stderr';
+    errorMessage.content.text = sprintf('MATLAB Kernel Error:\n%s', getReport(ME));
+    outputs = {errorMessage};
+    hasError = true;
+end
+runner.UserData = struct('next', state.next + 1, 'hasError', hasError);
+jupyter.outputQueue('append', kernelId, outputs);
+
+% Do not execute the remaining sections if the current one errored out.
+if hasError
+    stop(runner);
+end
+
+% Helper function to close the output queue and clean up the timer.
+function finishExecution(runner, kernelId)
+jupyter.outputQueue('close', kernelId);
+delete(runner);
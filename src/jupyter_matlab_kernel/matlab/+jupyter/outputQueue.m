@@ -0,0 +1,56 @@
+function result = outputQueue(action, kernelId, outputs)
+% OUTPUTQUEUE A helper function which maintains a queue of outputs for each kernel.
+% The queue is filled by jupyter.executeStreaming while a cell is being executed
+% and is drained by the kernel through "poll_outputs" requests.
+%   Inputs:
+%       action   - string     - Supported values are "open", "append", "close"
+%                               and "drain"
+%       kernelId - string     - ID of the kernel
+%       outputs  - cell array - Outputs to be appended to the queue. Used only
+%                               with the "append" action
+%   Outputs:
+%       result - struct - Used only with the "drain" action
+%           - outputs - cell array - Outputs appended since the previous drain
+%           - done    - logical    - true if the execution has finished and no
+%                                    more outputs will be appended
+
+% Copyright 2025 The MathWorks, Inc.
+
+% Lock the function on the first use to prevent the queues from being cleared
+% from the memory
+mlock;
+
+persistent queues;
+if isempty(queues)
+    queues = containers.Map('KeyType', 'char', 'ValueType', 'any');
+end
+
+kernelId = char(kernelId);
+result = struct('outputs', {{}}, 'done', true);
+
+switch action
+    case 'open'
+        queues(kernelId) = struct('outputs', {{}}, 'done', false);
+    case 'append'
+        if queues.isKey(kernelId)
+            entry = queues(kernelId);
+            entry.outputs = [entry.outputs, outputs(~cellfun(@isempty, outputs))];
+            queues(kernelId) = entry;
+        end
+    case 'close'
+        if queues.isKey(kernelId)
+            entry = queues(kernelId);
+            entry.done = true;
+            queues(kernelId) = entry;
+        end
+    case 'drain'
+        if queues.isKey(kernelId)
+            result = queues(kernelId);
+            if result.done
+                queues.remove(kernelId);
+            else
+                queues(kernelId) = struct('outputs', {{}}, 'done', false);
+            end
+        end
+end
+end
@@ -3,17 +3,48 @@
 % change without any prior notice. Usage of these undocumented APIs outside of
 % these files is not supported.
 
-function output = shutdown(kernelId)
+function output = shutdown(kernelId, options)
 % SHUTDOWN A helper function to perform cleanup activities when a kernel shuts down.
+%
+% Inputs:
+%   kernelId - string - ID of the kernel.
+%   options  - struct or JSON string with the optional fields:
+%       - resetWorkspace - logical - If true, clears the variables in the base
+%                                    workspace and the global variables, and
+%                                    closes all figures, so that the MATLAB
+%                                    session can be leased to another kernel.
+%
+% Outputs:
+%   output - struct with the field "reset", which is true if the workspace was
+%            reset, when resetWorkspace is requested. Empty cell array otherwise.
 
-% Copyright 2023 The MathWorks, Inc.
+% Copyright 2023-2025 The MathWorks, Inc.
 
 import matlab.internal.editor.SynchronousEvaluationOutputsService
 
 % Perform LiveEditor state cleanup of a given notebook in MATLAB versions >= R2023b
-if ~isMATLABReleaseOlderThan("R2023b")
+caps = jupyter.capabilities();
+if ~caps.isOlderThanR2023b
     SynchronousEvaluationOutputsService.cleanup(kernelId);
 end
 
+if nargin < 2 || isempty(options)
+    options = struct();
+elseif ~isstruct(options)
+    options = jsondecode(options);
+end
+
 output = {};
+if isfield(options, 'resetWorkspace') && options.resetWorkspace
+    % The kernel returns the session to the pool only if the reset is confirmed,
+    % since errors are otherwise returned as outputs by processJupyterKernelRequest.
+    try
+        evalin('base', 'clearvars');
+        clearvars -global
+        close all force
+        output = struct('reset', true);
+    catch
+        output = struct('reset', false);
+    end
+end
 end
\ No newline at end of file
@@ -0,0 +1,51 @@
+function info = snapshot(action, file, sessionEpoch)
+% SNAPSHOT Saves the base workspace to a MAT file before the kernel releases its
+% MATLAB, and restores it once the kernel has reacquired a MATLAB.
+%
+% Inputs:
+%   action       - string - "save" or "load".
+%   file         - string - Path of the MAT file.
+%   sessionEpoch - string - (optional) Session epoch returned when the snapshot was
+%                           saved. The snapshot is not loaded if MATLAB has kept
+%                           running since, as its workspace is still intact.
+%
+% Output:
+%   info - struct
+%       - time         - double  - Time in seconds taken to save or load the file.
+%       - bytes        - double  - Size of the file in bytes.
+%       - variables    - double  - Number of variables saved or loaded.
+%       - sessionEpoch - string  - Session epoch of this MATLAB.
+%       - restored     - logical - True if the snapshot was loaded ("load" only).
+
+% Copyright 2025 The MathWorks, Inc.
+
+caps = jupyter.capabilities();
+info = struct('time', 0, 'bytes', 0, 'variables', 0, ...
+    'sessionEpoch', caps.sessionEpoch, 'restored', false);
+quotedFile = strrep(char(file), '''', '''''');
+
+startTime = tic;
+switch action
+    case 'save'
+        info.variables = numel(evalin('base', 'who'));
+        % Version 7 MAT files are compressed. Variables larger than 2 GB require
+        % version 7.3.
+        lastwarn('');
+        evalin('base', sprintf('save(''%s'', ''-v7'')', quotedFile));
+        [~, warningId] = lastwarn();
+        if warningId == "MATLAB:save:sizeTooBigForMATFile"
+            evalin('base', sprintf('save(''%s'', ''-v7.3'')', quotedFile));
+        end
+    case 'load'
+        if nargin >= 3 && caps.sessionEpoch == string(sessionEpoch)
+            return
+        end
+        info.variables = numel(whos('-file', file));
+        evalin('base', sprintf('load(''%s'')', quotedFile));
+        info.restored = true;
+end
+info.time = toc(startTime);
+
+fileInfo = dir(file);
+info.bytes = fileInfo.bytes;
+end
@@ -0,0 +1,54 @@
+% IMPORTANT NOTICE:
+% This file may contain calls to MathWorks internal APIs which are subject to
+% change without any prior notice. Usage of these undocumented APIs outside of
+% these files is not supported.
+
+function timings = warmup(code, kernelId, options)
+% WARMUP Primes MATLAB and the Live Editor for a kernel before the first cell
+% of the user is executed. The outputs produced while warming up are discarded.
+%
+% Inputs:
+%   code     - string - No-op cell executed through the Live Editor API.
+%   kernelId - string - ID of the kernel, used as the editor ID by jupyter.execute.
+%   options  - struct or JSON string with the optional fields:
+%       - preloadScript - string  - Path of a script executed after the no-op cell.
+%       - primeSymbolic - logical - If true, displays a symbolic expression to load
+%                                   the renderer used for symbolic outputs.
+%
+% Output:
+%   timings - struct - Time in seconds taken by each stage (execute, preload and
+%                      symbolic), and whether any stage produced an error.
+
+% Copyright 2025 The MathWorks, Inc.
+
+if nargin < 3 || isempty(options)
+    options = struct();
+elseif ~isstruct(options)
+    options = jsondecode(options);
+end
+
+timings = struct('execute', 0, 'preload', 0, 'symbolic', 0, 'hasError', false);
+
+startTime = tic;
+[~, hasError] = jupyter.execute(code, kernelId);
+timings.execute = toc(startTime);
+timings.hasError = hasError;
+
+if isfield(options, 'preloadScript') && ~isempty(options.preloadScript)
+    startTime = tic;
+    [~, hasError] = jupyter.execute(fileread(options.preloadScript), kernelId);
+    timings.preload = toc(startTime);
+    timings.hasError = timings.hasError || hasError;
+end
+
+% Symbolic outputs are rendered by a webwindow which is created on first use.
+if isfield(options, 'primeSymbolic') && options.primeSymbolic && isSymbolicMathAvailable()
+    startTime = tic;
+    [~, hasError] = jupyter.execute(sprintf('jupyterWarmupSymbolic = sym("x")\nclear jupyterWarmupSymbolic'), kernelId);
+    timings.symbolic = toc(startTime);
+    timings.hasError = timings.hasError || hasError;
+end
+
+% Helper function to check if the Symbolic Math Toolbox can be used.
+function available = isSymbolicMathAvailable()
+available = ~isempty(which('sym')) && license('test', 'Symbolic_Toolbox');
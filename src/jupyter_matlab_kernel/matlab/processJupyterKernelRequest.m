@@ -3,7 +3,9 @@ function result = processJupyterKernelRequest(request_type, execution_request_ty
 % features such as code execution, code completion etc.
 %   Inputs:
 %       request_type - string     - identifier to differentiate multiple features.
-%                                   Supported values are "execute" and "complete"
+%                                   Supported values are "execute", "complete",
+%                                   "shutdown", "handshake", "execute_stream",
+%                                   "poll_outputs", "warmup" and "snapshot"
 %       execution_request_type - string - identifier to differentiate how this
 %                                   function is run in MATLAB. Supported values
 %                                   are "feval" and "eval"
@@ -12,11 +14,34 @@ function result = processJupyterKernelRequest(request_type, execution_request_ty
 %                                   - "execute"
 %                                      - string - MATLAB code to be executed
 %                                      - string - ID of the kernel
+%                                      - string - (optional) JSON encoded
+%                                                 execution options
 %                                   - "complete"
 %                                      - string - MATLAB code
 %                                      - number - cursor position
 %                                   - "shutdown"
 %                                      - string - ID of the kernel
+%                                      - string - (optional) JSON encoded
+%                                                 shutdown options
+%                                   - "handshake"
+%                                      - no additional inputs
+%                                   - "execute_stream"
+%                                      - string - MATLAB code to be executed
+%                                      - string - ID of the kernel
+%                                      - string - (optional) JSON encoded
+%                                                 execution options
+%                                   - "poll_outputs"
+%                                      - string - ID of the kernel
+%                                   - "warmup"
+%                                      - string - No-op MATLAB code to be executed
+%                                      - string - ID of the kernel
+%                                      - string - (optional) JSON encoded
+%                                                 warm-up options
+%                                   - "snapshot"
+%                                      - string - "save" or "load"
+%                                      - string - Path of the MAT file
+%                                      - string - (optional) Session epoch
+%                                                 of the saved snapshot
 %   Outputs:
 %       - cell array on struct
 %           - type      - string - jupyter output type. Supported values are
@@ -29,20 +54,26 @@ function result = processJupyterKernelRequest(request_type, execution_request_ty
 %               - name  - string - name of the stream. Supported values are 'stdout'
 %                                  and 'stderr'.
 %               - value - string - content of the stream
+%       - struct for "handshake" request type. See jupyter.capabilities
+%       - struct for "poll_outputs" request type. See jupyter.outputQueue
+%       - struct for "warmup" request type. See jupyter.warmup
+%       - struct for "snapshot" request type. See jupyter.snapshot
 %
 
-% Copyright 2023 The MathWorks, Inc.
+% Copyright 2023-2025 The MathWorks, Inc.
 
 % Lock the function on the first use to prevent it from being cleared from the memory
 mlock;
 
-code = varargin{1};
+if ~isempty(varargin)
+    code = varargin{1};
+end
 
 % If the code is received through an eval request, it will be JSON encoded to
 % prevent the eval string to be broken down by MATLAB due to formatting. We need
 % to decode the received code to get the original user code. For example
 % "processJupyterKernelRequest('execute', 'eval', 'a = "Hello\\n''world''"')".
-if execution_request_type == "eval"
+if execution_request_type == "eval" && ~isempty(varargin)
     code = jsondecode(code);
 end
 
@@ -51,13 +82,27 @@ try
     switch(request_type)
         case 'execute'
             kernelId = varargin{2};
-            output = jupyter.execute(code, kernelId);
+            output = jupyter.execute(code, kernelId, getExecutionOptions(varargin));
         case 'complete'
             cursorPosition = varargin{2};
             output = jupyter.complete(code, cursorPosition);
         case 'shutdown'
             kernelId = varargin{1};
-            output = jupyter.shutdown(kernelId);
+            output = jupyter.shutdown(kernelId, getShutdownOptions(varargin));
+        case 'handshake'
+            output = jupyter.capabilities();
+        case 'execute_stream'
+            kernelId = varargin{2};
+            jupyter.executeStreaming(code, kernelId, getExecutionOptions(varargin));
+            output = {};
+        case 'poll_outputs'
+            kernelId = varargin{1};
+            output = jupyter.outputQueue('drain', kernelId);
+        case 'warmup'
+            kernelId = varargin{2};
+            output = jupyter.warmup(code, kernelId, getExecutionOptions(varargin));
+        case 'snapshot'
+            output = jupyter.snapshot(varargin{:});
     end
 catch ME
     % The code withing try block should be exception safe. In case anything we
@@ -85,3 +130,21 @@ elseif execution_request_type == "eval"
 end
 
 end
+
+% Helper function to get the optional options sent with execution and warm-up requests.
+function options = getExecutionOptions(inputs)
+if numel(inputs) >= 3
+    options = inputs{3};
+else
+    options = '';
+end
+end
+
+% Helper function to get the optional options sent with shutdown requests.
+function options = getShutdownOptions(inputs)
+if numel(inputs) >= 2
+    options = inputs{2};
+else
+    options = '';
+end
+end
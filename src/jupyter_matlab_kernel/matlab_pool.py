@@ -0,0 +1,420 @@
+# Copyright 2025 The MathWorks, Inc.
+# Warm pool of isolated MATLAB sessions shared by the kernels of a Jupyter server
+
+import asyncio
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+
+import matlab_proxy_manager.lib.api as mpm_lib
+import psutil
+from matlab_proxy import settings as mwi_settings
+
+from jupyter_matlab_kernel import mwi_logger
+from jupyter_matlab_kernel.mwi_exceptions import MATLABConnectionError
+
+_logger = mwi_logger.get()
+
+# Prefix of the caller ids with which the MATLAB sessions of the pool are started
+_POOL_CALLER_ID_PREFIX = "jupyter-matlab-pool-"
+
+# Time (in seconds) between attempts to lease a session while all sessions are in use
+_LEASE_RETRY_INTERVAL = 1
+
+# Maximum time (in seconds) between two replenishments of the pool
+_MAINTENANCE_INTERVAL = 30
+
+_LEASE_TIMEOUT = mwi_settings.get_process_startup_timeout()
+
+
+def _is_process_alive(pid):
+    try:
+        return psutil.pid_exists(int(pid))
+    except (TypeError, ValueError):
+        return False
+
+
+def _read_json(path):
+    try:
+        return json.loads(path.read_text())
+    except (OSError, ValueError):
+        return None
+
+
+class MATLABLease:
+    """
+    A MATLAB session of the pool which is leased to a kernel.
+
+    Args:
+        slot (int): Index of the session in the pool.
+        server (dict): matlab-proxy server of the session, as returned by the proxy manager.
+        is_warm (bool): True if the session was started before it was leased.
+        wait_time (float): Time in seconds taken to lease the session.
+    """
+
+    def __init__(self, slot, server, is_warm, wait_time):
+        self.slot = slot
+        self.server = server
+        self.is_warm = is_warm
+        self.wait_time = wait_time
+        self.leased_at = time.monotonic()
+
+    @property
+    def stats(self):
+        """Statistics of the lease, which are logged when the session is released."""
+        return {
+            "slot": self.slot,
+            "warm": self.is_warm,
+            "wait_time": round(self.wait_time, 3),
+            "lease_time": round(time.monotonic() - self.leased_at, 3),
+        }
+
+
+class MATLABPool:
+    """
+    Pre-starts isolated MATLAB sessions, which are leased to the kernels started by a
+    Jupyter server on their first execution request. Kernels run in separate
+    processes, so the state of the pool is kept in a folder shared by all the
+    kernels of the Jupyter server:
+
+        slot-<n>.json   matlab-proxy server of the session in slot n, if started.
+                        Its modification time is the time since which it is idle.
+        slot-<n>.lease  Exclusively created by the kernel which leased, starts or
+                        stops the session in slot n.
+
+    1. lease: Leases an idle session, or starts a session in a free slot if none is
+       idle. Waits for a session to be released once max_size sessions are in use.
+    2. release: Returns the session to the pool, or shuts it down (recycles it) if
+       it cannot be reused.
+    3. maintain: Starts sessions until min_size sessions are idle, and shuts down
+       sessions which are idle for longer than idle_timeout while more than
+       min_size sessions are idle.
+
+    Args:
+        parent_pid (str): PID of the Jupyter server, which owns the sessions of the pool.
+        base_url_prefix (str, optional): Base URL of the Jupyter server. Defaults to "".
+        min_size (int, optional): Number of idle sessions kept ready. Defaults to 1.
+        max_size (int, optional): Maximum number of sessions. Defaults to 4.
+        idle_timeout (float, optional): Time in seconds after which sessions above
+            min_size are shut down. Defaults to 600.
+        pool_dir (str, optional): Folder in which the state of the pool is kept.
+            Defaults to a folder in the temporary folder for each Jupyter server.
+        lease_timeout (float, optional): Time in seconds for which lease waits for
+            a session. Defaults to the process startup timeout of matlab-proxy.
+        logger (Logger, optional): Instance of Logger. Defaults to _logger.
+    """
+
+    def __init__(
+        self,
+        parent_pid,
+        base_url_prefix="",
+        min_size=1,
+        max_size=4,
+        idle_timeout=600,
+        pool_dir=None,
+        lease_timeout=_LEASE_TIMEOUT,
+        logger=_logger,
+    ):
+        self.logger = logger
+        self.parent_pid = parent_pid
+        self.base_url_prefix = base_url_prefix
+        self.max_size = max(max_size, 1)
+        self.min_size = min(max(min_size, 0), self.max_size)
+        self.idle_timeout = idle_timeout
+        self.lease_timeout = lease_timeout
+        self.pool_dir = Path(
+            pool_dir
+            or Path(tempfile.gettempdir()) / f"jupyter_matlab_kernel_pool_{parent_pid}"
+        )
+        self.pool_dir.mkdir(parents=True, exist_ok=True)
+
+        # Operations on the pool performed by this kernel
+        self._counters = {
+            "warm_leases": 0,
+            "cold_leases": 0,
+            "returned": 0,
+            "recycled": 0,
+            "started": 0,
+            "reaped": 0,
+            "reattached": 0,
+        }
+
+    @property
+    def counters(self):
+        """Number of warm and cold leases, sessions returned, recycled, started, reaped and reattached by this kernel."""
+        return dict(self._counters)
+
+    async def lease(self, owner):
+        """
+        Leases an idle session of the pool, starting one if none is idle. A restarted
+        kernel leases the session which it had leased before the restart again.
+
+        Args:
+            owner (str): Identifier of the kernel which leases the session.
+
+        Returns:
+            MATLABLease: The leased session.
+
+        Raises:
+            MATLABConnectionError: If the session could not be started, or all
+                sessions stayed in use for longer than the lease timeout.
+        """
+        start_time = time.monotonic()
+        lease = self._reattach(owner)
+        if lease is not None:
+            return lease
+
+        while True:
+            for slot, server in self._get_idle_sessions():
+                if self._claim(slot, owner):
+                    self._count("warm_leases")
+                    lease = MATLABLease(
+                        slot, server, True, time.monotonic() - start_time
+                    )
+                    self.logger.debug(f"Leased MATLAB session: {lease.stats}")
+                    return lease
+
+            for slot in self._get_free_slots():
+                if self._claim(slot, owner):
+                    try:
+                        server = await self._start_session(slot)
+                    except BaseException:
+                        # Also release the slot if the kernel stops waiting.
+                        self._unclaim(slot)
+                        raise
+                    self._count("cold_leases")
+                    lease = MATLABLease(
+                        slot, server, False, time.monotonic() - start_time
+                    )
+                    self.logger.debug(f"Leased MATLAB session: {lease.stats}")
+                    return lease
+
+            if time.monotonic() - start_time >= self.lease_timeout:
+                raise MATLABConnectionError(
+                    f"All {self.max_size} MATLAB sessions of the pool are in use."
+                )
+            await asyncio.sleep(_LEASE_RETRY_INTERVAL)
+
+    async def release(self, lease, recycle=False):
+        """
+        Returns a leased session to the pool.
+
+        Args:
+            lease (MATLABLease): The leased session.
+            recycle (bool, optional): Shut down the session instead of returning it,
+                for example if its state could not be reset. Defaults to False.
+        """
+        try:
+            if recycle:
+                await self._stop_session(lease.slot, lease.server)
+                self._count("recycled")
+            else:
+                # Mark the session as idle from now on.
+                os.utime(self._get_session_path(lease.slot))
+                self._count("returned")
+        finally:
+            self._unclaim(lease.slot)
+        self.logger.info(
+            f"Released MATLAB session of the pool (recycled: {recycle}): {lease.stats}"
+        )
+
+    async def replenish(self, owner):
+        """
+        Starts sessions until min_size sessions are idle.
+
+        Args:
+            owner (str): Identifier of the kernel which starts the sessions.
+        """
+        idle_count = len(self._get_idle_sessions())
+        for slot in self._get_free_slots():
+            if idle_count >= self.min_size:
+                break
+            if self._claim(slot, owner):
+                try:
+                    await self._start_session(slot)
+                finally:
+                    self._unclaim(slot)
+                idle_count += 1
+
+    async def reap_idle(self, owner):
+        """
+        Shuts down the sessions which are idle for longer than idle_timeout, while
+        more than min_size sessions are idle.
+
+        Args:
+            owner (str): Identifier of the kernel which shuts down the sessions.
+        """
+        idle_sessions = self._get_idle_sessions()
+        # Reap the sessions which are idle for the longest time first.
+        idle_sessions.sort(key=lambda session: self._get_idle_time(session[0]))
+        while len(idle_sessions) > self.min_size:
+            slot, server = idle_sessions.pop()
+            if self._get_idle_time(slot) < self.idle_timeout:
+                break
+            if self._claim(slot, owner):
+                try:
+                    await self._stop_session(slot, server)
+                    self._count("reaped")
+                finally:
+                    self._unclaim(slot)
+
+    async def maintain(self, owner):
+        """
+        Replenishes the pool and reaps idle sessions until cancelled.
+
+        Args:
+            owner (str): Identifier of the kernel which maintains the pool.
+        """
+        interval = min(self.idle_timeout, _MAINTENANCE_INTERVAL)
+        while True:
+            try:
+                await self.replenish(owner)
+                await self.reap_idle(owner)
+            except Exception as e:
+                self.logger.error(f"Unable to maintain the MATLAB pool: {e}")
+            await asyncio.sleep(interval)
+
+    # Helper functions
+
+    def _reattach(self, owner):
+        """
+        Takes over the session which is still leased by a previous process of the same
+        kernel, which detached from it when the kernel was restarted.
+
+        Returns:
+            MATLABLease: The session, or None if the kernel has not leased a session.
+        """
+        for slot in range(self.max_size):
+            lease = _read_json(self._get_lease_path(slot))
+            if lease is None or lease.get("owner") != owner:
+                continue
+            server = self._get_session(slot)
+            if server is None:
+                continue
+
+            # Replace the lease atomically, as other kernels may take over stale leases.
+            path = self._get_lease_path(slot)
+            tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+            tmp_path.write_text(
+                json.dumps({"owner": owner, "pid": os.getpid(), "time": time.time()})
+            )
+            os.replace(tmp_path, path)
+            self._count("reattached")
+            lease = MATLABLease(slot, server, True, 0)
+            self.logger.debug(f"Reattached to MATLAB session: {lease.stats}")
+            return lease
+        return None
+
+    def _get_session_path(self, slot):
+        return self.pool_dir / f"slot-{slot}.json"
+
+    def _get_lease_path(self, slot):
+        return self.pool_dir / f"slot-{slot}.lease"
+
+    def _get_caller_id(self, slot):
+        return f"{_POOL_CALLER_ID_PREFIX}{slot}"
+
+    def _get_session(self, slot):
+        """Returns the server of the session in a slot, or None if it is not running."""
+        server = _read_json(self._get_session_path(slot))
+        if server is None or not _is_process_alive(server.get("pid")):
+            return None
+        return server
+
+    def _get_idle_time(self, slot):
+        try:
+            return time.time() - self._get_session_path(slot).stat().st_mtime
+        except OSError:
+            return 0
+
+    def _is_claimed(self, slot):
+        lease = _read_json(self._get_lease_path(slot))
+        if lease is None:
+            # The lease file is being written, or does not exist.
+            return self._get_lease_path(slot).exists()
+        return _is_process_alive(lease.get("pid"))
+
+    def _get_idle_sessions(self):
+        """Returns the slot and server of the sessions which are running and not leased."""
+        sessions = []
+        for slot in range(self.max_size):
+            server = self._get_session(slot)
+            if server is not None and not self._is_claimed(slot):
+                sessions.append((slot, server))
+        return sessions
+
+    def _get_free_slots(self):
+        """Returns the slots in which no session is running or being started."""
+        return [
+            slot
+            for slot in range(self.max_size)
+            if self._get_session(slot) is None and not self._is_claimed(slot)
+        ]
+
+    def _claim(self, slot, owner):
+        """
+        Claims a slot for exclusive use by this kernel. Leases held by kernels which
+        are no longer running are taken over.
+
+        Returns:
+            bool: True if the slot was claimed.
+        """
+        path = self._get_lease_path(slot)
+        if path.exists() and not self._is_claimed(slot):
+            self.logger.debug(f"Taking over the stale lease of slot {slot}")
+            self._unclaim(slot)
+
+        try:
+            fd = os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except FileExistsError:
+            return False
+        with os.fdopen(fd, "w") as f:
+            json.dump({"owner": owner, "pid": os.getpid(), "time": time.time()}, f)
+        return True
+
+    def _unclaim(self, slot):
+        try:
+            self._get_lease_path(slot).unlink()
+        except FileNotFoundError:
+            pass
+
+    async def _start_session(self, slot):
+        """Starts an isolated MATLAB session in a claimed slot."""
+        caller_id = self._get_caller_id(slot)
+        self.logger.debug(f"Starting MATLAB session {caller_id} of the pool")
+        server = await mpm_lib.start_matlab_proxy_for_kernel(
+            caller_id=caller_id,
+            parent_id=self.parent_pid,
+            is_shared_matlab=False,
+            base_url_prefix=self.base_url_prefix,
+        )
+        err = server.get("errors")
+        if err:
+            raise MATLABConnectionError(err)
+
+        # Write the state atomically, as it is read by other kernels.
+        path = self._get_session_path(slot)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(server))
+        os.replace(tmp_path, path)
+        self._count("started")
+        return server
+
+    async def _stop_session(self, slot, server):
+        """Shuts down the MATLAB session in a claimed slot."""
+        self.logger.debug(f"Shutting down MATLAB session {slot} of the pool")
+        try:
+            await mpm_lib.shutdown(
+                self.parent_pid, self._get_caller_id(slot), server.get("mpm_auth_token")
+            )
+        finally:
+            try:
+                self._get_session_path(slot).unlink()
+            except FileNotFoundError:
+                pass
+
+    def _count(self, counter):
+        self._counters[counter] += 1
+        self.logger.debug(f"MATLAB pool: {self._counters}")
@@ -4,12 +4,21 @@
 MATLAB Proxy Manager to manage interactions with matlab-proxy & MATLAB.
 """
 
+import asyncio
+import shutil
+import tempfile
+import time
 from logging import Logger
+from pathlib import Path
 
 import matlab_proxy_manager.lib.api as mpm_lib
 from requests.exceptions import HTTPError
 
 from jupyter_matlab_kernel import base_kernel as base
+from jupyter_matlab_kernel import environment_variables as mwi_env
+from jupyter_matlab_kernel import mwi_logger
+from jupyter_matlab_kernel import startup_monitor
+from jupyter_matlab_kernel.matlab_pool import MATLABPool
 from jupyter_matlab_kernel.mwi_comm_helpers import MWICommHelper
 from jupyter_matlab_kernel.mwi_exceptions import MATLABConnectionError
 
@@ -21,6 +30,16 @@ class MATLABKernelUsingMPM(base.BaseMATLABKernel):
         # Used to detect if this Kernel has been assigned a MATLAB-proxy server or not
         self.is_matlab_assigned = False
 
+        # Assigns a MATLAB-proxy server to this Kernel in the background. When eager
+        # assignment is enabled, it is started along with the Kernel instead of
+        # during the first execution request.
+        self.eager_matlab_assignment = mwi_env.is_eager_matlab_assignment_enabled()
+        self._matlab_assignment_task = None
+
+        # Keep MATLAB running when the kernel is restarted, so that the restarted
+        # kernel does not wait for MATLAB to start again.
+        self.fast_restart = mwi_env.is_fast_restart_enabled()
+
         # Serves as the auth token to secure communication between Jupyter Server and MATLAB proxy manager
         self.mpm_auth_token = None
 
@@ -32,6 +51,41 @@ class MATLABKernelUsingMPM(base.BaseMATLABKernel):
         # Required for performing licensing using Jupyter Server
         self.jupyter_base_url = base._fetch_jupyter_base_url(self.parent_pid, self.log)
 
+        # Kernels lease an isolated MATLAB from a warm pool shared by the kernels of
+        # the Jupyter server, instead of sharing a single MATLAB, when it is enabled.
+        self.matlab_pool = None
+        if mwi_env.is_matlab_pool_enabled():
+            self.matlab_pool = MATLABPool(
+                self.parent_pid,
+                self.jupyter_base_url,
+                logger=self.log,
+                **mwi_env.get_matlab_pool_options(),
+            )
+        self.matlab_lease = None
+        self._pool_maintenance_task = None
+
+        # Saves the workspace and releases MATLAB after the kernel has been idle for
+        # this many seconds. The workspace is restored on the next execution request.
+        self.hibernation_timeout = mwi_env.get_hibernation_timeout()
+        self.hibernation_stats = {}
+        self.workspace_snapshot = None
+        self._snapshot_dir = None
+        self._hibernation_task = None
+        self._is_hibernating = False
+
+    def start(self):
+        """
+        Starts the kernel, and assigns a MATLAB-proxy server to it in the background
+        if eager assignment is enabled.
+        """
+        super().start()
+        if self.matlab_pool is not None:
+            self._pool_maintenance_task = asyncio.ensure_future(
+                self.matlab_pool.maintain(self.kernel_id)
+            )
+        if self.eager_matlab_assignment:
+            self._start_matlab_assignment()
+
     # ipykernel Interface API
     # https://ipython.readthedocs.io/en/stable/development/wrapperkernels.html
 
@@ -49,55 +103,262 @@ class MATLABKernelUsingMPM(base.BaseMATLABKernel):
         Used by ipykernel infrastructure for execution. For more info, look at
         https://jupyter-client.readthedocs.io/en/stable/messaging.html#execute
         """
-        self.log.debug(f"Received execution request from Jupyter with code:\n{code}")
+        self.log.debug(
+            "Received execution request from Jupyter with code:\n%s",
+            mwi_logger.payload(code, "code"),
+        )
+
+        # The kernel is no longer idle. Waits for the hibernation to finish if it
+        # has started already.
+        await self._stop_hibernation_timer()
 
         # Starts the matlab proxy process if this kernel hasn't yet been assigned a
         # matlab proxy and sets the attributes on kernel to talk to the correct backend.
+        # Waits for the assignment instead if it was started when the kernel started.
         if not self.is_matlab_assigned:
-            self.log.debug("Starting matlab-proxy")
-            await self._start_matlab_proxy_and_comm_helper()
-            self.is_matlab_assigned = True
+            await self._start_matlab_assignment()
 
-        return await super().do_execute(
-            code=code,
-            silent=silent,
-            store_history=store_history,
-            user_expressions=user_expressions,
-            allow_stdin=allow_stdin,
-            cell_id=cell_id,
-        )
+        try:
+            return await super().do_execute(
+                code=code,
+                silent=silent,
+                store_history=store_history,
+                user_expressions=user_expressions,
+                allow_stdin=allow_stdin,
+                cell_id=cell_id,
+            )
+        finally:
+            self._start_hibernation_timer()
 
     async def do_shutdown(self, restart):
         self.log.debug("Received shutdown request from Jupyter")
+        if self._hibernation_task is not None:
+            self._cancel_on_shell_loop(self._hibernation_task)
+        if self._snapshot_dir is not None:
+            shutil.rmtree(self._snapshot_dir, ignore_errors=True)
+
+        if (
+            self._matlab_assignment_task is not None
+            and not self._matlab_assignment_task.done()
+        ):
+            # matlab-proxy may have been started already, so it is shut down below.
+            self._cancel_on_shell_loop(self._matlab_assignment_task)
+            self.is_matlab_assigned = True
+
+        if self._pool_maintenance_task is not None:
+            self._cancel_on_shell_loop(self._pool_maintenance_task)
+
         if self.is_matlab_assigned:
-            try:
-                # Cleans up internal live editor state, client session
-                await self.mwi_comm_helper.send_shutdown_request_to_matlab()
-                await self.mwi_comm_helper.disconnect()
-
-            except (MATLABConnectionError, HTTPError) as e:
-                self.log.error(
-                    f"Exception occurred while sending shutdown request to MATLAB:\n{e}"
-                )
-            except Exception as e:
-                self.log.debug("Exception during shutdown", e)
-            finally:
-                # Shuts down matlab assigned to this Kernel (based on satisfying certain criteria)
-                await mpm_lib.shutdown(
-                    self.parent_pid, self.kernel_id, self.mpm_auth_token
-                )
-                self.is_matlab_assigned = False
+            await self._release_matlab(detach=restart and self.fast_restart)
 
         return super().do_shutdown(restart)
 
     async def perform_startup_checks(self):
-        """Overriding base function to provide a different iframe source"""
+        """
+        Overriding base function to provide a different iframe source, and to restore
+        the workspace saved before the kernel released its previous MATLAB.
+        """
         await super().perform_startup_checks(
             self.jupyter_base_url, f"{self.matlab_proxy_base_url}/"
         )
+        if self.workspace_snapshot is not None:
+            await self._restore_workspace()
 
     # Helper functions
 
+    def _start_matlab_assignment(self):
+        """
+        Starts assigning a MATLAB-proxy server to this kernel in the background,
+        unless the assignment is already in progress or completed. A failed
+        assignment is retried.
+
+        Returns:
+            Task: The task which completes once a MATLAB-proxy server is assigned.
+        """
+        task = self._matlab_assignment_task
+        if task is None or (task.done() and not self.is_matlab_assigned):
+            self._matlab_assignment_task = asyncio.ensure_future(self._assign_matlab())
+        return self._matlab_assignment_task
+
+    async def _assign_matlab(self):
+        """
+        Starts matlab-proxy, connects to it and follows the startup of MATLAB in the
+        background. Errors are stored in startup_error, and displayed by the next
+        execution request.
+        """
+        self.log.debug("Starting matlab-proxy")
+        await self._start_matlab_proxy_and_comm_helper()
+        self.is_matlab_assigned = True
+        self.log.debug("Assigned matlab-proxy to the kernel")
+
+        # Requests which do not need MATLAB, such as completion requests, are
+        # answered without waiting for MATLAB while the startup monitor is not up.
+        self._start_startup_monitor()
+
+    async def _release_matlab(self, detach=False):
+        """
+        Releases the MATLAB assigned to this kernel. A leased MATLAB is returned to the
+        pool, otherwise the proxy manager shuts down matlab-proxy unless it is used
+        by other kernels.
+
+        Args:
+            detach (bool, optional): Keep MATLAB running, so that the restarted kernel
+                attaches to it again. The state of a leased MATLAB is reset, while a
+                shared MATLAB keeps the workspace of the other kernels. Defaults to False.
+        """
+        # A leased MATLAB is shut down instead of being returned to the pool, and a
+        # MATLAB is not kept for the restarted kernel, unless it was cleaned up.
+        recycle = True
+        try:
+            # Cleans up internal live editor state, client session. Only the workspace
+            # of an isolated MATLAB is reset, since a shared MATLAB is used by the
+            # other notebooks of the Jupyter server.
+            reset = self.matlab_lease is not None
+            options = {"resetWorkspace": True} if reset else None
+            result = await self.mwi_comm_helper.send_shutdown_request_to_matlab(options)
+            # MATLAB errors are returned as outputs, so a reset is trusted only if
+            # jupyter.shutdown confirms it.
+            recycle = self.startup_error is not None or (
+                reset and not (isinstance(result, dict) and result.get("reset") is True)
+            )
+            await self.mwi_comm_helper.disconnect()
+
+        except (MATLABConnectionError, HTTPError) as e:
+            self.log.error(
+                f"Exception occurred while sending shutdown request to MATLAB:\n{e}"
+            )
+        except Exception as e:
+            self.log.debug("Exception during shutdown", e)
+        finally:
+            if detach and not recycle:
+                # matlab-proxy and the lease are found again using the kernel ID,
+                # which is kept by Jupyter when it restarts a kernel.
+                self.log.debug("Detached from MATLAB, which is kept for the restart")
+                self.matlab_lease = None
+            elif self.matlab_lease is not None:
+                await self.matlab_pool.release(self.matlab_lease, recycle)
+                self.matlab_lease = None
+            else:
+                # Shuts down matlab assigned to this Kernel (based on satisfying certain criteria)
+                await mpm_lib.shutdown(
+                    self.parent_pid, self.kernel_id, self.mpm_auth_token
+                )
+            self.is_matlab_assigned = False
+            self._matlab_assignment_task = None
+
+    def _start_hibernation_timer(self):
+        """Hibernates the kernel once it has been idle for the hibernation timeout."""
+        if self.hibernation_timeout and self.is_matlab_assigned:
+            if self._hibernation_task is not None:
+                self._hibernation_task.cancel()
+            self._hibernation_task = asyncio.ensure_future(self._hibernate_when_idle())
+
+    async def _stop_hibernation_timer(self):
+        """Stops the hibernation timer, or waits for the hibernation if it has started."""
+        task, self._hibernation_task = self._hibernation_task, None
+        if task is None:
+            return
+        if self._is_hibernating:
+            await asyncio.shield(task)
+        else:
+            task.cancel()
+
+    async def _hibernate_when_idle(self):
+        await asyncio.sleep(self.hibernation_timeout)
+        self._is_hibernating = True
+        try:
+            await self._hibernate()
+        except Exception as e:
+            self.log.error(f"Exception occurred while hibernating:\n{e}")
+        finally:
+            self._is_hibernating = False
+
+    async def _hibernate(self):
+        """
+        Saves the base workspace to a MAT file in the snapshot folder of this kernel
+        and releases MATLAB. MATLAB is kept if the workspace could not be saved.
+        """
+        if self.startup_monitor.state != startup_monitor.UP:
+            return
+
+        if self._snapshot_dir is None:
+            self._snapshot_dir = Path(
+                tempfile.mkdtemp(
+                    prefix=f"jupyter_matlab_kernel_snapshots_{self.kernel_id}_"
+                )
+            )
+        path = str(self._snapshot_dir / "workspace.mat")
+
+        self.log.debug(f"Kernel is idle. Saving the MATLAB workspace to {path}")
+        start_time = time.monotonic()
+        info = await self.mwi_comm_helper.send_snapshot_request_to_matlab("save", path)
+        if not isinstance(info, dict):
+            self.log.error(f"Unable to save the MATLAB workspace:\n{info}")
+            return
+
+        # The workspace of a leased MATLAB is reset when it is returned to the pool,
+        # so the snapshot is restored even if the same MATLAB is leased again.
+        session_epoch = info["sessionEpoch"] if self.matlab_lease is None else None
+        self.workspace_snapshot = {"path": path, "sessionEpoch": session_epoch}
+        self.hibernation_stats["snapshot"] = {
+            "time": info["time"],
+            "total_time": time.monotonic() - start_time,
+            "bytes": info["bytes"],
+            "variables": info["variables"],
+        }
+        self.log.info(
+            "Saved %d variables (%d bytes) of the MATLAB workspace in %.2f seconds. Releasing MATLAB.",
+            info["variables"],
+            info["bytes"],
+            info["time"],
+        )
+
+        await self._release_matlab()
+        self.mwi_comm_helper = None
+        self.startup_checks_completed = False
+        self.startup_monitor.reset()
+
+    async def _restore_workspace(self):
+        """Loads the saved workspace into the reacquired MATLAB and deletes the snapshot."""
+        snapshot, self.workspace_snapshot = self.workspace_snapshot, None
+        start_time = time.monotonic()
+        try:
+            info = await self.mwi_comm_helper.send_snapshot_request_to_matlab(
+                "load", snapshot["path"], snapshot["sessionEpoch"]
+            )
+        finally:
+            Path(snapshot["path"]).unlink(missing_ok=True)
+
+        if not isinstance(info, dict):
+            self.log.error(f"Unable to restore the MATLAB workspace:\n{info}")
+            self.display_output(
+                {
+                    "type": "stream",
+                    "content": {
+                        "name": "stderr",
+                        "text": "The MATLAB workspace saved while the kernel was idle could not be restored.\n",
+                    },
+                }
+            )
+            return
+
+        self.hibernation_stats["restore"] = {
+            "time": info["time"],
+            "total_time": time.monotonic() - start_time,
+            "bytes": info["bytes"],
+            "variables": info["variables"],
+            "restored": info["restored"],
+        }
+        if info["restored"]:
+            self.log.info(
+                "Restored %d variables (%d bytes) of the MATLAB workspace in %.2f seconds.",
+                info["variables"],
+                info["bytes"],
+                info["time"],
+            )
+        else:
+            self.log.info("MATLAB kept running while the kernel was idle.")
+
     async def _start_matlab_proxy_and_comm_helper(self) -> None:
         """
         Starts the MATLAB proxy using the proxy manager and fetches its status.
@@ -108,9 +369,10 @@ class MATLABKernelUsingMPM(base.BaseMATLABKernel):
                 self.matlab_proxy_base_url,
                 headers,
                 self.mpm_auth_token,
+                unix_socket,
             ) = await self._initialize_matlab_proxy_with_mpm(self.log)
 
-            await self._initialize_mwi_comm_helper(murl, headers)
+            await self._initialize_mwi_comm_helper(murl, headers, unix_socket)
         except MATLABConnectionError as err:
             self.startup_error = err
 
@@ -118,7 +380,8 @@ class MATLABKernelUsingMPM(base.BaseMATLABKernel):
         """
         Initializes the MATLAB proxy process using the Proxy Manager (MPM) library.
 
-        Calls proxy manager to start the MATLAB proxy process for this kernel.
+        Calls proxy manager to start the MATLAB proxy process for this kernel, or
+        leases an isolated MATLAB from the pool if it is enabled.
 
         Args:
             logger (Logger): The logger instance
@@ -129,17 +392,22 @@ class MATLABKernelUsingMPM(base.BaseMATLABKernel):
                 - base_url (str): The base URL of the MATLAB proxy server
                 - headers (dict): The headers required for communication with the MATLAB proxy
                 - mpm_auth_token (str): Token for authentication between kernel and proxy manager
+                - unix_socket (str): Unix domain socket of the MATLAB proxy, if advertised by the proxy manager
 
         Raises:
             MATLABConnectionError: If the MATLAB proxy process could not be started
         """
         try:
-            response = await mpm_lib.start_matlab_proxy_for_kernel(
-                caller_id=self.kernel_id,
-                parent_id=self.parent_pid,
-                is_shared_matlab=True,
-                base_url_prefix=self.jupyter_base_url,
-            )
+            if self.matlab_pool is not None:
+                self.matlab_lease = await self.matlab_pool.lease(self.kernel_id)
+                response = self.matlab_lease.server
+            else:
+                response = await mpm_lib.start_matlab_proxy_for_kernel(
+                    caller_id=self.kernel_id,
+                    parent_id=self.parent_pid,
+                    is_shared_matlab=True,
+                    base_url_prefix=self.jupyter_base_url,
+                )
             err = response.get("errors")
             if err:
                 raise MATLABConnectionError(err)
@@ -148,19 +416,18 @@ class MATLABKernelUsingMPM(base.BaseMATLABKernel):
                 response.get("mwi_base_url"),
                 response.get("headers"),
                 response.get("mpm_auth_token"),
+                response.get("unix_socket"),
             )
         except Exception as e:
             _logger.error(f"MATLAB Kernel could not start matlab-proxy, Reason: {e}")
-            raise MATLABConnectionError(
-                f"""
+            raise MATLABConnectionError(f"""
                 Error: MATLAB Kernel could not start the MATLAB proxy process.
                 Reason: {e}
                 Resolution: Run the troubleshooting script described in the file `troubleshooting.md`.
                 If the issue persists, create an issue on Github: https://github.com/mathworks/jupyter-matlab-proxy/issues.
-                """
-            ) from e
+                """) from e
 
-    async def _initialize_mwi_comm_helper(self, murl, headers):
+    async def _initialize_mwi_comm_helper(self, murl, headers, unix_socket=None):
         """
         Initializes the MWICommHelper for managing communication with a specified URL.
 
@@ -171,11 +438,18 @@ class MATLABKernelUsingMPM(base.BaseMATLABKernel):
         Parameters:
         - murl (str): The message URL used for communication.
         - headers (dict): A dictionary of headers to include in the communication setup.
+        - unix_socket (str, optional): Unix domain socket of a co-located MATLAB proxy.
         """
         shell_loop = self.io_loop.asyncio_loop
         control_loop = self.control_thread.io_loop.asyncio_loop
         self.mwi_comm_helper = MWICommHelper(
-            self.kernel_id, murl, shell_loop, control_loop, headers, self.log
+            self.kernel_id,
+            murl,
+            shell_loop,
+            control_loop,
+            headers,
+            self.log,
+            unix_socket=unix_socket,
         )
         await self.mwi_comm_helper.connect()
 
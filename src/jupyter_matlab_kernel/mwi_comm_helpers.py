@@ -1,9 +1,12 @@
-# Copyright 2023-2024 The MathWorks, Inc.
+# Copyright 2023-2025 The MathWorks, Inc.
 # Helper functions to communicate with matlab-proxy and MATLAB
 
+import asyncio
+import contextlib
 import http
 import json
 import pathlib
+import random
 
 import aiohttp
 from matlab_proxy.util.mwi.embedded_connector.helpers import (
@@ -12,11 +15,45 @@ from matlab_proxy.util.mwi.embedded_connector.helpers import (
     get_mvm_endpoint,
 )
 
-from jupyter_matlab_kernel import mwi_logger
-from jupyter_matlab_kernel.mwi_exceptions import MATLABConnectionError
+from jupyter_matlab_kernel import environment_variables as mwi_env
+from jupyter_matlab_kernel import json_codec, mwi_logger
+from jupyter_matlab_kernel import request_scheduler
+from jupyter_matlab_kernel.mwi_exceptions import (
+    MATLABConnectionError,
+    MATLABSessionChangedError,
+)
+from jupyter_matlab_kernel.request_scheduler import RequestScheduler
 
 _logger = mwi_logger.get()
 
+# Folder containing the MATLAB code shipped with the kernel
+_KERNEL_MATLAB_CODE_PATH = str(pathlib.Path(__file__).parent / "matlab")
+
+# Bounds (in seconds) of the interval between two requests for streamed outputs
+_STREAM_POLL_MIN_INTERVAL = 0.05
+_STREAM_POLL_MAX_INTERVAL = 1
+
+# Bounds (in seconds) of the interval between two requests for the matlab-proxy
+# status, when matlab-proxy does not push status updates.
+_STATUS_POLL_MIN_INTERVAL = 0.25
+_STATUS_POLL_MAX_INTERVAL = 2
+
+# Content type of a response which pushes status updates as server-sent events
+_EVENT_STREAM_CONTENT_TYPE = "text/event-stream"
+
+
+async def _read_json_response(resp):
+    """Decodes the JSON body of a response directly from its bytes."""
+    return json_codec.loads(await resp.read())
+
+
+def _get_json_request_body(req_body):
+    """Returns the keyword arguments to send req_body as the JSON body of a request."""
+    return {
+        "data": json_codec.dumps(req_body),
+        "headers": {"Content-Type": "application/json"},
+    }
+
 
 def check_licensing_status(data):
     licensing_status = data["licensing"] is not None
@@ -27,9 +64,29 @@ def check_licensing_status(data):
     return licensing_status
 
 
+def _is_undefined_function_fault(fault_message, fname):
+    """Checks if an FEval fault was caused by MATLAB not being able to find fname."""
+    return "Undefined function" in fault_message and fname in fault_message
+
+
+def _get_execution_inputs(code, kernel_id, options):
+    """Returns the inputs of an execution request, with the options encoded as JSON."""
+    inputs = [code, kernel_id]
+    if options:
+        inputs.append(json.dumps(options))
+    return inputs
+
+
 class MWICommHelper:
     def __init__(
-        self, kernel_id, url, shell_loop, control_loop, headers=None, logger=_logger
+        self,
+        kernel_id,
+        url,
+        shell_loop,
+        control_loop,
+        headers=None,
+        logger=_logger,
+        unix_socket=None,
     ) -> None:
         """_summary_
 
@@ -40,6 +97,8 @@ class MWICommHelper:
             control_loop : event loop corresponding to the Control channel in Jupyter Messaging Protocol
             headers (dict, optional): Headers containing auth information for communication with matlab-proxy server. Defaults to None.
             logger (Logger, optional): Instance of Logger. Defaults to _logger.
+            unix_socket (str, optional): Path of a Unix domain socket on which a co-located matlab-proxy
+                server can be reached. When set, it is used instead of TCP. Defaults to None.
         """
         self.kernel_id = kernel_id
         self.url = url
@@ -47,9 +106,22 @@ class MWICommHelper:
         self._control_loop = control_loop
         self.headers = headers
         self.logger = logger
+        self.unix_socket = unix_socket
         self._http_shell_client = None
         self._http_control_client = None
 
+        # Capabilities record of the MATLAB session returned by the one-time handshake.
+        # It is reset whenever MATLAB is found to be unavailable or restarted.
+        self._session_capabilities = None
+
+        # Whether matlab-proxy pushes status updates, or None until it is known
+        self._is_status_push_supported = None
+
+        # Serves the requests of the kernels which share this MATLAB in a fair order
+        self.request_scheduler = None
+        if mwi_env.is_request_scheduling_enabled():
+            self.request_scheduler = RequestScheduler(url, kernel_id, logger=logger)
+
     async def _create_http_session(self, loop):
         """Helper function to create a aiohttp ClientSession which uses a given asyncio event loop
 
@@ -62,13 +134,23 @@ class MWICommHelper:
         # Disable timeout as the execution of MATLAB code might be longer.
         timeout = aiohttp.ClientTimeout(total=None)
 
+        # A co-located matlab-proxy server is reached over its Unix domain socket,
+        # which skips TCP as well as the lookup of proxies from the environment.
+        if self.unix_socket:
+            self.logger.debug(f"Using Unix domain socket: {self.unix_socket}")
+            connector = aiohttp.UnixConnector(path=self.unix_socket, loop=loop)
+            trust_env = False
+        else:
+            connector = aiohttp.TCPConnector(ssl=False, loop=loop)
+            trust_env = True
+
         # Creation of ClientSession needs to be done in an async function. We cannot
         # specify base url as it may contain additional path (such as in jupyterhub.com/user/matlab)
         # which is not supported by ClientSession
         return aiohttp.ClientSession(
-            connector=aiohttp.TCPConnector(ssl=False, loop=loop),
+            connector=connector,
             headers=self.headers,
-            trust_env=True,
+            trust_env=trust_env,
             timeout=timeout,
         )
 
@@ -88,6 +170,20 @@ class MWICommHelper:
         if self._http_control_client:
             await self._http_control_client.close()
 
+    @property
+    def session_capabilities(self):
+        """Capabilities record of the MATLAB session, or None before the handshake."""
+        return self._session_capabilities
+
+    def invalidate_session(self):
+        """
+        Discards the cached capabilities record, so that the next request to MATLAB
+        performs the session handshake again.
+        """
+        if self._session_capabilities is not None:
+            self.logger.debug("Invalidating cached MATLAB session capabilities")
+        self._session_capabilities = None
+
     async def fetch_matlab_proxy_status(self):
         """
         Sends HTTP request to /get_status endpoint of matlab-proxy and returns
@@ -107,23 +203,102 @@ class MWICommHelper:
         resp = await self._http_shell_client.get(self.url + "/get_status")
         self.logger.debug(f"Received status code: {resp.status}")
         if resp.status == http.HTTPStatus.OK:
-            data = await resp.json()
-            self.logger.debug(f"Response:\n{data}")
-            is_matlab_licensed = check_licensing_status(data)
-
-            matlab_status = data["matlab"]["status"]
-            matlab_proxy_has_error = data["error"] is not None
-            return is_matlab_licensed, matlab_status, matlab_proxy_has_error
+            data = await _read_json_response(resp)
+            self.logger.debug("Response:\n%s", mwi_logger.payload(data, "response"))
+            return self._process_matlab_proxy_status(data)
         else:
             self.logger.error("Error occurred during communication with matlab-proxy")
             resp.raise_for_status()
 
-    async def send_execution_request_to_matlab(self, code):
+    async def subscribe_to_matlab_proxy_status(self):
+        """
+        Yields the status of matlab-proxy whenever it is received, until the caller
+        stops iterating.
+
+        Status updates are received as server-sent events when matlab-proxy pushes
+        them in response to a status request accepting "text/event-stream". Otherwise
+        the status is polled, quickly after a change of status and with an
+        increasing interval while it stays the same.
+
+        Yields:
+            Tuple (bool, string, bool): Same as fetch_matlab_proxy_status.
+
+        Raises:
+            HTTPError: Occurs when connection to matlab-proxy cannot be established.
+        """
+        poll_interval = _STATUS_POLL_MIN_INTERVAL
+        status = last_status = None
+        while True:
+            if self._is_status_push_supported is False:
+                status = await self.fetch_matlab_proxy_status()
+                yield status
+            else:
+                async for status in self._receive_matlab_proxy_status_events():
+                    yield status
+
+            # Jitter spreads out the requests of kernels which started together.
+            if status != last_status:
+                poll_interval = _STATUS_POLL_MIN_INTERVAL
+            else:
+                poll_interval = min(poll_interval * 1.5, _STATUS_POLL_MAX_INTERVAL)
+            last_status = status
+            await asyncio.sleep(poll_interval * random.uniform(0.9, 1.1))
+
+    async def _receive_matlab_proxy_status_events(self):
+        """
+        Requests status updates pushed by matlab-proxy and yields them until the
+        event stream is closed. Yields the status only once if matlab-proxy
+        responds with a single status instead.
+        """
+        self.logger.debug("Subscribing to matlab-proxy status")
+        resp = await self._http_shell_client.get(
+            self.url + "/get_status",
+            headers={"Accept": _EVENT_STREAM_CONTENT_TYPE},
+        )
+        self.logger.debug(f"Received status code: {resp.status}")
+        if resp.status != http.HTTPStatus.OK:
+            self.logger.error("Error occurred during communication with matlab-proxy")
+            resp.raise_for_status()
+
+        self._is_status_push_supported = resp.content_type == _EVENT_STREAM_CONTENT_TYPE
+        if not self._is_status_push_supported:
+            self.logger.debug("matlab-proxy does not push status updates")
+            yield self._process_matlab_proxy_status(await _read_json_response(resp))
+            return
+
+        async with resp:
+            async for line in resp.content:
+                line = line.strip()
+                if line.startswith(b"data:"):
+                    data = json_codec.loads(line[len(b"data:") :])
+                    self.logger.debug(
+                        "Received status update:\n%s",
+                        mwi_logger.payload(data, "response"),
+                    )
+                    yield self._process_matlab_proxy_status(data)
+        self.logger.debug("matlab-proxy closed the status event stream")
+
+    def _process_matlab_proxy_status(self, data):
+        """Extracts the license and MATLAB status from a status returned by matlab-proxy."""
+        is_matlab_licensed = check_licensing_status(data)
+
+        matlab_status = data["matlab"]["status"]
+        matlab_proxy_has_error = data["error"] is not None
+
+        # A MATLAB which is not up cannot hold on to a previous handshake
+        if matlab_status != "up":
+            self.invalidate_session()
+        return is_matlab_licensed, matlab_status, matlab_proxy_has_error
+
+    async def send_execution_request_to_matlab(self, code, options=None, on_wait=None):
         """
         Evaluate MATLAB code and capture results.
 
         Args:
             code (string): MATLAB code to be evaluated
+            options (dict, optional): Execution options sent to jupyter.execute. Defaults to None.
+            on_wait (Callable, optional): Called with the number of requests ahead of this
+                request while it waits for a MATLAB shared with other kernels. Defaults to None.
 
         Returns:
             List(dict): list of outputs captured during evaluation.
@@ -132,10 +307,76 @@ class MWICommHelper:
             HTTPStatusError: Occurs when connection to matlab-proxy cannot be established.
         """
         self.logger.debug("Sending execution request to MATLAB")
-        return await self._send_jupyter_request_to_matlab(
-            "execute", [code, self.kernel_id], self._http_shell_client
+        async with self._schedule_request(request_scheduler.EXECUTION, on_wait):
+            return await self._send_jupyter_request_to_matlab(
+                "execute",
+                _get_execution_inputs(code, self.kernel_id, options),
+                self._http_shell_client,
+            )
+
+    async def stream_execution_request_to_matlab(
+        self, code, options=None, on_wait=None
+    ):
+        """
+        Evaluate MATLAB code and yield the outputs while MATLAB is still executing it.
+
+        MATLAB executes the code in the background and appends the outputs to a
+        queue for this kernel. The queue is drained using the HTTP session of the
+        control channel until MATLAB reports that the execution has finished.
+
+        Args:
+            code (string): MATLAB code to be evaluated
+            options (dict, optional): Execution options sent to jupyter.execute. Defaults to None.
+            on_wait (Callable, optional): Called with the number of requests ahead of this
+                request while it waits for a MATLAB shared with other kernels. Defaults to None.
+
+        Yields:
+            dict: The next output captured during evaluation.
+
+        Raises:
+            HTTPStatusError: Occurs when connection to matlab-proxy cannot be established.
+        """
+        self.logger.debug("Sending streaming execution request to MATLAB")
+        # MATLAB is busy until the execution has finished, so the turn of this kernel
+        # lasts until the last output is received.
+        async with self._schedule_request(request_scheduler.EXECUTION, on_wait):
+            async for output in self._stream_execution_outputs(code, options):
+                yield output
+
+    async def _stream_execution_outputs(self, code, options):
+        """Sends a streaming execution request and yields the outputs from the queue of this kernel."""
+        await self._send_jupyter_request_to_matlab(
+            "execute_stream",
+            _get_execution_inputs(code, self.kernel_id, options),
+            self._http_shell_client,
         )
 
+        poll_interval = _STREAM_POLL_MIN_INTERVAL
+        while True:
+            record = await self._run_on_control_loop(
+                self._send_jupyter_request_to_matlab(
+                    "poll_outputs", [self.kernel_id], self._http_control_client
+                )
+            )
+            if not isinstance(record, dict):
+                self.logger.debug("No output queue found for this kernel in MATLAB")
+                break
+
+            outputs = record.get("outputs") or []
+            for output in outputs:
+                yield output
+
+            if record.get("done", True):
+                self.logger.debug("Streaming execution finished in MATLAB")
+                break
+
+            # Poll quickly while outputs are arriving and back off otherwise.
+            if outputs:
+                poll_interval = _STREAM_POLL_MIN_INTERVAL
+            else:
+                poll_interval = min(poll_interval * 2, _STREAM_POLL_MAX_INTERVAL)
+            await asyncio.sleep(poll_interval)
+
     async def send_completion_request_to_matlab(self, code, cursor_pos):
         """
         Fetch Tab completion results.
@@ -162,20 +403,82 @@ class MWICommHelper:
             HTTPError: Occurs when connection to matlab-proxy cannot be established.
         """
         self.logger.debug("Sending completion request to MATLAB")
-        return await self._send_jupyter_request_to_matlab(
-            "complete", [code, cursor_pos], self._http_shell_client
-        )
+        async with self._schedule_request(request_scheduler.COMPLETION):
+            return await self._send_jupyter_request_to_matlab(
+                "complete", [code, cursor_pos], self._http_shell_client
+            )
 
-    async def send_shutdown_request_to_matlab(self):
+    async def send_warmup_request_to_matlab(self, code, options=None):
+        """
+        Prime MATLAB and the Live Editor before the first cell is executed.
+
+        Args:
+            code (string): No-op MATLAB code executed through the Live Editor.
+            options (dict, optional): Warm-up options sent to jupyter.warmup. Defaults to None.
+
+        Returns:
+            Dict: Time in seconds taken by each stage of the warm-up in MATLAB.
+                  Example: {"execute": 1.2, "preload": 0, "symbolic": 0, "hasError": False}
+
+        Raises:
+            HTTPError: Occurs when connection to matlab-proxy cannot be established.
+        """
+        self.logger.debug("Sending warm-up request to MATLAB")
+        async with self._schedule_request(request_scheduler.BACKGROUND):
+            return await self._send_jupyter_request_to_matlab(
+                "warmup",
+                _get_execution_inputs(code, self.kernel_id, options),
+                self._http_shell_client,
+            )
+
+    async def send_snapshot_request_to_matlab(self, action, path, session_epoch=None):
+        """
+        Save the base workspace of MATLAB to a MAT file, or restore it.
+
+        Args:
+            action (string): "save" or "load".
+            path (string): Path of the MAT file.
+            session_epoch (string, optional): Session epoch returned when the snapshot
+                was saved. MATLAB does not load the snapshot if it is the same session.
+
+        Returns:
+            Dict: Time in seconds, size in bytes and number of variables of the snapshot.
+                  Example: {"time": 0.4, "bytes": 1024, "variables": 3,
+                            "sessionEpoch": "1234-20250101120000000", "restored": False}
+
+        Raises:
+            HTTPError: Occurs when connection to matlab-proxy cannot be established.
+        """
+        self.logger.debug(f"Sending snapshot request ({action}) to MATLAB")
+        inputs = [action, path]
+        if session_epoch:
+            inputs.append(session_epoch)
+        async with self._schedule_request(request_scheduler.EXECUTION):
+            return await self._send_jupyter_request_to_matlab(
+                "snapshot", inputs, self._http_shell_client
+            )
+
+    async def send_shutdown_request_to_matlab(self, options=None):
         """
         Perform cleanup tasks related to kernel shutdown.
 
+        Args:
+            options (dict, optional): Shutdown options sent to jupyter.shutdown. Defaults to None.
+
+        Returns:
+            dict | list: {"reset": True} if the workspace was reset as requested by
+                the options, otherwise {"reset": False} or the error outputs of MATLAB.
+                An empty list if no reset was requested.
+
         Raises:
             HTTPError: Occurs when connection to matlab-proxy cannot be established.
         """
         self.logger.debug("Sending shutdown request to MATLAB")
+        inputs = [self.kernel_id]
+        if options:
+            inputs.append(json.dumps(options))
         return await self._send_jupyter_request_to_matlab(
-            "shutdown", [self.kernel_id], self._http_control_client
+            "shutdown", inputs, self._http_control_client
         )
 
     async def send_interrupt_request_to_matlab(self):
@@ -192,44 +495,126 @@ class MWICommHelper:
         url = get_mvm_endpoint(self.url)
 
         self.logger.debug(f"Request URL: {url}")
-        self.logger.debug(f"Request Headers:\n{self.headers}")
-        self.logger.debug(f"Request Body:\n{req_body}")
-        resp = await self._http_control_client.post(url, json=req_body)
+        self.logger.debug("Request Headers:\n%s", self.headers)
+        self.logger.debug("Request Body:\n%s", mwi_logger.payload(req_body, "request"))
+        resp = await self._http_control_client.post(
+            url, **_get_json_request_body(req_body)
+        )
         self.logger.debug(f"Received status code: {resp.status}")
         if resp.status != http.HTTPStatus.OK:
             self.logger.error("Error occurred during communication with matlab-proxy")
             resp.raise_for_status()
 
-    async def _send_feval_request_to_matlab(self, http_client, fname, nargout, *args):
+    @contextlib.asynccontextmanager
+    async def _schedule_request(self, priority, on_wait=None):
+        """
+        Waits for the turn of a request when requests are scheduled across the kernels
+        sharing MATLAB. Interrupt and shutdown requests are never scheduled.
+        """
+        if self.request_scheduler is None:
+            yield
+        else:
+            async with self.request_scheduler.schedule(priority, on_wait):
+                yield
+
+    async def _run_on_control_loop(self, coro):
+        """
+        Runs a coroutine which uses the HTTP session of the control channel on the
+        event loop of the control channel and waits for its result.
+
+        Args:
+            coro (Coroutine): Coroutine to be run on the control event loop.
+
+        Returns:
+            Any: Result of the coroutine.
+        """
+        if asyncio.get_running_loop() is self._control_loop:
+            return await coro
+
+        future = asyncio.run_coroutine_threadsafe(coro, self._control_loop)
+        return await asyncio.wrap_future(future)
+
+    async def _ensure_session(self, http_client):
+        """
+        Performs the session handshake with MATLAB if there is no cached capabilities
+        record for the current MATLAB session.
+
+        Args:
+            http_client (ClientSession): HTTP client used to send the handshake.
+
+        Returns:
+            dict: Capabilities record of the MATLAB session.
+        """
+        if self._session_capabilities is None:
+            self._session_capabilities = await self._perform_session_handshake(
+                http_client
+            )
+        return self._session_capabilities
+
+    async def _perform_session_handshake(self, http_client):
+        """
+        Adds the MATLAB code shipped with the kernel to the MATLAB path and fetches
+        the capabilities of the MATLAB session. This is done once per MATLAB session.
+
+        Args:
+            http_client (ClientSession): HTTP client used to send the handshake.
+
+        Returns:
+            dict: Capabilities record of the MATLAB session.
+        """
+        self.logger.debug("Performing session handshake with MATLAB")
+        capabilities = await self._send_feval_request_to_matlab(
+            http_client,
+            "processJupyterKernelRequest",
+            1,
+            "handshake",
+            "feval",
+            add_kernel_path=True,
+        )
+        # An empty result still means that the kernel's MATLAB code is on the path.
+        if not isinstance(capabilities, dict):
+            capabilities = {}
+        self.logger.debug(f"MATLAB session capabilities: {capabilities}")
+        return capabilities
+
+    async def _send_feval_request_to_matlab(
+        self, http_client, fname, nargout, *args, add_kernel_path=False
+    ):
         self.logger.debug("Sending FEval request to MATLAB")
-        # Add the MATLAB code shipped with kernel to the Path
-        path = [str(pathlib.Path(__file__).parent / "matlab")]
-        req_body = get_data_to_feval_mcode("addpath", *path, nargout=0)
-        original_request = get_data_to_feval_mcode(fname, *args, nargout=nargout)
+        req_body = get_data_to_feval_mcode(fname, *args, nargout=nargout)
 
-        # Add the FEval message of original request to the req_body FEval list.
-        req_body["messages"]["FEval"].append(original_request["messages"]["FEval"][0])
+        if add_kernel_path:
+            # Add the MATLAB code shipped with kernel to the Path before the request.
+            path_request = get_data_to_feval_mcode(
+                "addpath", _KERNEL_MATLAB_CODE_PATH, nargout=0
+            )
+            req_body["messages"]["FEval"].insert(
+                0, path_request["messages"]["FEval"][0]
+            )
 
         # Set the deque mode to make execution synchronous.
-        req_body["messages"]["FEval"][0]["dequeMode"] = "non_debug_prompt"
-        req_body["messages"]["FEval"][1]["dequeMode"] = "non_debug_prompt"
+        for feval_message in req_body["messages"]["FEval"]:
+            feval_message["dequeMode"] = "non_debug_prompt"
 
         url = get_mvm_endpoint(self.url)
 
         self.logger.debug(f"Request URL: {url}")
-        self.logger.debug(f"Request Headers:\n{self.headers}")
-        self.logger.debug(f"Request Body:\n{req_body}")
+        self.logger.debug("Request Headers:\n%s", self.headers)
+        self.logger.debug("Request Body:\n%s", mwi_logger.payload(req_body, "request"))
 
         resp = await http_client.post(
             url,
-            json=req_body,
+            **_get_json_request_body(req_body),
         )
         self.logger.debug(f"Received status code: {resp.status}")
         if resp.status == http.HTTPStatus.OK:
-            response_data = await resp.json()
-            self.logger.debug(f"Response:\n{response_data}")
+            response_data = await _read_json_response(resp)
+            self.logger.debug(
+                "Response:\n%s", mwi_logger.payload(response_data, "response")
+            )
             try:
-                feval_response = response_data["messages"]["FEvalResponse"][1]
+                # The response to the requested function is always the last one
+                feval_response = response_data["messages"]["FEvalResponse"][-1]
             except KeyError:
                 # In certain cases when the HTTPResponse is received, it does not
                 # contain the expected data. In these cases most likely MATLAB has
@@ -249,14 +634,22 @@ class MWICommHelper:
                 # Return empty list if there are no outputs in the repsonse
                 return []
 
+            fault_message = feval_response["messageFaults"][0]["message"]
+
+            # The kernel's MATLAB code is missing from the path of a restarted MATLAB.
+            if not add_kernel_path and _is_undefined_function_fault(
+                fault_message, fname
+            ):
+                raise MATLABSessionChangedError()
+
             # Handle error case. This happens when "Interrupt Kernel" is issued.
-            if feval_response["messageFaults"][0]["message"] == "":
+            if fault_message == "":
                 error_message = (
                     "Failed to execute. Operation may have interrupted by user."
                 )
             else:
                 self.logger.error(
-                    f'Error during execution of FEval request in MATLAB:\n{feval_response["messageFaults"][0]["message"]}'
+                    f"Error during execution of FEval request in MATLAB:\n{fault_message}"
                 )
                 error_message = "Failed to execute. Please try again."
             raise Exception(error_message)
@@ -266,24 +659,22 @@ class MWICommHelper:
 
     async def _send_eval_request_to_matlab(self, http_client, mcode):
         self.logger.debug("Sending Eval request to MATLAB")
-        # Add the MATLAB code shipped with kernel to the Path
-        path = str(pathlib.Path(__file__).parent / "matlab")
-        mcode = 'addpath("' + path + '")' + ";" + mcode
-
         req_body = get_data_to_eval_mcode(mcode)
         url = get_mvm_endpoint(self.url)
 
         self.logger.debug(f"Request URL: {url}")
-        self.logger.debug(f"Request Headers:\n{self.headers}")
-        self.logger.debug(f"Request Body:\n{req_body}")
+        self.logger.debug("Request Headers:\n%s", self.headers)
+        self.logger.debug("Request Body:\n%s", mwi_logger.payload(req_body, "request"))
         resp = await http_client.post(
             url,
-            json=req_body,
+            **_get_json_request_body(req_body),
         )
         self.logger.debug(f"Received status code: {resp.status}")
         if resp.status == http.HTTPStatus.OK:
-            response_data = await resp.json()
-            self.logger.debug(f"Response:\n{response_data}")
+            response_data = await _read_json_response(resp)
+            self.logger.debug(
+                "Response:\n%s", mwi_logger.payload(response_data, "response")
+            )
             try:
                 eval_response = response_data["messages"]["EvalResponse"][0]
             except KeyError:
@@ -322,7 +713,7 @@ class MWICommHelper:
                 # If result is empty, populate dummy json
                 if result == "":
                     result = "[]"
-                return json.loads(result)
+                return json_codec.loads(result)
 
             # Handle the error cases
             if eval_response["messageFaults"]:
@@ -344,6 +735,24 @@ class MWICommHelper:
             raise resp.raise_for_status()
 
     async def _send_jupyter_request_to_matlab(self, request_type, inputs, http_client):
+        await self._ensure_session(http_client)
+        try:
+            return await self._send_lean_jupyter_request_to_matlab(
+                request_type, list(inputs), http_client
+            )
+        except MATLABSessionChangedError:
+            # MATLAB was restarted after the handshake, so the kernel's MATLAB code
+            # is no longer on the path. Redo the handshake and retry once.
+            self.logger.debug("MATLAB session changed, repeating the handshake")
+            self.invalidate_session()
+            await self._ensure_session(http_client)
+            return await self._send_lean_jupyter_request_to_matlab(
+                request_type, list(inputs), http_client
+            )
+
+    async def _send_lean_jupyter_request_to_matlab(
+        self, request_type, inputs, http_client
+    ):
         execution_request_type = "feval"
 
         inputs.insert(0, request_type)
@@ -1,4 +1,4 @@
-# Copyright 2024 The MathWorks, Inc.
+# Copyright 2024-2025 The MathWorks, Inc.
 # Custom Exceptions used in MATLAB Kernel
 
 
@@ -40,3 +40,19 @@ class MATLABConnectionError(Exception):
         if message is None:
             message = 'Error connecting to MATLAB. Check the status of MATLAB by clicking the "Open MATLAB" button. Retry after ensuring MATLAB is running successfully'
         super().__init__(message)
+
+
+class MATLABSessionChangedError(Exception):
+    """
+    The MATLAB session changed since the kernel performed its handshake. This
+    happens when MATLAB is restarted and the MATLAB code shipped with the kernel
+    is no longer on the MATLAB path.
+
+    Args:
+        message (string): Error message to be displayed
+    """
+
+    def __init__(self, message=None):
+        if message is None:
+            message = "MATLAB session changed since the last handshake."
+        super().__init__(message)
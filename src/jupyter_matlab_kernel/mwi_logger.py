@@ -1,8 +1,15 @@
-# Copyright 2024 The MathWorks, Inc.
+# Copyright 2024-2025 The MathWorks, Inc.
 # Helper functions to access & control the logging behavior of the app
 
+import atexit
+import hashlib
 import logging
+import logging.handlers
 import os
+import queue
+
+# Default size (in bytes) up to which a payload is logged in full
+_DEFAULT_PAYLOAD_LOG_LIMIT = 4096
 
 
 def get(init=False):
@@ -55,14 +62,146 @@ def __set_logging_configuration():
     # also print their logs at the specified level
     logging.basicConfig(level=log_level)
 
+    if os.getenv(__get_env_name_async_logging(), "false").lower().strip() == "true":
+        __use_async_log_handlers(logging.getLogger())
+
     return logger
 
 
+def __use_async_log_handlers(logger):
+    """Moves the handlers of logger to a background thread, so that writing log
+    records does not block the kernel.
+
+    Args:
+        logger (Logger): Logger whose handlers are moved.
+    """
+    handlers = logger.handlers[:]
+    if not handlers:
+        return
+
+    log_queue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(
+        log_queue, *handlers, respect_handler_level=True
+    )
+    for handler in handlers:
+        logger.removeHandler(handler)
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+
+    listener.start()
+    # Flush the records which are still queued when the kernel exits
+    atexit.register(listener.stop)
+
+
+class _LazyPayload:
+    """Formats a payload only if the log record containing it is emitted."""
+
+    __slots__ = ("value", "kind")
+
+    def __init__(self, value, kind):
+        self.value = value
+        self.kind = kind
+
+    def __str__(self):
+        return _format_payload(self.value, _get_payload_log_limit(self.kind))
+
+
+def payload(value, kind=None):
+    """Wraps a payload, such as cell code or the body of a request or response, for
+    logging. The payload is only formatted if the log record is emitted, so it must
+    be passed as an argument of the log call instead of being formatted into the
+    message:
+
+        logger.debug("Response:\n%s", mwi_logger.payload(data, "response"))
+
+    Payloads larger than the size limit of their kind are truncated, and a summary
+    with their type, size and hash is logged instead of the remainder.
+
+    Args:
+        value (Any): The payload.
+        kind (str, optional): Kind of payload, used to look up its size limit in the
+            MWI_JUPYTER_LOG_PAYLOAD_LIMITS environment variable. Defaults to None.
+
+    Returns:
+        _LazyPayload: Object which formats the payload when converted to str.
+    """
+    return _LazyPayload(value, kind)
+
+
+def _format_payload(value, limit):
+    """Formats a payload, truncating it to limit bytes. A limit of 0 disables truncation."""
+    if isinstance(value, str):
+        text = value
+    elif isinstance(value, (bytes, bytearray)):
+        text = bytes(value).decode("utf-8", "replace")
+    else:
+        # Summarize long strings nested in the payload, such as base64 encoded
+        # figures, without formatting them first.
+        text = repr(_shrink(value, limit))
+
+    if not limit:
+        return text
+    data = text.encode("utf-8", "replace")
+    if len(data) <= limit:
+        return text
+    prefix = data[:limit].decode("utf-8", "ignore")
+    return f"{_summarize(value, data)} {prefix}..."
+
+
+def _shrink(value, limit):
+    """Returns a copy of value in which strings longer than limit are replaced by a summary."""
+    if not limit:
+        return value
+    if isinstance(value, str):
+        if len(value) <= limit:
+            return value
+        return _summarize(value, value.encode("utf-8", "replace"))
+    if isinstance(value, dict):
+        return {key: _shrink(item, limit) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_shrink(item, limit) for item in value]
+    return value
+
+
+def _summarize(value, data):
+    """Returns a summary with the type, size and hash of a truncated payload."""
+    digest = hashlib.sha256(data).hexdigest()[:12]
+    return f"<truncated {type(value).__name__}: {len(data)} bytes, sha256 {digest}>"
+
+
+def _get_payload_log_limit(kind):
+    """Returns the size limit in bytes of a kind of payload.
+
+    The MWI_JUPYTER_LOG_PAYLOAD_LIMITS environment variable contains either a single
+    limit for all payloads, such as "4096", or comma separated limits for each kind of
+    payload, such as "code=0,response=1024,default=4096". A limit of 0 disables
+    truncation.
+    """
+    limits = {}
+    for entry in os.getenv(__get_env_name_payload_log_limits(), "").split(","):
+        name, _, limit = entry.rpartition("=")
+        try:
+            limits[name.strip() or "default"] = int(limit)
+        except ValueError:
+            continue
+
+    return limits.get(kind, limits.get("default", _DEFAULT_PAYLOAD_LOG_LIMIT))
+
+
 def __get_env_name_logging_level():
     """Specifies the logging level used by app's loggers"""
     return "MWI_JUPYTER_LOG_LEVEL"
 
 
+def __get_env_name_payload_log_limits():
+    """Specifies the size limits of payloads such as code, requests and responses in logs"""
+    return "MWI_JUPYTER_LOG_PAYLOAD_LIMITS"
+
+
+def __get_env_name_async_logging():
+    """Enables writing log records from a background thread"""
+    return "MWI_JUPYTER_LOG_ASYNC"
+
+
 def __get_default_log_level():
     """The default logging level used by this application.
 
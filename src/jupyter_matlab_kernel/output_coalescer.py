@@ -0,0 +1,141 @@
+# Copyright 2025 The MathWorks, Inc.
+# Coalescing of the outputs sent by the kernel to Jupyter on the iopub channel
+
+import asyncio
+import time
+
+from jupyter_matlab_kernel import mwi_logger
+
+_logger = mwi_logger.get()
+
+# Time (in seconds) for which stream outputs are held back, so that the outputs
+# received during this interval are sent to Jupyter as a single message.
+_COALESCE_INTERVAL = 0.05
+
+# Number of characters of stream text after which held back outputs are sent,
+# so that a single message does not grow without bound.
+_COALESCE_MAX_SIZE = 64 * 1024
+
+
+class OutputCoalescer:
+    """
+    Reduces the number of messages sent to Jupyter for outputs which Jupyter would
+    display as a single block of text anyway. A loop which prints in MATLAB produces
+    one output for each line, and each of these outputs is otherwise sent and
+    rendered as a separate iopub message.
+
+    1. Adjacent stream outputs of the same stream (stdout or stderr) are merged.
+    2. Merged outputs are sent when the coalesce interval has elapsed since the first
+       of them was received, or when their text reaches the maximum size.
+    3. Held back outputs are sent before any other output, such as a figure, a
+       variable or an output of a different stream, so that the order is preserved.
+    4. The caller sends all the held back outputs with flush, when a cell ends.
+
+    Jupyter concatenates the text of adjacent stream outputs, so merged outputs are
+    displayed exactly like the outputs they replace.
+
+    Args:
+        send_output (Callable): Function which sends an output to Jupyter.
+        interval (float, optional): Coalesce interval in seconds.
+            Defaults to _COALESCE_INTERVAL.
+        max_size (int, optional): Maximum number of characters in a merged output.
+            Defaults to _COALESCE_MAX_SIZE.
+        logger (Logger, optional): Instance of Logger. Defaults to _logger.
+    """
+
+    def __init__(
+        self,
+        send_output,
+        interval=_COALESCE_INTERVAL,
+        max_size=_COALESCE_MAX_SIZE,
+        logger=_logger,
+    ):
+        self.send_output = send_output
+        self.interval = interval
+        self.max_size = max_size
+        self.logger = logger
+
+        # Stream outputs which are held back: name of the stream, text of each
+        # output, number of characters and time at which the first was received.
+        self._stream_name = None
+        self._chunks = []
+        self._size = 0
+        self._held_since = None
+        self._flush_handle = None
+
+        self._counters = {"outputs": 0, "messages": 0, "merged": 0}
+
+    @property
+    def counters(self):
+        """Number of outputs received, messages sent and outputs merged into another."""
+        return dict(self._counters)
+
+    def add(self, output):
+        """
+        Sends an output to Jupyter, or holds it back if it can be merged with the
+        outputs which follow it.
+
+        Args:
+            output (dict): Output in the format accepted by display_output.
+        """
+        self._counters["outputs"] += 1
+        if output.get("type") != "stream":
+            self.flush()
+            self._send(output)
+            return
+
+        content = output["content"]
+        if self._chunks and content["name"] != self._stream_name:
+            self.flush()
+
+        if not self._chunks:
+            self._stream_name = content["name"]
+            self._held_since = time.monotonic()
+            self._schedule_flush()
+        else:
+            self._counters["merged"] += 1
+        self._chunks.append(content["text"])
+        self._size += len(content["text"])
+
+        if (
+            self._size >= self.max_size
+            or time.monotonic() - self._held_since >= self.interval
+        ):
+            self.flush()
+
+    def flush(self):
+        """Sends the stream outputs which are held back, if any."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if not self._chunks:
+            return
+
+        output = {
+            "type": "stream",
+            "content": {"name": self._stream_name, "text": "".join(self._chunks)},
+        }
+        self.logger.debug(
+            f"Sending {len(self._chunks)} {self._stream_name} output(s) "
+            f"as one message of {self._size} characters"
+        )
+        self._stream_name = None
+        self._chunks = []
+        self._size = 0
+        self._held_since = None
+        self._send(output)
+
+    # Helper functions
+
+    def _send(self, output):
+        self._counters["messages"] += 1
+        self.send_output(output)
+
+    def _schedule_flush(self):
+        """Sends the held back outputs after the coalesce interval, if no other output arrives."""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # Without an event loop, outputs are sent by the next output or by flush.
+            return
+        self._flush_handle = loop.call_later(self.interval, self.flush)
@@ -0,0 +1,261 @@
+# Copyright 2025 The MathWorks, Inc.
+# Flood control for the stream outputs of a cell sent to Jupyter
+
+import os
+import tempfile
+from pathlib import Path
+
+from jupyter_matlab_kernel import mwi_logger
+
+_logger = mwi_logger.get()
+
+# Default budget of a cell: number of bytes and of stream outputs displayed.
+_MAX_BYTES = 1024 * 1024
+_MAX_OUTPUTS = 10000
+
+# Default number of identical consecutive lines, or multi-line outputs, displayed
+# before the following ones are collapsed.
+_MIN_REPEATS = 100
+
+
+def _stream(name, text):
+    return {"type": "stream", "content": {"name": name, "text": text}}
+
+
+def _format_size(num_bytes):
+    for unit in ("bytes", "KiB", "MiB"):
+        if num_bytes < 1024 or unit == "MiB":
+            break
+        num_bytes /= 1024
+    return f"{num_bytes:,.0f} {unit}" if unit == "bytes" else f"{num_bytes:,.1f} {unit}"
+
+
+class OutputLimiter:
+    """
+    Protects Jupyter and the kernel from cells which flood their output, such as a
+    loop which emits the same warning on each iteration or prints megabytes of text.
+
+    1. Runs of identical consecutive lines, or identical consecutive multi-line
+       outputs such as warnings, are displayed up to min_repeats times, followed by
+       the number of times they were repeated beyond that. Shorter runs, such as the
+       rows of a small matrix, are displayed unchanged.
+    2. Each cell has a budget of bytes and of stream outputs. Once the budget is
+       spent, the stream outputs of the cell are no longer displayed, and a summary
+       of what was truncated is displayed when the cell ends.
+    3. Optionally, the full stream outputs of a cell which were collapsed or
+       truncated are written to a file in the spill folder, which is named in the
+       summary. The files of cells whose outputs were displayed in full are removed.
+
+    Args:
+        max_bytes (int, optional): Number of bytes of stream text displayed for each
+            cell. Defaults to _MAX_BYTES.
+        max_outputs (int, optional): Number of stream outputs displayed for each cell.
+            Defaults to _MAX_OUTPUTS.
+        min_repeats (int, optional): Number of identical consecutive lines or outputs
+            displayed before the following ones are collapsed. Defaults to _MIN_REPEATS.
+        spill_dir (str, optional): Folder into which the full stream outputs of cells
+            are written. Defaults to None, in which case they are not written.
+        logger (Logger, optional): Instance of Logger. Defaults to _logger.
+    """
+
+    def __init__(
+        self,
+        max_bytes=_MAX_BYTES,
+        max_outputs=_MAX_OUTPUTS,
+        min_repeats=_MIN_REPEATS,
+        spill_dir=None,
+        logger=_logger,
+    ):
+        self.max_bytes = max_bytes
+        self.max_outputs = max_outputs
+        self.min_repeats = max(min_repeats, 1)
+        self.spill_dir = Path(spill_dir) if spill_dir else None
+        self.logger = logger
+        self._cell_count = 0
+        self._reset()
+
+    @property
+    def stats(self):
+        """Bytes and outputs of the current cell which were displayed and dropped, and lines or outputs collapsed."""
+        return dict(self._stats)
+
+    def filter(self, output):
+        """
+        Applies flood control to an output of the cell.
+
+        Args:
+            output (dict): Output in the format accepted by display_output.
+
+        Returns:
+            list: The outputs to display in place of output, possibly none.
+        """
+        if output.get("type") != "stream":
+            # Lines displayed after another output, such as a figure or clear_output,
+            # are not repetitions of the lines displayed before it.
+            outputs = self._charge(self._end_repetition())
+            self._last_name = self._last_text = self._last_line = None
+            self._line_run = self._output_run = 0
+            outputs.append(output)
+            return outputs
+
+        name, text = output["content"]["name"], output["content"]["text"]
+        self._spill(text)
+        if self._is_truncated:
+            self._drop(text)
+            return []
+
+        outputs = []
+        if name == self._last_name and text == self._last_text and text.count("\n") > 1:
+            self._output_run += 1
+            if self._output_run > self.min_repeats:
+                self._repeat("output")
+                return outputs
+        else:
+            self._output_run = 1
+            if name != self._last_name or self._repeat_unit == "output":
+                outputs.extend(self._end_repetition())
+
+        lines = []
+        for line in text.splitlines(keepends=True):
+            if name == self._last_name and line == self._last_line:
+                self._line_run += 1
+                if self._line_run > self.min_repeats:
+                    self._repeat("line")
+                    continue
+            else:
+                self._line_run = 1
+            if self._repeats:
+                if lines:
+                    outputs.append(_stream(name, "".join(lines)))
+                    lines = []
+                outputs.extend(self._end_repetition())
+            lines.append(line)
+            self._last_name, self._last_line = name, line
+        self._last_name, self._last_text = name, text
+
+        if lines:
+            outputs.append(_stream(name, "".join(lines)))
+        return self._charge(outputs)
+
+    def end_cell(self):
+        """
+        Ends the current cell, and resets the budget for the next cell.
+
+        Returns:
+            list: The outputs to display at the end of the cell, possibly none.
+        """
+        outputs = self._charge(self._end_repetition())
+        stats = self._stats
+        is_limited = bool(stats["dropped_bytes"] or stats["collapsed"])
+        if self._spill_file is not None:
+            self._spill_file.close()
+            if not is_limited:
+                self._spill_path.unlink()
+
+        text = ""
+        if stats["dropped_bytes"]:
+            text = (
+                f"Output truncated: {_format_size(stats['dropped_bytes'])} in "
+                f"{stats['dropped_outputs']:,} output(s) were not displayed, after "
+                f"{_format_size(stats['bytes'])} in {stats['outputs']:,} output(s)."
+            )
+        if is_limited and self._spill_file is not None:
+            text += f" The full output is in {self._spill_path}"
+        if text:
+            outputs.append(_stream("stderr", text.lstrip() + "\n"))
+        if is_limited:
+            self.logger.debug(f"Flood control of the cell: {stats}")
+        self._reset()
+        return outputs
+
+    # Helper functions
+
+    def _reset(self):
+        self._stats = {
+            "bytes": 0,
+            "outputs": 0,
+            "collapsed": 0,
+            "dropped_bytes": 0,
+            "dropped_outputs": 0,
+        }
+        self._is_truncated = False
+        self._last_name = None
+        self._last_text = None
+        self._last_line = None
+        self._line_run = 0
+        self._output_run = 0
+        self._repeats = 0
+        self._repeat_unit = None
+        self._spill_file = None
+        self._spill_path = None
+
+    def _repeat(self, unit):
+        if not self._repeats:
+            self._repeat_unit = unit
+        self._repeats += 1
+        self._stats["collapsed"] += 1
+
+    def _end_repetition(self):
+        """Returns the output which tells how many times the last line or output was repeated."""
+        if not self._repeats:
+            return []
+        text = (
+            f"... previous {self._repeat_unit} repeated "
+            f"{self._repeats:,} more time{'s' if self._repeats > 1 else ''}\n"
+        )
+        self._repeats = 0
+        self._repeat_unit = None
+        return [_stream(self._last_name, text)]
+
+    def _charge(self, outputs):
+        """Charges outputs to the budget of the cell, and truncates those over budget."""
+        charged = []
+        for output in outputs:
+            text = output["content"]["text"]
+            size = len(text.encode("utf-8"))
+            if self._is_truncated:
+                self._drop(text, size)
+                continue
+            remaining = self.max_bytes - self._stats["bytes"]
+            if self._stats["outputs"] >= self.max_outputs or remaining <= 0:
+                self._is_truncated = True
+                self._drop(text, size)
+                continue
+            if size > remaining:
+                # Cut the text at the last complete line which fits into the budget.
+                # A single line longer than the budget is cut within the line.
+                kept = text.encode("utf-8")[:remaining].decode("utf-8", "ignore")
+                if "\n" in kept or self._stats["bytes"]:
+                    kept = kept[: kept.rfind("\n") + 1]
+                self._is_truncated = True
+                self._drop(text[len(kept) :])
+                if not kept:
+                    continue
+                text = kept
+                size = len(text.encode("utf-8"))
+                output = _stream(output["content"]["name"], text)
+            self._stats["bytes"] += size
+            self._stats["outputs"] += 1
+            charged.append(output)
+        return charged
+
+    def _drop(self, text, size=None):
+        self._stats["dropped_bytes"] += (
+            size if size is not None else len(text.encode("utf-8"))
+        )
+        self._stats["dropped_outputs"] += 1
+
+    def _spill(self, text):
+        """Writes the text of a stream output to the spill file of the cell."""
+        if self.spill_dir is None:
+            return
+        if self._spill_file is None:
+            self._cell_count += 1
+            self.spill_dir.mkdir(parents=True, exist_ok=True)
+            fd, path = tempfile.mkstemp(
+                prefix=f"cell-{self._cell_count}-", suffix=".txt", dir=self.spill_dir
+            )
+            self._spill_file = os.fdopen(fd, "w", encoding="utf-8")
+            self._spill_path = Path(path)
+            self.logger.debug(f"Writing the stream outputs of the cell to {path}")
+        self._spill_file.write(text)
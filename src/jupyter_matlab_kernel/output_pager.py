@@ -0,0 +1,174 @@
+# Copyright 2025 The MathWorks, Inc.
+# Paging of large text outputs, with the remaining pages served over a Jupyter comm
+
+import html
+import uuid
+from collections import OrderedDict
+
+from jupyter_matlab_kernel import mwi_logger
+
+_logger = mwi_logger.get()
+
+# MIME type of the first page of a paged output, rendered by the JupyterLab extension
+PAGED_OUTPUT_MIMETYPE = "application/vnd.mathworks.matlab.paged-output+json"
+
+# Name of the comm target through which the front-end requests further pages
+PAGER_COMM_TARGET = "matlab_output_pager"
+
+# Default number of characters in a page, and of characters of all the pages which
+# are kept by the kernel.
+_PAGE_SIZE = 20000
+_MAX_STORED_SIZE = 64 * 1024 * 1024
+
+
+def _wrap_html(text):
+    """Wraps text like jupyter.execute does for the text/html version of text outputs."""
+    return f"<html><body><pre>{text}</pre></body></html>"
+
+
+def _split_pages(text, page_size):
+    """Splits text into pages of at most page_size characters, at line boundaries when possible."""
+    pages = []
+    start = 0
+    while start < len(text):
+        end = start + page_size
+        if end < len(text):
+            newline = text.rfind("\n", start, end)
+            if newline >= start:
+                end = newline + 1
+        pages.append(text[start:end])
+        start = end
+    return pages
+
+
+class OutputPager:
+    """
+    Keeps notebooks small and fast to render when MATLAB displays large variables,
+    such as matrices and tables, which jupyter.execute returns both as HTML and as
+    plain text.
+
+    1. Only the first page of a text output larger than a page is sent to Jupyter,
+       and saved in the notebook, as HTML, plain text and a paged output which the
+       JupyterLab extension renders with a control to show more.
+    2. The remaining pages are kept by the kernel in a buffer bounded in size. The
+       least recently used outputs are evicted from the buffer first.
+    3. The front-end requests the remaining pages of an output over a comm. Requests
+       for evicted outputs, or outputs of a previous kernel, are answered with an
+       error telling the user to execute the cell again.
+
+    Args:
+        page_size (int, optional): Number of characters in a page.
+            Defaults to _PAGE_SIZE.
+        max_stored_size (int, optional): Number of characters of pages kept by the
+            kernel. Defaults to _MAX_STORED_SIZE.
+        logger (Logger, optional): Instance of Logger. Defaults to _logger.
+    """
+
+    def __init__(
+        self, page_size=_PAGE_SIZE, max_stored_size=_MAX_STORED_SIZE, logger=_logger
+    ):
+        self.page_size = page_size
+        self.max_stored_size = max_stored_size
+        self.logger = logger
+
+        # Pages of each paged output, from the least to the most recently used.
+        self._outputs = OrderedDict()
+        self._stored_size = 0
+
+    def paginate(self, output):
+        """
+        Replaces a large text output with its first page, and stores the other pages.
+
+        Args:
+            output (dict): Output of type execute_result returned by jupyter.execute.
+
+        Returns:
+            dict: The output to display, which is output itself if it is not paged.
+        """
+        data = dict(zip(output.get("mimetype", []), output.get("value", [])))
+        text = data.get("text/plain")
+        if (
+            not isinstance(text, str)
+            or len(text) <= self.page_size
+            or data.keys() - {"text/plain", "text/html"}
+            or data.get("text/html", _wrap_html(text)) != _wrap_html(text)
+        ):
+            return output
+
+        pages = _split_pages(text, self.page_size)
+        output_id = uuid.uuid4().hex
+        self._store(output_id, pages)
+
+        first_page = pages[0]
+        note = (
+            f"... {len(text) - len(first_page):,} more characters in "
+            f"{len(pages) - 1:,} page(s) are not displayed"
+        )
+        paged = {
+            "id": output_id,
+            "page": 0,
+            "pages": len(pages),
+            "text": first_page,
+        }
+        self.logger.debug(
+            f"Paged an output of {len(text)} characters into {len(pages)} pages"
+        )
+        mimetypes = [PAGED_OUTPUT_MIMETYPE, "text/plain"]
+        values = [paged, f"{first_page}{note}\n"]
+        if "text/html" in data:
+            mimetypes.insert(1, "text/html")
+            values.insert(1, _wrap_html(f"{first_page}<em>{html.escape(note)}</em>"))
+        return {"type": "execute_result", "mimetype": mimetypes, "value": values}
+
+    def get_page(self, output_id, page):
+        """
+        Returns a page of a paged output.
+
+        Args:
+            output_id (str): Identifier of the paged output.
+            page (int): Index of the page.
+
+        Returns:
+            str: The text of the page, or None if the output is no longer stored.
+        """
+        pages = self._outputs.get(output_id)
+        if pages is None or not 0 <= page < len(pages):
+            return None
+        self._outputs.move_to_end(output_id)
+        return pages[page]
+
+    def open_comm(self, comm, msg):
+        """
+        Serves the pages requested by the front-end on a comm opened with the target
+        PAGER_COMM_TARGET. Requests contain the "id" and the "page" of the output,
+        which are sent back along with the "text" of the page, or an "error".
+        """
+
+        @comm.on_msg
+        def _on_msg(msg):
+            request = msg["content"]["data"]
+            reply = {"id": request.get("id"), "page": request.get("page")}
+            try:
+                text = self.get_page(request["id"], int(request["page"]))
+            except (KeyError, TypeError, ValueError):
+                text = None
+            if text is None:
+                reply["error"] = (
+                    "This output is no longer available in the kernel. "
+                    "Execute the cell again to display it."
+                )
+            else:
+                reply["text"] = text
+            comm.send(reply)
+
+    # Helper functions
+
+    def _store(self, output_id, pages):
+        """Stores the pages of an output, evicting the least recently used outputs."""
+        size = sum(len(page) for page in pages[1:])
+        self._outputs[output_id] = pages
+        self._stored_size += size
+        while self._stored_size > self.max_stored_size and len(self._outputs) > 1:
+            evicted_id, evicted = self._outputs.popitem(last=False)
+            self._stored_size -= sum(len(page) for page in evicted[1:])
+            self.logger.debug(f"Evicted the pages of output {evicted_id}")
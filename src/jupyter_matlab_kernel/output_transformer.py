@@ -0,0 +1,176 @@
+# Copyright 2025 The MathWorks, Inc.
+# Transformation of the outputs of the Live Editor API into Jupyter outputs, in the kernel process
+
+import json
+import re
+
+from jupyter_matlab_kernel import mwi_logger
+from jupyter_matlab_kernel.mathml import symbolic_output
+
+_logger = mwi_logger.get()
+
+# Type of the output returned by jupyter.execute with the rawOutputs option, which
+# contains the response of the Live Editor API as JSON.
+RAW_OUTPUTS_TYPE = "live_editor_response"
+
+_FIGURE_PATTERN = re.compile(r"data:(?P<mimetype>.*);base64,(?P<value>.*)", re.DOTALL)
+
+
+def is_raw_outputs(output):
+    """Checks if an output returned by MATLAB contains the raw outputs of the Live Editor API."""
+    return isinstance(output, dict) and output.get("type") == RAW_OUTPUTS_TYPE
+
+
+def _text_output(text):
+    """Like processText in jupyter.execute, for the outputs which display variables."""
+    return {
+        "type": "execute_result",
+        "mimetype": ["text/html", "text/plain"],
+        "value": [f"<html><body><pre>{text}</pre></body></html>", text],
+    }
+
+
+def _stream_output(name, text):
+    return {"type": "stream", "content": {"name": name, "text": text}}
+
+
+def _matrix(data):
+    text = f"{data['name']} = {data['header']} {data['type']}\n{data['value']}"
+    if data["rows"] > 10 or data["columns"] > 30:
+        text += "..."
+    return _text_output(text)
+
+
+def _variable(data):
+    indentation = "\n    " if data["header"] else ""
+    return _text_output(
+        f"{data['name']} = {data['header']}{indentation}{data['value']}"
+    )
+
+
+def _variable_string(data):
+    # Values on multiple lines, or with a header, start on a new line.
+    indentation = "\n" if data["header"] or "\n" in data["value"] else ""
+    return _text_output(
+        f"{data['name']} = {data['header']}{indentation}{data['value']}"
+    )
+
+
+def _symbolic(data):
+    return symbolic_output({"name": data.get("name"), "value": data["value"]})
+
+
+def _html(data):
+    return {
+        "type": "execute_result",
+        "mimetype": ["text/html", "text/plain"],
+        "value": [data, data],
+    }
+
+
+def _figure(image):
+    match = _FIGURE_PATTERN.fullmatch(image)
+    if match is None or not match["mimetype"].startswith("image"):
+        raise ValueError("Figure output does not contain a base64 encoded image")
+    return {
+        "type": "execute_result",
+        "mimetype": [match["mimetype"]],
+        "value": [match["value"]],
+    }
+
+
+# Functions which transform the data of each type of output without figures
+_TRANSFORMS = {
+    "matrix": _matrix,
+    "variable": _variable,
+    "variableString": _variable_string,
+    "symbolic": _symbolic,
+    "error": lambda data: _stream_output("stderr", data["text"]),
+    "warning": lambda data: _stream_output("stderr", data["text"]),
+    "text": lambda data: _stream_output("stdout", data["text"]),
+    "stderr": lambda data: _stream_output("stderr", data["text"]),
+    "text/html": _html,
+}
+
+
+def transform_outputs(records, stashed_error="", defer_figures=False, logger=_logger):
+    """
+    Transforms the outputs of the Live Editor API into the outputs which
+    jupyter.execute returns when it post-processes them in MATLAB.
+
+    Figures are placed at the position of their placeholder, if the Live Editor
+    displayed one before the image was rendered. With defer_figures, figures are
+    replaced by placeholders and their images are moved after all the other outputs.
+
+    Args:
+        records (list): Outputs of the Live Editor API, with their "type" and "outputData".
+        stashed_error (str, optional): Message of the error stashed by
+            jupyter.getOrStashExceptions, in MATLAB versions older than R2022b.
+            Defaults to "".
+        defer_figures (bool, optional): Whether figures are displayed after the
+            other outputs. Defaults to False.
+        logger (Logger, optional): Instance of Logger. Defaults to _logger.
+
+    Returns:
+        list: The outputs to display, in order.
+    """
+    result = [None] * len(records)
+    figure_positions = {}
+    deferred_figures = []
+
+    for idx, record in enumerate(records):
+        output_type, data = record.get("type"), record.get("outputData")
+        if output_type != "figure":
+            transform = _TRANSFORMS.get(output_type)
+            if transform is None:
+                logger.debug(f"Ignoring output of unknown type {output_type}")
+                continue
+            result[idx] = transform(data)
+        elif "figurePlaceHolderId" in data:
+            figure_positions.setdefault(data["figurePlaceHolderId"], idx)
+        elif "figureImage" in data:
+            figure_id = data["figureId"]
+            position = figure_positions.get(figure_id, idx)
+            try:
+                figure = _figure(data["figureImage"])
+            except ValueError as e:
+                logger.error(f"Ignoring figure {figure_id}: {e}")
+                continue
+            if defer_figures:
+                result[position] = {
+                    "type": "figure_placeholder",
+                    "displayId": figure_id,
+                }
+                deferred_figures.append({**figure, "displayId": figure_id})
+            else:
+                result[position] = figure
+
+    if stashed_error:
+        result.append(_stream_output("stderr", stashed_error))
+    return [output for output in result if output is not None] + deferred_figures
+
+
+def transform_raw_outputs(output, defer_figures=False, logger=_logger):
+    """
+    Transforms the raw outputs returned by jupyter.execute with the rawOutputs
+    option into Jupyter outputs.
+
+    Args:
+        output (dict): Output of type RAW_OUTPUTS_TYPE, with the "response" of the
+            Live Editor API as JSON.
+        defer_figures (bool, optional): Whether figures are displayed after the
+            other outputs. Defaults to False.
+        logger (Logger, optional): Instance of Logger. Defaults to _logger.
+
+    Returns:
+        list: The outputs to display, in order.
+    """
+    records = json.loads(output["response"]).get("outputs") or []
+    if isinstance(records, dict):
+        records = [records]
+    return transform_outputs(
+        records,
+        stashed_error=output.get("stashedError", ""),
+        defer_figures=defer_figures,
+        logger=logger,
+    )
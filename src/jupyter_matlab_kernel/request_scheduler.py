@@ -0,0 +1,252 @@
+# Copyright 2025 The MathWorks, Inc.
+# Fair scheduling of the requests sent by the kernels which share a MATLAB
+
+import asyncio
+import contextlib
+import hashlib
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+
+import psutil
+
+from jupyter_matlab_kernel import mwi_logger
+
+_logger = mwi_logger.get()
+
+# Priorities of the requests sent to MATLAB. Requests with a lower priority are served first.
+COMPLETION = 0
+EXECUTION = 1
+BACKGROUND = 2
+
+_PRIORITY_NAMES = {
+    COMPLETION: "completion",
+    EXECUTION: "execution",
+    BACKGROUND: "background",
+}
+
+# Bounds (in seconds) of the interval at which a waiting request checks the queue
+_QUEUE_POLL_MIN_INTERVAL = 0.01
+_QUEUE_POLL_MAX_INTERVAL = 0.25
+
+_TICKET_SUFFIX = ".ticket"
+_LOCK_FILE_NAME = "active.lock"
+
+
+def _is_process_alive(pid):
+    try:
+        return psutil.pid_exists(int(pid))
+    except (TypeError, ValueError):
+        return False
+
+
+def _parse_ticket(path):
+    """Returns the priority, enqueue time, pid and kernel id encoded in the name of a ticket."""
+    priority, enqueued_at, pid, kernel_id = path.name[: -len(_TICKET_SUFFIX)].split(
+        "_", 3
+    )
+    return int(priority), int(enqueued_at), int(pid), kernel_id
+
+
+def _order_tickets(tickets):
+    """
+    Orders the tickets of waiting requests by priority. Requests with the same
+    priority are served round-robin across kernels, and in order of arrival for
+    each kernel.
+
+    Args:
+        tickets (list): Parsed tickets (priority, enqueue time, pid, kernel id, path).
+
+    Returns:
+        list: The tickets in the order in which they are served.
+    """
+    ranks = {}
+    keys = []
+    for ticket in sorted(tickets, key=lambda ticket: ticket[1]):
+        priority, enqueued_at, _, kernel_id, _ = ticket
+        rank = ranks.get((priority, kernel_id), 0)
+        ranks[(priority, kernel_id)] = rank + 1
+        keys.append(((priority, rank, enqueued_at), ticket))
+    return [ticket for _, ticket in sorted(keys, key=lambda key: key[0])]
+
+
+class RequestScheduler:
+    """
+    Serves the requests sent to a shared MATLAB one at a time, in a fair order across
+    the kernels which share it. MATLAB evaluates requests one at a time in the order
+    of arrival, so without scheduling a long running cell of one notebook delays
+    the completions and short cells of every other notebook.
+
+    Kernels run in separate processes, so requests are queued as ticket files in a
+    folder for each MATLAB. The request which is served holds a lock file:
+
+        <priority>_<enqueue time>_<pid>_<kernel id>.ticket
+        active.lock
+
+    1. Requests are served by priority: completion before execution before background
+       requests such as the warm-up.
+    2. Requests with the same priority are served round-robin across kernels.
+    3. Tickets and locks of kernels which are no longer running are discarded.
+
+    The time spent by requests waiting in the queue and being served by MATLAB is
+    recorded for each priority.
+
+    Args:
+        matlab_url (str): URL of the shared matlab-proxy server.
+        kernel_id (str): Unique identifier corresponding to the Jupyter kernel instance.
+        queue_dir (str, optional): Folder in which requests are queued. Defaults to a
+            folder in the temporary folder for each matlab-proxy server.
+        logger (Logger, optional): Instance of Logger. Defaults to _logger.
+    """
+
+    def __init__(self, matlab_url, kernel_id, queue_dir=None, logger=_logger):
+        self.logger = logger
+        self.kernel_id = kernel_id.replace("_", "-")
+        if queue_dir is None:
+            digest = hashlib.sha1(matlab_url.encode("utf-8")).hexdigest()[:16]
+            queue_dir = (
+                Path(tempfile.gettempdir()) / f"jupyter_matlab_kernel_queue_{digest}"
+            )
+        self.queue_dir = Path(queue_dir)
+        self.queue_dir.mkdir(parents=True, exist_ok=True)
+        self._lock_path = self.queue_dir / _LOCK_FILE_NAME
+
+        self._metrics = {
+            name: {
+                "requests": 0,
+                "wait_time": 0.0,
+                "max_wait_time": 0.0,
+                "service_time": 0.0,
+            }
+            for name in _PRIORITY_NAMES.values()
+        }
+
+    @property
+    def metrics(self):
+        """Number of requests and total time in seconds spent waiting and being served, for each priority."""
+        return {name: dict(metrics) for name, metrics in self._metrics.items()}
+
+    @contextlib.asynccontextmanager
+    async def schedule(self, priority, on_wait=None):
+        """
+        Waits until the request may be sent to MATLAB, and holds the turn until the
+        context is exited.
+
+        Args:
+            priority (int): Priority of the request: COMPLETION, EXECUTION or BACKGROUND.
+            on_wait (Callable, optional): Called with the number of requests ahead of
+                this request whenever it changes while the request is waiting, and
+                with 0 once a request which had to wait is served.
+        """
+        path = self._enqueue(priority)
+        enqueued_at = time.monotonic()
+        served_at = None
+        try:
+            await self._wait_for_turn(path, on_wait)
+            served_at = time.monotonic()
+            yield
+        finally:
+            if served_at is not None:
+                self._release()
+            self._discard(path)
+            self._record(priority, enqueued_at, served_at)
+
+    # Helper functions
+
+    def _enqueue(self, priority):
+        path = (
+            self.queue_dir
+            / f"{priority}_{time.time_ns()}_{os.getpid()}_{self.kernel_id}{_TICKET_SUFFIX}"
+        )
+        path.touch()
+        return path
+
+    def _get_waiting_tickets(self):
+        """Returns the tickets of the waiting requests, discarding those of stopped kernels."""
+        tickets = []
+        for path in self.queue_dir.glob(f"*{_TICKET_SUFFIX}"):
+            try:
+                priority, enqueued_at, pid, kernel_id = _parse_ticket(path)
+            except ValueError:
+                continue
+            if pid != os.getpid() and not _is_process_alive(pid):
+                self._discard(path)
+                continue
+            tickets.append((priority, enqueued_at, pid, kernel_id, path))
+        return tickets
+
+    def _get_lock_owner(self):
+        """Returns the pid of the kernel which is served, or None if none is served."""
+        try:
+            owner = json.loads(self._lock_path.read_text())
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError):
+            # The lock file is being written.
+            return -1
+        if not _is_process_alive(owner.get("pid")):
+            self.logger.debug("Discarding the lock of a stopped kernel")
+            self._discard(self._lock_path)
+            return None
+        return owner.get("pid")
+
+    def _acquire(self, path):
+        try:
+            fd = os.open(self._lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except FileExistsError:
+            return False
+        with os.fdopen(fd, "w") as f:
+            json.dump({"pid": os.getpid(), "ticket": path.name}, f)
+        return True
+
+    def _release(self):
+        self._discard(self._lock_path)
+
+    def _discard(self, path):
+        try:
+            path.unlink()
+        except FileNotFoundError:
+            pass
+
+    async def _wait_for_turn(self, path, on_wait):
+        poll_interval = _QUEUE_POLL_MIN_INTERVAL
+        last_ahead = 0
+        while True:
+            ordered = [
+                ticket[4] for ticket in _order_tickets(self._get_waiting_tickets())
+            ]
+            position = ordered.index(path) if path in ordered else 0
+            is_served = self._get_lock_owner() is not None
+            if position == 0 and not is_served and self._acquire(path):
+                # The request is no longer waiting once it is served.
+                self._discard(path)
+                if last_ahead and on_wait is not None:
+                    on_wait(0)
+                return
+
+            ahead = position + (1 if is_served else 0)
+            if ahead != last_ahead:
+                self.logger.debug(f"Waiting for MATLAB behind {ahead} requests")
+                if on_wait is not None:
+                    on_wait(ahead)
+                last_ahead = ahead
+                poll_interval = _QUEUE_POLL_MIN_INTERVAL
+            else:
+                poll_interval = min(poll_interval * 2, _QUEUE_POLL_MAX_INTERVAL)
+            await asyncio.sleep(poll_interval)
+
+    def _record(self, priority, enqueued_at, served_at):
+        metrics = self._metrics[_PRIORITY_NAMES[priority]]
+        now = time.monotonic()
+        wait_time = (served_at or now) - enqueued_at
+        metrics["requests"] += 1
+        metrics["wait_time"] += wait_time
+        metrics["max_wait_time"] = max(metrics["max_wait_time"], wait_time)
+        if served_at is not None:
+            metrics["service_time"] += now - served_at
+        self.logger.debug(
+            f"Request ({_PRIORITY_NAMES[priority]}) waited {wait_time:.3f} seconds "
+            f"and was served in {(now - served_at) if served_at else 0:.3f} seconds"
+        )
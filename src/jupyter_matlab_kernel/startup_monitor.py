@@ -0,0 +1,206 @@
+# Copyright 2025 The MathWorks, Inc.
+# Tracks the startup of the MATLAB assigned to a kernel in the background
+
+import asyncio
+import time
+
+from matlab_proxy import settings as mwi_settings
+
+from jupyter_matlab_kernel import mwi_logger
+from jupyter_matlab_kernel.mwi_exceptions import MATLABConnectionError
+
+_logger = mwi_logger.get()
+
+_MATLAB_STARTUP_TIMEOUT = mwi_settings.get_process_startup_timeout()
+
+# States of the MATLAB startup
+UNLICENSED = "unlicensed"
+LICENSING = "licensing"
+STARTING = "starting"
+UP = "up"
+ERROR = "error"
+
+
+class MATLABStartupMonitor:
+    """
+    Models the startup of MATLAB as a state machine, which is driven by the status
+    updates of matlab-proxy in a background task:
+
+        unlicensed -> licensing -> starting -> up
+                                            -> error
+
+    1. "unlicensed": matlab-proxy has no license information. This is also the
+       state until the first status is received.
+    2. "licensing": The user has been asked to license MATLAB using matlab-proxy.
+    3. "starting": MATLAB is licensed and starting.
+    4. "up": MATLAB is ready to evaluate requests.
+    5. "error": matlab-proxy reported an error, could not be reached, or MATLAB did
+       not start within the startup timeout.
+
+    Args:
+        logger (Logger, optional): Instance of Logger. Defaults to _logger.
+        startup_timeout (int, optional): Time in seconds for which MATLAB may be in
+            the "starting" state. Defaults to the process startup timeout of matlab-proxy.
+    """
+
+    def __init__(self, logger=_logger, startup_timeout=_MATLAB_STARTUP_TIMEOUT):
+        self.logger = logger
+        self.startup_timeout = startup_timeout
+        self.error = None
+        self._state = UNLICENSED
+        self._has_status = False
+        self._started_at = None
+        self._state_changed_at = None
+        self._task = None
+        self._state_changed = None
+
+    @property
+    def state(self):
+        """Current state of the MATLAB startup."""
+        return self._state
+
+    @property
+    def elapsed_time(self):
+        """Time in seconds since the startup began, or 0 if it has not begun."""
+        if self._started_at is None:
+            return 0
+        return time.monotonic() - self._started_at
+
+    @property
+    def state_elapsed_time(self):
+        """Time in seconds spent in the current state, or 0 if the startup has not begun."""
+        if self._state_changed_at is None:
+            return 0
+        return time.monotonic() - self._state_changed_at
+
+    @property
+    def is_running(self):
+        """True while the background task is following the startup."""
+        return self._task is not None and not self._task.done()
+
+    def start(self, comm_helper, loop=None):
+        """
+        Starts following the startup of MATLAB in a background task. Has no effect if
+        the startup is already being followed.
+
+        Args:
+            comm_helper (MWICommHelper): Communication helper for the assigned matlab-proxy.
+            loop (AbstractEventLoop, optional): Event loop on which the task is run.
+                Defaults to the current event loop.
+        """
+        if self.is_running:
+            if self._state not in (UP, ERROR):
+                return
+            # The task of the previous startup is finishing.
+            self._task.cancel()
+
+        self.logger.debug("Following the startup of MATLAB")
+        self.error = None
+        self._state = UNLICENSED
+        self._has_status = False
+        self._state_changed = asyncio.Event()
+        self._started_at = self._state_changed_at = time.monotonic()
+        self._task = asyncio.ensure_future(self._run(comm_helper), loop=loop)
+
+    def stop(self):
+        """Stops following the startup of MATLAB."""
+        if self.is_running:
+            self._task.cancel()
+
+    def reset(self):
+        """Stops following the startup, and forgets the MATLAB which was followed."""
+        self.stop()
+        self.error = None
+        self._state = UNLICENSED
+        self._has_status = False
+        self._started_at = self._state_changed_at = None
+
+    def set_licensing(self):
+        """Records that the user has been asked to license MATLAB."""
+        if self._state == UNLICENSED:
+            self._set_state(LICENSING)
+
+    async def wait_for_status(self):
+        """Waits until the first status of matlab-proxy has been received."""
+        await self._wait_until(lambda: self._has_status)
+
+    async def wait_until_licensed(self):
+        """Waits until MATLAB is licensed, or the startup failed."""
+        await self._wait_until(lambda: self._state in (STARTING, UP, ERROR))
+
+    async def wait_until_ready(self):
+        """
+        Waits until MATLAB is up.
+
+        Raises:
+            Exception: The error which caused the startup to fail.
+        """
+        await self._wait_until(lambda: self._state in (UP, ERROR))
+        if self._state == ERROR:
+            raise self.error
+
+    async def _wait_until(self, predicate):
+        while not predicate():
+            if not self.is_running:
+                raise MATLABConnectionError()
+            await self._state_changed.wait()
+
+    async def _run(self, comm_helper):
+        """Updates the state using the status updates of matlab-proxy until MATLAB is up."""
+        loop = asyncio.get_running_loop()
+        status_updates = comm_helper.subscribe_to_matlab_proxy_status()
+        try:
+            while self._state not in (UP, ERROR):
+                timeout = None
+                if self._state == STARTING:
+                    timeout = max(self.startup_timeout - self.state_elapsed_time, 0)
+                try:
+                    status = await asyncio.wait_for(status_updates.__anext__(), timeout)
+                except asyncio.TimeoutError:
+                    self.logger.error(
+                        f"MATLAB has not started after {self.startup_timeout} seconds."
+                    )
+                    self._set_error(MATLABConnectionError())
+                    break
+                self._update(*status)
+        except Exception as e:
+            self.logger.error(f"Unable to fetch the status of matlab-proxy: {e}")
+            self._set_error(e)
+        finally:
+            await status_updates.aclose()
+            # Wake up the waiters, which check is_running once the task is done.
+            loop.call_soon(self._notify)
+
+    def _update(self, is_matlab_licensed, matlab_status, matlab_proxy_has_error):
+        self._has_status = True
+        if matlab_proxy_has_error:
+            self.logger.error("matlab-proxy encountered error.")
+            self._set_error(MATLABConnectionError())
+        elif matlab_status == "up":
+            self._set_state(UP)
+        elif is_matlab_licensed:
+            self._set_state(STARTING)
+        elif self._state != LICENSING:
+            self._set_state(UNLICENSED)
+        else:
+            self._notify()
+
+    def _set_error(self, error):
+        self.error = error
+        self._set_state(ERROR)
+
+    def _set_state(self, state):
+        if state != self._state:
+            self.logger.debug(
+                f"MATLAB startup state changed from {self._state} to {state} "
+                f"after {self.elapsed_time:.2f} seconds"
+            )
+            self._state = state
+            self._state_changed_at = time.monotonic()
+        self._notify()
+
+    def _notify(self):
+        # Waiters capture the event before waiting, so it is replaced once set.
+        if self._state_changed is not None:
+            self._state_changed.set()
+            self._state_changed = asyncio.Event()
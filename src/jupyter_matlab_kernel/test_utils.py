@@ -1,6 +1,7 @@
-# Copyright 2023-2024 The MathWorks, Inc.
+# Copyright 2023-2025 The MathWorks, Inc.
 
 import os
+from jupyter_matlab_kernel import environment_variables as kernel_env
 from jupyter_matlab_kernel import mwi_logger
 
 _logger = mwi_logger.get()
@@ -53,3 +54,17 @@ def start_matlab_proxy_for_testing(logger=_logger):
     logger.debug("headers: %s", headers)
 
     return url, matlab_proxy_base_url, headers
+
+
+def get_unix_socket_for_testing():
+    """
+    Only used for testing purposes. Gets the path of the Unix domain socket on which
+    the matlab-proxy server started by the tests can be reached.
+
+    Returns:
+        string: Path of the Unix domain socket, or None if it is not provided or
+        testing mode is not enabled.
+    """
+    if not is_jupyter_testing_enabled():
+        return None
+    return os.environ.get(kernel_env.get_env_name_test_unix_socket()) or None
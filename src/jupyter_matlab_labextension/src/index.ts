@@ -1,9 +1,10 @@
-// Copyright 2023-2024 The MathWorks, Inc.
+// Copyright 2023-2025 The MathWorks, Inc.
 
 import { JupyterFrontEndPlugin } from '@jupyterlab/application';
 import { matlabToolbarButtonPlugin } from './matlab_browser_button';
 import { matlabMFilesPlugin } from './matlab_files';
 import { matlabCodeMirror6Plugin } from './matlab_cm6_mode';
+import { matlabOutputPagerPlugin } from './matlab_output_pager';
 
-const plugins: JupyterFrontEndPlugin<any>[] = [matlabToolbarButtonPlugin, matlabMFilesPlugin, matlabCodeMirror6Plugin];
+const plugins: JupyterFrontEndPlugin<any>[] = [matlabToolbarButtonPlugin, matlabMFilesPlugin, matlabCodeMirror6Plugin, matlabOutputPagerPlugin];
 export default plugins;
@@ -0,0 +1,137 @@
+// Copyright 2025 The MathWorks, Inc.
+
+// Renders the first page of large text outputs which the MATLAB kernel pages, with
+// a control which requests the remaining pages from the kernel over a comm.
+
+import {
+    JupyterFrontEnd,
+    JupyterFrontEndPlugin
+} from '@jupyterlab/application';
+import { DocumentRegistry } from '@jupyterlab/docregistry';
+import { INotebookModel, NotebookPanel } from '@jupyterlab/notebook';
+import { IRenderMime } from '@jupyterlab/rendermime-interfaces';
+import { ReadonlyPartialJSONObject } from '@lumino/coreutils';
+import { DisposableDelegate, IDisposable } from '@lumino/disposable';
+import { Widget } from '@lumino/widgets';
+
+/** MIME type of paged outputs, defined by jupyter_matlab_kernel.output_pager */
+export const PAGED_OUTPUT_MIMETYPE = 'application/vnd.mathworks.matlab.paged-output+json';
+
+/** Name of the comm target which serves pages in the kernel */
+const PAGER_COMM_TARGET = 'matlab_output_pager';
+
+interface IPagedOutput {
+    id: string;
+    page: number;
+    pages: number;
+    text: string;
+}
+
+/** Renders a paged output, and fetches its next page each time "Show more" is clicked. */
+class PagedOutputRenderer extends Widget implements IRenderMime.IRenderer {
+    constructor (
+        private readonly _options: IRenderMime.IRendererOptions,
+        private readonly _panel: NotebookPanel
+    ) {
+        super();
+        this.addClass('matlab-paged-output');
+    }
+
+    async renderModel (model: IRenderMime.IMimeModel): Promise<void> {
+        const output = model.data[this._options.mimeType] as unknown as IPagedOutput;
+        this.node.textContent = '';
+
+        const pre = document.createElement('pre');
+        pre.innerHTML = this._options.sanitizer.sanitize(output.text);
+        this.node.appendChild(pre);
+        if (output.pages <= 1) {
+            return;
+        }
+
+        let nextPage = output.page + 1;
+        const status = document.createElement('div');
+        status.className = 'matlab-paged-output-status';
+        const button = document.createElement('button');
+        button.className = 'jp-Button jp-mod-styled jp-mod-reject matlab-paged-output-more';
+        const updateButton = (): void => {
+            button.textContent = `Show more (page ${nextPage + 1} of ${output.pages})`;
+        };
+        updateButton();
+        button.onclick = async (): Promise<void> => {
+            button.disabled = true;
+            try {
+                const reply = await this._requestPage(output.id, nextPage);
+                if (reply.error !== undefined) {
+                    status.textContent = reply.error as string;
+                    button.remove();
+                    return;
+                }
+                pre.insertAdjacentHTML('beforeend', this._options.sanitizer.sanitize(reply.text as string));
+                nextPage += 1;
+                if (nextPage >= output.pages) {
+                    button.remove();
+                } else {
+                    updateButton();
+                }
+            } catch (error) {
+                status.textContent = `Unable to fetch the rest of this output: ${String(error)}`;
+            } finally {
+                button.disabled = false;
+            }
+        };
+        this.node.appendChild(button);
+        this.node.appendChild(status);
+    }
+
+    /** Requests a page of the output over a comm opened with the kernel of the notebook. */
+    private async _requestPage (id: string, page: number): Promise<ReadonlyPartialJSONObject> {
+        const kernel = this._panel.sessionContext.session?.kernel;
+        if (kernel === null || kernel === undefined) {
+            return { error: 'The kernel of this notebook is not running. Execute the cell again to display this output.' };
+        }
+        const comm = kernel.createComm(PAGER_COMM_TARGET);
+        try {
+            const reply = new Promise<ReadonlyPartialJSONObject>((resolve) => {
+                comm.onMsg = (msg) => {
+                    resolve(msg.content.data as ReadonlyPartialJSONObject);
+                };
+                comm.onClose = () => {
+                    resolve({ error: 'This output is no longer available in the kernel. Execute the cell again to display it.' });
+                };
+            });
+            comm.open();
+            comm.send({ id, page });
+            return await reply;
+        } finally {
+            if (!comm.isDisposed) {
+                comm.close();
+            }
+        }
+    }
+}
+
+class MatlabOutputPagerExtension implements DocumentRegistry.IWidgetExtension<NotebookPanel, INotebookModel> {
+    createNew (panel: NotebookPanel, context: DocumentRegistry.IContext<INotebookModel>): IDisposable {
+        /** Paged outputs are rendered using the kernel of the notebook in which they are displayed. */
+        const rendermime = panel.content.rendermime;
+        rendermime.addFactory({
+            safe: true,
+            mimeTypes: [PAGED_OUTPUT_MIMETYPE],
+            createRenderer: (options) => new PagedOutputRenderer(options, panel)
+        }, 0);
+        return new DisposableDelegate(() => {
+            rendermime.removeMimeType(PAGED_OUTPUT_MIMETYPE);
+        });
+    }
+}
+
+export const matlabOutputPagerPlugin: JupyterFrontEndPlugin<void> = {
+    id: '@mathworks/matlabOutputPagerPlugin',
+    autoStart: true,
+    activate: (
+        app: JupyterFrontEnd
+    ) => {
+        const matlabOutputPager = new MatlabOutputPagerExtension();
+        app.docRegistry.addWidgetExtension('Notebook', matlabOutputPager);
+    }
+};
@@ -0,0 +1,44 @@
+% Copyright 2025 The MathWorks, Inc.
+classdef TestCapabilitiesFunction < matlab.unittest.TestCase
+    % TestCapabilitiesFunction contains unit tests for the capabilities function
+    properties
+        TestPaths
+    end
+
+    methods (TestClassSetup)
+        function addFunctionPath(testCase)
+            testCase.TestPaths = cellfun(@(relative_path)(fullfile(pwd, relative_path)), {"../../src/jupyter_matlab_kernel/matlab"}, 'UniformOutput', false);
+            cellfun(@addpath, testCase.TestPaths)
+        end
+    end
+
+    methods (TestClassTeardown)
+        function removeFunctionPath(testCase)
+            cellfun(@rmpath, testCase.TestPaths)
+        end
+    end
+
+    methods (Test)
+        function testCapabilitiesRecord(testCase)
+            % Test that the capabilities record describes the current MATLAB session
+            caps = jupyter.capabilities();
+            testCase.verifyEqual(caps.release, string(version('-release')));
+            testCase.verifyEqual(caps.isOlderThanR2023b, isMATLABReleaseOlderThan("R2023b"));
+            testCase.verifyTrue(caps.pathRegistered);
+            testCase.verifyNotEmpty(caps.sessionEpoch);
+        end
+
+        function testCapabilitiesAreCached(testCase)
+            % Test that the session epoch does not change between calls
+            caps1 = jupyter.capabilities();
+            caps2 = jupyter.capabilities();
+            testCase.verifyEqual(caps1.sessionEpoch, caps2.sessionEpoch);
+        end
+
+        function testHandshakeRequest(testCase)
+            % Test that the handshake request returns the capabilities record
+            result = processJupyterKernelRequest('handshake', 'feval');
+            testCase.verifyEqual(result, jupyter.capabilities());
+        end
+    end
+end
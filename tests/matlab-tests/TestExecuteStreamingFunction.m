@@ -0,0 +1,93 @@
+% Copyright 2025 The MathWorks, Inc.
+classdef TestExecuteStreamingFunction < matlab.unittest.TestCase
+    % TestExecuteStreamingFunction contains unit tests for the executeStreaming function
+    properties
+        TestPaths
+    end
+
+    methods (TestClassSetup)
+        function addFunctionPath(testCase)
+            testCase.TestPaths = cellfun(@(relative_path)(fullfile(pwd, relative_path)), {"../../src/jupyter_matlab_kernel/matlab"}, 'UniformOutput', false);
+            cellfun(@addpath, testCase.TestPaths)
+        end
+        function suppressWarnings(testCase)
+            warning('off', 'all');
+            testCase.addTeardown(@() warning('on', 'all'));
+        end
+    end
+
+    methods (TestClassTeardown)
+        function removeFunctionPath(testCase)
+            cellfun(@rmpath, testCase.TestPaths)
+        end
+    end
+
+    methods (Test)
+        function testSectionBreakInsideLoop(testCase)
+            % Test that a section break inside a loop does not split the loop
+            code = sprintf('jupyterTotal = 0;\nfor ii = 1:3\n%%%% Inside the loop\njupyterTotal = jupyterTotal + ii;\nend\ndisp(jupyterTotal)');
+            testCase.addTeardown(@() evalin('base', 'clear jupyterTotal ii'));
+            [stdout, stderr] = testCase.executeStreaming(code);
+            testCase.verifyEmpty(stderr);
+            testCase.verifySubstring(stdout, '6');
+        end
+
+        function testSectionBreakInsideBlockComment(testCase)
+            % Test that a section break inside a block comment does not split the code
+            code = sprintf('jupyterValue = 7;\n%%{\n%%%% Not a section\n%%}\ndisp(jupyterValue)');
+            testCase.addTeardown(@() evalin('base', 'clear jupyterValue'));
+            [stdout, stderr] = testCase.executeStreaming(code);
+            testCase.verifyEmpty(stderr);
+            testCase.verifySubstring(stdout, '7');
+        end
+
+        function testTopLevelSectionsAreExecuted(testCase)
+            % Test that all the top-level sections of the code are executed
+            code = sprintf('disp(''first'')\n%%%% Second\ndisp(''second'')\n%%%% Third\ndisp(''third'')');
+            [stdout, stderr] = testCase.executeStreaming(code);
+            testCase.verifyEmpty(stderr);
+            testCase.verifySubstring(stdout, 'first');
+            testCase.verifySubstring(stdout, 'second');
+            testCase.verifySubstring(stdout, 'third');
+        end
+
+        function testExecutionStopsAfterError(testCase)
+            % Test that the sections after a section with an error are not executed
+            code = sprintf('disp(''first'')\n%%%% Second\nerror(''Section failed'')\n%%%% Third\ndisp(''third'')');
+            [stdout, stderr] = testCase.executeStreaming(code);
+            testCase.verifySubstring(stdout, 'first');
+            testCase.verifySubstring(stderr, 'Section failed');
+            testCase.verifyEmpty(strfind(stdout, 'third'));
+        end
+    end
+
+    methods
+        function [stdout, stderr] = executeStreaming(testCase, code)
+            % Executes the code and drains its outputs until the execution is done
+            kernelId = 'test_kernel_id';
+            jupyter.executeStreaming(code, kernelId);
+            outputs = {};
+            deadline = tic;
+            while true
+                result = jupyter.outputQueue('drain', kernelId);
+                outputs = [outputs, result.outputs]; %#ok<AGROW>
+                if result.done
+                    break
+                end
+                testCase.assertLessThan(toc(deadline), 60, 'Execution did not finish');
+                pause(0.05);
+            end
+
+            stdout = '';
+            stderr = '';
+            for ii = 1:numel(outputs)
+                output = outputs{ii};
+                if strcmp(output.type, 'stream') && strcmp(output.content.name, 'stderr')
+                    stderr = [stderr output.content.text]; %#ok<AGROW>
+                elseif strcmp(output.type, 'stream')
+                    stdout = [stdout output.content.text]; %#ok<AGROW>
+                end
+            end
+        end
+    end
+end
@@ -0,0 +1,55 @@
+% Copyright 2025 The MathWorks, Inc.
+classdef TestSnapshotFunction < matlab.unittest.TestCase
+    % TestSnapshotFunction contains unit tests for the snapshot function
+    properties
+        TestPaths
+        SnapshotFile
+    end
+
+    methods (TestClassSetup)
+        function addFunctionPath(testCase)
+            testCase.TestPaths = cellfun(@(relative_path)(fullfile(pwd, relative_path)), {"../../src/jupyter_matlab_kernel/matlab"}, 'UniformOutput', false);
+            cellfun(@addpath, testCase.TestPaths)
+        end
+    end
+
+    methods (TestClassTeardown)
+        function removeFunctionPath(testCase)
+            cellfun(@rmpath, testCase.TestPaths)
+        end
+    end
+
+    methods (TestMethodSetup)
+        function createSnapshotFile(testCase)
+            testCase.SnapshotFile = [tempname '.mat'];
+            testCase.addTeardown(@() delete(testCase.SnapshotFile));
+            testCase.addTeardown(@() evalin('base', 'clear jupyterSnapshotTest'));
+        end
+    end
+
+    methods (Test)
+        function testSaveAndLoad(testCase)
+            % Test that the base workspace is saved and loaded again
+            evalin('base', 'jupyterSnapshotTest = magic(4);');
+            info = processJupyterKernelRequest('snapshot', 'feval', 'save', testCase.SnapshotFile);
+            testCase.verifyGreaterThan(info.bytes, 0);
+            testCase.verifyGreaterThanOrEqual(info.variables, 1);
+
+            evalin('base', 'clear jupyterSnapshotTest');
+            info = jupyter.snapshot('load', testCase.SnapshotFile);
+            testCase.verifyTrue(info.restored);
+            testCase.verifyEqual(evalin('base', 'jupyterSnapshotTest'), magic(4));
+        end
+
+        function testLoadSkippedInSameSession(testCase)
+            % Test that the snapshot is not loaded if MATLAB kept running
+            evalin('base', 'jupyterSnapshotTest = 1;');
+            info = jupyter.snapshot('save', testCase.SnapshotFile);
+
+            evalin('base', 'jupyterSnapshotTest = 2;');
+            info = jupyter.snapshot('load', testCase.SnapshotFile, info.sessionEpoch);
+            testCase.verifyFalse(info.restored);
+            testCase.verifyEqual(evalin('base', 'jupyterSnapshotTest'), 2);
+        end
+    end
+end
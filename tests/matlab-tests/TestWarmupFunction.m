@@ -0,0 +1,51 @@
+% Copyright 2025 The MathWorks, Inc.
+classdef TestWarmupFunction < matlab.unittest.TestCase
+    % TestWarmupFunction contains unit tests for the warmup function
+    properties
+        TestPaths
+    end
+
+    methods (TestClassSetup)
+        function addFunctionPath(testCase)
+            testCase.TestPaths = cellfun(@(relative_path)(fullfile(pwd, relative_path)), {"../../src/jupyter_matlab_kernel/matlab"}, 'UniformOutput', false);
+            cellfun(@addpath, testCase.TestPaths)
+        end
+        function suppressWarnings(testCase)
+            warning('off', 'all');
+            testCase.addTeardown(@() warning('on', 'all'));
+        end
+    end
+
+    methods (TestClassTeardown)
+        function removeFunctionPath(testCase)
+            cellfun(@rmpath, testCase.TestPaths)
+        end
+    end
+
+    methods (Test)
+        function testWarmupTimings(testCase)
+            % Test that the warm-up executes the no-op cell and reports its timing
+            timings = jupyter.warmup(sprintf('jupyterWarmup = [];\nclear jupyterWarmup'), 'test_kernel_id');
+            testCase.verifyGreaterThan(timings.execute, 0);
+            testCase.verifyEqual(timings.preload, 0);
+            testCase.verifyEqual(timings.symbolic, 0);
+            testCase.verifyFalse(timings.hasError);
+            testCase.verifyEqual(evalin('base', 'exist(''jupyterWarmup'', ''var'')'), 0);
+        end
+
+        function testWarmupPreloadScript(testCase)
+            % Test that the preload script is executed in the workspace of the notebook
+            preloadScript = [tempname '.m'];
+            fid = fopen(preloadScript, 'w');
+            fprintf(fid, 'jupyterPreloaded = 42;\n');
+            fclose(fid);
+            testCase.addTeardown(@() delete(preloadScript));
+            testCase.addTeardown(@() evalin('base', 'clear jupyterPreloaded'));
+
+            options = jsonencode(struct('preloadScript', preloadScript));
+            timings = processJupyterKernelRequest('warmup', 'feval', 'jupyterWarmup = [];', 'test_kernel_id', options);
+            testCase.verifyGreaterThan(timings.preload, 0);
+            testCase.verifyEqual(evalin('base', 'jupyterPreloaded'), 42);
+        end
+    end
+end
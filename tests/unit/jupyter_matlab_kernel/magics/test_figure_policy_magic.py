@@ -0,0 +1,38 @@
+# Copyright 2025 The MathWorks, Inc.
+
+import pytest
+
+from jupyter_matlab_kernel.magics.figure_policy import figure_policy
+from jupyter_matlab_kernel.mwi_exceptions import MagicError
+
+
+def test_figure_policy_modifies_kernel():
+    magic_object = figure_policy(["format=jpeg", "max_width=800"])
+    output = next(magic_object.before_cell_execute())
+
+    assert output["type"] == "modify_kernel"
+    policy = output["cell_figure_policy"]
+    assert policy.format == "jpeg"
+    assert policy.max_width == 800
+    assert not magic_object.should_skip_matlab_execution()
+
+
+@pytest.mark.parametrize(
+    "parameters", [[], ["format=svg"], ["max_width=wide"], ["dpi=300"]]
+)
+def test_figure_policy_with_invalid_parameters(parameters):
+    magic_object = figure_policy(parameters)
+    with pytest.raises(MagicError):
+        next(magic_object.before_cell_execute())
+
+
+@pytest.mark.parametrize(
+    "parameters, expected",
+    [
+        (["max_"], ["max_width=", "max_height=", "max_colors="]),
+        (["format=j"], ["format=jpeg"]),
+    ],
+)
+def test_figure_policy_do_complete(parameters, expected):
+    magic_object = figure_policy()
+    assert magic_object.do_complete(parameters, 1, len(parameters[0])) == expected
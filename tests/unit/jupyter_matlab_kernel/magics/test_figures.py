@@ -0,0 +1,35 @@
+# Copyright 2025 The MathWorks, Inc.
+
+import pytest
+
+from jupyter_matlab_kernel.magics.figures import figures
+from jupyter_matlab_kernel.mwi_exceptions import MagicError
+
+
+def test_figures_gc(monkeypatch, tmp_path):
+    monkeypatch.chdir(tmp_path)
+    store_dir = tmp_path / "matlab_figures"
+    store_dir.mkdir()
+    (store_dir / f"{'0' * 64}.png").write_bytes(b"image")
+    (store_dir / f"{'1' * 64}.png").write_bytes(b"image")
+    (tmp_path / "notebook.ipynb").write_text(f"matlab_figures/{'1' * 64}.png")
+
+    magic_object = figures(["gc"])
+    output = next(magic_object.before_cell_execute())
+
+    # Images modified in the last 24 hours are kept.
+    assert "Removed 0 unreferenced image(s)" in output["value"][0]
+    assert "2 image(s) were kept" in output["value"][0]
+    assert magic_object.should_skip_matlab_execution()
+
+
+@pytest.mark.parametrize("parameters", [[], ["unknown"], ["gc", "gc"]])
+def test_figures_with_invalid_parameters(parameters):
+    magic_object = figures(parameters)
+    with pytest.raises(MagicError):
+        next(magic_object.before_cell_execute())
+
+
+def test_figures_do_complete():
+    magic_object = figures()
+    assert magic_object.do_complete(["g"], 1, 1) == ["gc"]
@@ -0,0 +1,106 @@
+# Copyright 2025 The MathWorks, Inc.
+"""A local stand-in for matlab-proxy and the Embedded Connector of MATLAB, served by an aiohttp application."""
+
+import json
+
+from aiohttp import web
+
+MOCK_SESSION_CAPABILITIES = {
+    "release": "2024b",
+    "liveEditorApiVersion": 2,
+    "pathRegistered": True,
+    "sessionEpoch": "1234-20250101000000000",
+}
+
+MOCK_WARMUP_TIMINGS = {"execute": 1.5, "preload": 0, "symbolic": 0, "hasError": False}
+
+
+class MockEmbeddedConnector:
+    """
+    Emulates the FEval requests handled by processJupyterKernelRequest.m.
+
+    A streaming execution produces the outputs of one section for each "poll_outputs"
+    request, which mimics MATLAB returning to the prompt between two sections.
+
+    The MATLAB status reported by /get_status goes through the given statuses, one
+    per request, and stays at the last one. With push_status, all the statuses are
+    sent as server-sent events to clients accepting "text/event-stream".
+
+    Args:
+        sections (List[List[dict]]): Outputs produced by each section of the cell.
+        statuses (List[str]): MATLAB statuses reported by matlab-proxy. Defaults to ["up"].
+        push_status (bool): Whether status updates are pushed. Defaults to False.
+    """
+
+    def __init__(self, sections=None, statuses=None, push_status=False):
+        self.sections = list(sections or [])
+        self.pending_sections = []
+        self.is_streaming = False
+        self.requests = []
+        self.statuses = list(statuses or ["up"])
+        self.push_status = push_status
+        self.status_requests = 0
+
+    def create_app(self):
+        """Returns the aiohttp application serving the matlab-proxy endpoints used by the kernel."""
+        app = web.Application()
+        app.router.add_get("/get_status", self.handle_status_request)
+        app.router.add_post("/messageservice/json/secure", self.handle_request)
+        return app
+
+    async def handle_status_request(self, request):
+        self.status_requests += 1
+        if self.push_status and "text/event-stream" in request.headers.get(
+            "Accept", ""
+        ):
+            response = web.StreamResponse(headers={"Content-Type": "text/event-stream"})
+            await response.prepare(request)
+            for status in self.statuses:
+                event = json.dumps(self.get_status(status))
+                await response.write(f"data: {event}\n\n".encode("utf-8"))
+            await response.write_eof()
+            return response
+
+        status = self.statuses[min(self.status_requests, len(self.statuses)) - 1]
+        return web.json_response(self.get_status(status))
+
+    @staticmethod
+    def get_status(matlab_status):
+        return {
+            "licensing": {"type": "existing_license"},
+            "matlab": {"status": matlab_status},
+            "error": None,
+        }
+
+    async def handle_request(self, request):
+        body = await request.json()
+        fevals = body["messages"]["FEval"]
+        self.requests.append(fevals)
+        responses = [self.handle_feval(feval) for feval in fevals]
+        return web.json_response({"messages": {"FEvalResponse": responses}})
+
+    def handle_feval(self, feval):
+        if feval["function"] != "processJupyterKernelRequest":
+            return {"isError": False, "results": [], "messageFaults": []}
+
+        request_type = feval["arguments"][0]
+        if request_type == "handshake":
+            result = MOCK_SESSION_CAPABILITIES
+        elif request_type == "execute":
+            result = [output for section in self.sections for output in section]
+        elif request_type == "execute_stream":
+            self.pending_sections = list(self.sections)
+            self.is_streaming = True
+            result = []
+        elif request_type == "poll_outputs":
+            result = self.drain_next_section()
+        elif request_type == "warmup":
+            result = MOCK_WARMUP_TIMINGS
+        else:
+            result = []
+        return {"isError": False, "results": [result], "messageFaults": []}
+
+    def drain_next_section(self):
+        outputs = self.pending_sections.pop(0) if self.pending_sections else []
+        self.is_streaming = bool(self.pending_sections)
+        return {"outputs": outputs, "done": not self.is_streaming}
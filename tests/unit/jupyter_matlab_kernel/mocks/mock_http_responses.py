@@ -1,7 +1,8 @@
-# Copyright 2023-2024 The MathWorks, Inc.
+# Copyright 2023-2025 The MathWorks, Inc.
 """Mock matlab-proxy HTTP Responses."""
 
 import http
+import json
 
 import aiohttp.client_exceptions
 
@@ -98,6 +99,10 @@ class MockMatlabProxyStatusResponse:
             "error": self.error,
         }
 
+    async def read(self):
+        """Return the matlab-proxy status JSON object encoded as bytes."""
+        return json.dumps(await self.json(), default=str).encode("utf-8")
+
 
 class MockSimpleOkResponse:
     """A mock of a successful http request that returns empty json."""
@@ -109,6 +114,11 @@ class MockSimpleOkResponse:
         """Return an empty JSON struct."""
         return {}
 
+    @staticmethod
+    async def read():
+        """Return an empty JSON struct encoded as bytes."""
+        return b"{}"
+
 
 class MockSimpleBadResponse:
     """A mock of a bad https request."""
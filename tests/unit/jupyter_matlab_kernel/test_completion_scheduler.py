@@ -0,0 +1,170 @@
+# Copyright 2025 The MathWorks, Inc.
+# This file contains tests for jupyter_matlab_kernel.completion_scheduler
+
+import asyncio
+import uuid
+
+import pytest
+import zmq
+from jupyter_client.session import Session
+
+from jupyter_matlab_kernel import startup_monitor
+from jupyter_matlab_kernel.completion_scheduler import (
+    CompletionScheduler,
+    _get_cell_key,
+)
+from jupyter_matlab_kernel.mpm_kernel import MATLABKernelUsingMPM
+
+
+def test_cell_key_ignores_line_being_edited():
+    """
+    This test checks that requests on the same line of a cell share a key, and
+    requests on different lines or cells do not.
+    """
+    assert _get_cell_key("x = 1;\npl", 9) == _get_cell_key("x = 1;\nplot", 11)
+    assert _get_cell_key("x = 1;\npl", 9) != _get_cell_key("x = 2;\npl", 9)
+    assert _get_cell_key("pl\ny", 2) != _get_cell_key("pl\ny", 4)
+
+
+def test_single_request_is_sent():
+    """
+    This test checks that a request without a newer request for the same cell is
+    sent to MATLAB.
+    """
+    scheduler = CompletionScheduler()
+    scheduler.received("1", "plo", 3)
+
+    assert scheduler.should_send("1")
+    scheduler.handled("1")
+    assert scheduler.counters == {"issued": 1, "superseded": 0}
+
+
+def test_superseded_requests_are_skipped():
+    """
+    This test checks that requests received before a newer request for the same
+    cell are skipped, and that the newest request is sent.
+    """
+    scheduler = CompletionScheduler()
+    for msg_id, code in enumerate(["p", "pl", "plo", "plot"]):
+        scheduler.received(str(msg_id), code, len(code))
+
+    sent = []
+    for msg_id in ["0", "1", "2", "3"]:
+        sent.append(scheduler.should_send(msg_id))
+        scheduler.handled(msg_id)
+
+    assert sent == [False, False, False, True]
+    assert scheduler.counters == {"issued": 1, "superseded": 3}
+
+
+def test_requests_for_different_cells_are_independent():
+    """
+    This test checks that requests for different cells do not supersede each other.
+    """
+    scheduler = CompletionScheduler()
+    scheduler.received("1", "x = 1;\npl", 9)
+    scheduler.received("2", "y = 1;\npl", 9)
+
+    assert scheduler.should_send("1")
+    assert scheduler.should_send("2")
+
+
+def test_unregistered_requests_are_sent():
+    """
+    This test checks that requests which were not registered when they were
+    received are sent to MATLAB.
+    """
+    scheduler = CompletionScheduler()
+
+    assert scheduler.should_send(None)
+    scheduler.handled(None)
+
+
+# Tests which go through the handling of shell messages by ipykernel
+
+
+@pytest.fixture
+def kernel(mocker):
+    """Kernel with an assigned MATLAB which is up, receiving serialized shell messages."""
+    mocker.patch(
+        "jupyter_matlab_kernel.base_kernel.BaseMATLABKernel._extract_kernel_id_from_sys_args",
+        return_value=uuid.uuid4().hex,
+    )
+    mocker.patch(
+        "jupyter_matlab_kernel.base_kernel.BaseMATLABKernel.log", new=mocker.Mock()
+    )
+    kernel = MATLABKernelUsingMPM()
+    kernel.session = Session(key=b"secret")
+    # Replies and status messages are recorded instead of being sent.
+    mocker.patch.object(kernel.session, "send")
+    kernel.startup_monitor._state = startup_monitor.UP
+    kernel.mwi_comm_helper = mocker.Mock()
+    return kernel
+
+
+def _serialize(session, code, cursor_pos):
+    msg = session.msg("complete_request", {"code": code, "cursor_pos": cursor_pos})
+    return [zmq.Frame(frame) for frame in session.serialize(msg)]
+
+
+def _replies(kernel):
+    return [
+        call.args[2]
+        for call in kernel.session.send.call_args_list
+        if call.args[1] == "complete_reply"
+    ]
+
+
+async def test_completion_requests_received_while_busy_are_superseded(mocker, kernel):
+    """
+    This test checks that completion requests received while the kernel handles
+    another request are not sent to MATLAB if they are superseded by the time
+    ipykernel handles them.
+    """
+    release = asyncio.Event()
+
+    async def send_completion_request_to_matlab(code, cursor_pos):
+        await release.wait()
+        return {"matches": [code], "start": 0, "end": cursor_pos, "completions": []}
+
+    kernel.mwi_comm_helper.send_completion_request_to_matlab = mocker.AsyncMock(
+        side_effect=send_completion_request_to_matlab
+    )
+    client = Session(key=b"secret")
+
+    # Messages are handled as ipykernel does when they are received: each one is
+    # scheduled on arrival and waits for the shell messages received before it.
+    handlers = []
+    for code in ["p", "pl", "plo"]:
+        handlers.append(
+            asyncio.ensure_future(
+                kernel.shell_main(None, _serialize(client, code, len(code)))
+            )
+        )
+        await asyncio.sleep(0)
+    release.set()
+    await asyncio.gather(*handlers)
+
+    # The first request was sent before the other requests were received.
+    assert [
+        call.args[0]
+        for call in kernel.mwi_comm_helper.send_completion_request_to_matlab.await_args_list
+    ] == ["p", "plo"]
+    assert [reply["matches"] for reply in _replies(kernel)] == [["p"], [], ["plo"]]
+    assert kernel.completion_scheduler.counters == {"issued": 2, "superseded": 1}
+    assert not kernel.completion_scheduler._pending
+
+
+async def test_completion_request_handled_alone_is_sent(mocker, kernel):
+    """
+    This test checks that a completion request received while the kernel is idle
+    is sent to MATLAB.
+    """
+    kernel.mwi_comm_helper.send_completion_request_to_matlab = mocker.AsyncMock(
+        return_value={"matches": ["plot"], "start": 0, "end": 3, "completions": []}
+    )
+
+    await kernel.shell_main(None, _serialize(Session(key=b"secret"), "plo", 3))
+
+    assert [reply["matches"] for reply in _replies(kernel)] == [["plot"]]
+    assert kernel.completion_scheduler.counters == {"issued": 1, "superseded": 0}
@@ -0,0 +1,98 @@
+# Copyright 2025 The MathWorks, Inc.
+# This file contains tests for jupyter_matlab_kernel.figure_deduplicator
+
+import pytest
+
+from jupyter_matlab_kernel.figure_deduplicator import FigureDeduplicator
+
+
+def figure_output(value):
+    return {"type": "execute_result", "mimetype": ["image/png"], "value": [value]}
+
+
+def test_identical_figures_of_a_cell_are_referenced():
+    """
+    This test checks that a figure identical to a figure displayed by the same
+    execution of a cell is replaced by a reference, and that other figures are not.
+    """
+    deduplicator = FigureDeduplicator()
+    first, other = figure_output("iVBORw0a"), figure_output("iVBORw0b")
+
+    assert deduplicator.deduplicate(first, 1) is first
+    assert deduplicator.deduplicate(other, 1) is other
+    reference = deduplicator.deduplicate(figure_output("iVBORw0a"), 1)
+
+    assert reference["mimetype"] == ["text/plain", "text/html"]
+    assert "displayed above" in reference["value"][0]
+    assert deduplicator.counters == {
+        "hits": 1,
+        "misses": 2,
+        "evictions": 0,
+        "bytes_saved": 8,
+    }
+
+
+def test_figures_of_other_cells_are_referenced():
+    """
+    This test checks that a figure identical to the figure of another cell is
+    referenced, but not a figure of an earlier execution of the same cell or of
+    a cell without ID, whose outputs may have been cleared.
+    """
+    deduplicator = FigureDeduplicator()
+    deduplicator.deduplicate(figure_output("a"), 1, "cell-1")
+
+    reference = deduplicator.deduplicate(figure_output("a"), 2, "cell-2")
+    assert "Out [1]" in reference["value"][0]
+
+    rerun = figure_output("a")
+    assert deduplicator.deduplicate(rerun, 3, "cell-1") is rerun
+    unknown = figure_output("a")
+    assert deduplicator.deduplicate(unknown, 4) is unknown
+
+
+@pytest.mark.parametrize("mode", ["reference", "skip"])
+def test_figures_of_a_cell_executed_again_are_forgotten(mode):
+    """
+    This test checks that a figure displayed by a cell whose outputs were cleared
+    by executing it again is not referenced by another cell, nor skipped.
+    """
+    deduplicator = FigureDeduplicator(mode=mode)
+    deduplicator.start_cell("cell-a")
+    deduplicator.deduplicate(figure_output("F"), 1, "cell-a")
+    deduplicator.start_cell("cell-a")
+    deduplicator.deduplicate(figure_output("G"), 2, "cell-a")
+
+    deduplicator.start_cell("cell-b")
+    figure = figure_output("F")
+    assert deduplicator.deduplicate(figure, 3, "cell-b") is figure
+    assert deduplicator.counters["hits"] == 0
+
+
+def test_duplicates_are_skipped():
+    """
+    This test checks that figures identical to a recently displayed figure are not
+    sent in the skip mode.
+    """
+    deduplicator = FigureDeduplicator(mode="skip")
+    deduplicator.deduplicate(figure_output("a"), 1)
+
+    assert deduplicator.deduplicate(figure_output("a"), 1) is None
+    with pytest.raises(ValueError):
+        FigureDeduplicator(mode="hide")
+
+
+def test_least_recently_displayed_figures_are_evicted():
+    """
+    This test checks that the least recently displayed figures are forgotten once
+    the deduplicator remembers max_entries figures.
+    """
+    deduplicator = FigureDeduplicator(max_entries=2)
+    for value in ["a", "b", "a", "c"]:
+        deduplicator.deduplicate(figure_output(value), 1)
+
+    evicted = figure_output("b")
+    assert deduplicator.deduplicate(evicted, 1) is evicted
+    assert deduplicator.counters["evictions"] == 2
+    assert (
+        deduplicator.deduplicate(figure_output("c"), 1)["mimetype"][0] == "text/plain"
+    )
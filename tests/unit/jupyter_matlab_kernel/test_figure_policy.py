@@ -0,0 +1,158 @@
+# Copyright 2025 The MathWorks, Inc.
+# This file contains tests for jupyter_matlab_kernel.figure_policy
+
+import base64
+import io
+import random
+
+import pytest
+
+from jupyter_matlab_kernel import figure_policy
+from jupyter_matlab_kernel.figure_policy import FigurePolicy
+
+
+def figure_output(image, format="PNG"):
+    buffer = io.BytesIO()
+    image.save(buffer, format)
+    return {
+        "type": "execute_result",
+        "mimetype": [f"image/{format.lower()}"],
+        "value": [base64.b64encode(buffer.getvalue()).decode("ascii")],
+    }
+
+
+def decode(output):
+    Image = pytest.importorskip("PIL.Image")
+    return Image.open(io.BytesIO(base64.b64decode(output["value"][0])))
+
+
+def line_plot(Image, size=(840, 630)):
+    """Image with few colors, like the line plots rendered by MATLAB."""
+    from PIL import ImageDraw
+
+    image = Image.new("RGB", size, "white")
+    draw = ImageDraw.Draw(image)
+    draw.rectangle([60, 40, size[0] - 40, size[1] - 60], outline="black")
+    draw.line([(60, size[1] - 60), (size[0] - 40, 40)], fill=(0, 114, 189), width=2)
+    return image
+
+
+def surface_plot(Image, size=(840, 630)):
+    """Image with shaded gradients, like the surface plots rendered by MATLAB."""
+    noise = random.Random(0)
+    image = Image.new("RGB", size)
+    image.putdata(
+        [
+            (
+                (x * 255) // size[0],
+                (y * 255) // size[1],
+                128 + noise.randint(-24, 24),
+            )
+            for y in range(size[1])
+            for x in range(size[0])
+        ]
+    )
+    return image
+
+
+def test_parse():
+    """
+    This test checks that policies are parsed from options separated by commas or
+    spaces, and that invalid options are rejected.
+    """
+    policy = FigurePolicy.parse("format=auto, max_width=1200 max_height=900")
+    assert policy.format == "auto"
+    assert (policy.max_width, policy.max_height) == (1200, 900)
+    assert FigurePolicy.parse("").is_original
+
+    for spec in ["format=svg", "dpi=300", "max_width", "max_width=0", "jpeg_quality=x"]:
+        with pytest.raises(ValueError):
+            FigurePolicy.parse(spec)
+
+
+def test_original_policy_sends_figures_unchanged():
+    """
+    This test checks that figures are not decoded by the default policy, nor when they
+    are smaller than min_size.
+    """
+    output = {"type": "execute_result", "mimetype": ["image/png"], "value": ["xxxx"]}
+    assert FigurePolicy().apply(output) is output
+    assert FigurePolicy(format="png", min_size=100).apply(output) is output
+
+
+def test_figures_are_sent_unchanged_without_pillow(monkeypatch):
+    """
+    This test checks that figures are sent unchanged when Pillow is not installed.
+    """
+
+    def raise_import_error():
+        raise ImportError("No module named 'PIL'")
+
+    monkeypatch.setattr(figure_policy, "_load_pillow", raise_import_error)
+    output = {"type": "execute_result", "mimetype": ["image/png"], "value": ["xxxx"]}
+    assert FigurePolicy(format="jpeg").apply(output) is output
+
+
+def test_large_figures_are_downscaled():
+    """
+    This test checks that figures larger than the maximum size are downscaled,
+    keeping their aspect ratio and their format.
+    """
+    Image = pytest.importorskip("PIL.Image")
+    policy = FigurePolicy(max_width=420)
+
+    output = policy.apply(figure_output(line_plot(Image)))
+
+    assert output["mimetype"] == ["image/png"]
+    assert decode(output).size == (420, 315)
+    assert policy.counters["processed"] == 1
+    assert policy.counters["bytes_out"] < policy.counters["bytes_in"]
+
+
+def test_auto_format_keeps_simple_figures_lossless():
+    """
+    This test checks that the auto format sends simple figures as lossless PNG images
+    with a palette, and complex figures in the smallest format.
+    """
+    Image = pytest.importorskip("PIL.Image")
+    policy = FigurePolicy(format="auto")
+
+    simple = line_plot(Image)
+    output = policy.apply(figure_output(simple))
+    assert output["mimetype"] == ["image/png"]
+    assert list(decode(output).convert("RGB").getdata()) == list(simple.getdata())
+
+    output = policy.apply(figure_output(surface_plot(Image)))
+    assert output["mimetype"] == ["image/jpeg"]
+
+
+def test_figures_are_never_enlarged():
+    """
+    This test checks that a figure is sent unchanged when the format of the policy
+    would make it larger.
+    """
+    Image = pytest.importorskip("PIL.Image")
+    original = figure_output(surface_plot(Image, (64, 48)), "JPEG")
+
+    output = FigurePolicy(format="png").apply(original)
+
+    assert output["mimetype"] == ["image/jpeg"]
+    assert output["value"] == original["value"]
+
+
+@pytest.mark.parametrize(
+    "value",
+    [base64.b64encode(b"not an image").decode("ascii"), "not base64!"],
+    ids=["undecodable image", "invalid base64"],
+)
+def test_undecodable_figures_are_sent_unchanged(value):
+    """
+    This test checks that a figure whose image cannot be decoded is sent unchanged
+    instead of raising an error.
+    """
+    pytest.importorskip("PIL.Image")
+    output = {"type": "execute_result", "mimetype": ["image/png"], "value": [value]}
+    policy = FigurePolicy(format="auto", max_width=100)
+
+    assert policy.apply(output) is output
+    assert policy.counters["processed"] == 0
@@ -0,0 +1,97 @@
+# Copyright 2025 The MathWorks, Inc.
+# This file contains tests for jupyter_matlab_kernel.figure_spool
+
+import base64
+import hashlib
+import os
+
+import pytest
+
+from jupyter_matlab_kernel.figure_spool import FigureSpool, is_spooled_figure
+
+
+@pytest.fixture
+def figure_spool():
+    spool = FigureSpool("test_kernel_id")
+    yield spool
+    spool.cleanup()
+
+
+def spool_figure(spool, data, name="figure.png", mimetype="image/png"):
+    """Emulates MATLAB writing a figure to the spool folder."""
+    path = spool.spool_dir / name
+    path.write_bytes(data)
+    return {
+        "type": "execute_result",
+        "mimetype": [mimetype],
+        "value": [""],
+        "spooledFigure": {
+            "path": str(path),
+            "size": len(data),
+            "sha256": hashlib.sha256(data).hexdigest(),
+        },
+    }
+
+
+def test_is_spooled_figure(figure_spool):
+    """
+    This test checks that only outputs with a figure reference are detected as spooled.
+    """
+    assert is_spooled_figure(spool_figure(figure_spool, b"png"))
+    assert not is_spooled_figure(
+        {"type": "execute_result", "mimetype": ["image/png"], "value": ["cG5n"]}
+    )
+    assert not is_spooled_figure([])
+
+
+def test_load_spooled_figure(figure_spool):
+    """
+    This test checks that a spooled figure is replaced by its base64 encoded image
+    and that the file is deleted after it is read.
+    """
+    data = os.urandom(1024)
+    output = spool_figure(figure_spool, data)
+
+    loaded_output = figure_spool.load(output)
+
+    assert loaded_output == {
+        "type": "execute_result",
+        "mimetype": ["image/png"],
+        "value": [base64.b64encode(data).decode("ascii")],
+    }
+    assert not os.path.exists(output["spooledFigure"]["path"])
+
+
+def test_load_empty_spooled_figure(figure_spool):
+    """
+    This test checks that an empty image file does not fail to load.
+    """
+    loaded_output = figure_spool.load(spool_figure(figure_spool, b""))
+    assert loaded_output["value"] == [""]
+
+
+def test_load_figure_outside_spool_folder(figure_spool, tmp_path):
+    """
+    This test checks that files outside of the spool folder of the kernel are not read.
+    """
+    output = spool_figure(figure_spool, b"png")
+    outside_path = tmp_path / "figure.png"
+    outside_path.write_bytes(b"png")
+    output["spooledFigure"]["path"] = str(outside_path)
+
+    with pytest.raises(ValueError):
+        figure_spool.load(output)
+    assert outside_path.exists()
+
+
+def test_cleanup_deletes_spool_folder():
+    """
+    This test checks that the spool folder is deleted along with figures which
+    were never displayed.
+    """
+    spool = FigureSpool("test_kernel_id")
+    spool_figure(spool, b"png")
+
+    spool.cleanup()
+
+    assert not spool.spool_dir.exists()
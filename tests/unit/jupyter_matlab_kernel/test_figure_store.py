@@ -0,0 +1,88 @@
+# Copyright 2025 The MathWorks, Inc.
+# This file contains tests for jupyter_matlab_kernel.figure_store
+
+import base64
+import json
+import os
+import time
+
+import pytest
+
+from jupyter_matlab_kernel.figure_store import FigureStore, is_figure
+
+
+def figure_output(image, mimetype="image/png"):
+    return {
+        "type": "execute_result",
+        "mimetype": [mimetype],
+        "value": [base64.b64encode(image).decode("ascii")],
+    }
+
+
+@pytest.fixture
+def store(tmp_path):
+    return FigureStore(notebook_dir=tmp_path)
+
+
+def test_is_figure():
+    """This test checks that only outputs containing a single image are stored."""
+    assert is_figure(figure_output(b"png"))
+    assert not is_figure(
+        {"type": "execute_result", "mimetype": ["text/plain"], "value": ["x"]}
+    )
+    assert not is_figure({"type": "stream", "content": {}})
+
+
+def test_figure_is_referenced_by_path(store, tmp_path):
+    """
+    This test checks that a stored figure is displayed as a reference to the image,
+    relative to the notebook folder.
+    """
+    output = store.store(figure_output(b"image data"))
+
+    (path,) = (tmp_path / "matlab_figures").iterdir()
+    assert path.read_bytes() == b"image data"
+    assert path.suffix == ".png"
+    assert f'src="matlab_figures/{path.name}"' in output["value"][0]
+    assert output["mimetype"] == ["text/html", "text/plain"]
+
+
+def test_identical_figures_are_stored_once(store, tmp_path):
+    """
+    This test checks that an image which is already in the store is not written again.
+    """
+    first = store.store(figure_output(b"same"))
+    second = store.store(figure_output(b"same"))
+    store.store(figure_output(b"other"))
+
+    assert first == second
+    assert len(list((tmp_path / "matlab_figures").iterdir())) == 2
+    assert store.counters == {"stored": 2, "deduplicated": 1, "bytes_written": 9}
+
+
+def test_collect_garbage_removes_unreferenced_images(store, tmp_path):
+    """
+    This test checks that old images which are not referenced by any notebook,
+    including checkpoints, are removed, and that other images are kept.
+    """
+    outputs = {
+        name: store.store(figure_output(name.encode()))
+        for name in ("saved", "checkpoint", "unreferenced", "recent")
+    }
+    (tmp_path / "plots.ipynb").write_text(
+        json.dumps({"cells": [{"outputs": [{"data": outputs["saved"]["value"][0]}]}]})
+    )
+    (tmp_path / ".ipynb_checkpoints").mkdir()
+    (tmp_path / ".ipynb_checkpoints" / "plots-checkpoint.ipynb").write_text(
+        outputs["checkpoint"]["value"][1]
+    )
+    old = time.time() - 2 * 24 * 60 * 60
+    for path in (tmp_path / "matlab_figures").iterdir():
+        if path.read_bytes() != b"recent":
+            os.utime(path, (old, old))
+
+    result = store.collect_garbage()
+
+    remaining = {path.read_bytes() for path in (tmp_path / "matlab_figures").iterdir()}
+    assert remaining == {b"saved", b"checkpoint", b"recent"}
+    assert result == {"kept": 3, "removed": 1, "freed_bytes": len(b"unreferenced")}
@@ -0,0 +1,76 @@
+# Copyright 2025 The MathWorks, Inc.
+# This file contains tests for jupyter_matlab_kernel.json_codec
+
+import pytest
+
+from jupyter_matlab_kernel import json_codec
+
+MOCK_RESPONSE = {
+    "messages": {
+        "FEvalResponse": [
+            {
+                "isError": False,
+                "results": [[{"type": "stream", "content": {"text": "π = 3.14"}}]],
+                "messageFaults": [],
+            }
+        ]
+    }
+}
+
+
+def get_installed_codecs():
+    return [
+        name
+        for name in ("orjson", "msgspec", "json")
+        if json_codec.get_codec(name).name == name
+    ]
+
+
+@pytest.mark.parametrize("name", get_installed_codecs())
+def test_codec_round_trip(name):
+    """
+    This test checks that each installed codec encodes to bytes and decodes from
+    bytes, memoryview and str.
+    """
+    codec = json_codec.get_codec(name)
+    data = codec.dumps(MOCK_RESPONSE)
+
+    assert isinstance(data, bytes)
+    assert codec.loads(data) == MOCK_RESPONSE
+    assert codec.loads(memoryview(data)) == MOCK_RESPONSE
+    assert codec.loads(data.decode("utf-8")) == MOCK_RESPONSE
+
+
+def test_fallback_when_codec_is_not_installed(monkeypatch):
+    """
+    This test checks that the standard library is used when the requested codec
+    and the other fast codecs are not installed.
+    """
+
+    def raise_import_error():
+        raise ImportError
+
+    monkeypatch.setitem(json_codec._CODEC_FACTORIES, "orjson", raise_import_error)
+    monkeypatch.setitem(json_codec._CODEC_FACTORIES, "msgspec", raise_import_error)
+
+    assert json_codec.get_codec("orjson").name == "json"
+    assert json_codec.get_codec().name == "json"
+
+
+def test_unknown_codec():
+    """
+    This test checks that an unknown codec falls back to the fastest available codec.
+    """
+    assert json_codec.get_codec("unknown").name == get_installed_codecs()[0]
+
+
+def test_codec_selected_by_environment(monkeypatch):
+    """
+    This test checks that the codec of the kernel can be selected using the
+    MWI_JUPYTER_JSON_CODEC environment variable.
+    """
+    monkeypatch.setenv("MWI_JUPYTER_JSON_CODEC", "json")
+    monkeypatch.setattr(json_codec, "_codec", None)
+
+    assert json_codec.loads(json_codec.dumps([1, 2])) == [1, 2]
+    assert json_codec._codec.name == "json"
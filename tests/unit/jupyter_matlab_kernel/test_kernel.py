@@ -1,13 +1,19 @@
-# Copyright 2023-2024 The MathWorks, Inc.
+# Copyright 2023-2025 The MathWorks, Inc.
 
 # This file contains tests for jupyter_matlab_kernel.kernel
+import asyncio
+
 import mocks.mock_jupyter_server as MockJupyterServer
 import pytest
 from jupyter_server import serverapp
 from mocks.mock_jupyter_server import MockJupyterServerFixture
 
+from jupyter_matlab_kernel import test_utils
+from jupyter_matlab_kernel.base_kernel import _get_keyword_completion_results
+from jupyter_matlab_kernel.figure_deduplicator import FigureDeduplicator
 from jupyter_matlab_kernel.jsp_kernel import MATLABKernelUsingJSP, start_matlab_proxy
 from jupyter_matlab_kernel.mwi_exceptions import MATLABConnectionError
+from jupyter_matlab_kernel.startup_monitor import MATLABStartupMonitor
 
 
 def test_start_matlab_proxy_without_jupyter_server():
@@ -86,6 +92,17 @@ def test_start_matlab_proxy_jh_api_token(monkeypatch, MockJupyterServerFixture):
     assert headers == {"Authorization": f"token {token}"}
 
 
+def mock_status_updates(*statuses):
+    """Returns a status subscription which yields the given statuses and then stays silent."""
+
+    async def status_updates():
+        for status in statuses:
+            yield status
+        await asyncio.Event().wait()
+
+    return status_updates
+
+
 async def test_matlab_not_licensed_non_jupyter(mocker):
     """
     Test case for MATLAB not being licensed in a non-Jupyter environment.
@@ -99,8 +116,12 @@ async def test_matlab_not_licensed_non_jupyter(mocker):
     kernel.jupyter_base_url = None
     kernel.startup_error = None
     kernel.mwi_comm_helper = mocker.Mock()
-    kernel.mwi_comm_helper.fetch_matlab_proxy_status = mocker.AsyncMock(
-        return_value=(False, "down", False)
+    kernel.mwi_comm_helper.subscribe_to_matlab_proxy_status = mock_status_updates(
+        (False, "down", False)
+    )
+    kernel.startup_monitor = MATLABStartupMonitor()
+    kernel._start_startup_monitor.side_effect = lambda: kernel.startup_monitor.start(
+        kernel.mwi_comm_helper
     )
 
     # Mock the perform_startup_checks method to actually call the implementation
@@ -113,3 +134,274 @@ async def test_matlab_not_licensed_non_jupyter(mocker):
 
     with pytest.raises(MATLABConnectionError):
         await kernel.perform_startup_checks()
+    kernel.startup_monitor.stop()
+
+
+@pytest.mark.parametrize(
+    "testing_enabled, socket_path, expected_socket",
+    [
+        ("true", "/tmp/matlab-proxy.sock", "/tmp/matlab-proxy.sock"),
+        ("true", "", None),
+        ("false", "/tmp/matlab-proxy.sock", None),
+    ],
+)
+def test_get_unix_socket_for_testing(
+    monkeypatch, testing_enabled, socket_path, expected_socket
+):
+    """
+    This test checks that the Unix domain socket of the matlab-proxy server is only
+    advertised when testing is enabled.
+    """
+    monkeypatch.setenv("MWI_JUPYTER_TEST", testing_enabled)
+    monkeypatch.setenv("MWI_JUPYTER_TEST_UNIX_SOCKET", socket_path)
+    assert test_utils.get_unix_socket_for_testing() == expected_socket
+
+
+async def test_wait_for_matlab_startup(mocker):
+    """
+    This test checks that waiting for MATLAB to start follows the startup monitor
+    until MATLAB is up, and displays that MATLAB is starting once it is licensed.
+    """
+    kernel = mocker.MagicMock(spec=MATLABKernelUsingJSP)
+    comm_helper = mocker.Mock()
+    comm_helper.subscribe_to_matlab_proxy_status = mock_status_updates(
+        (True, "starting", False), (True, "up", False)
+    )
+    kernel.startup_monitor = MATLABStartupMonitor()
+    kernel.startup_monitor.start(comm_helper)
+
+    await MATLABKernelUsingJSP.wait_for_matlab_startup(kernel)
+
+    assert kernel.startup_monitor.state == "up"
+
+
+async def test_wait_for_matlab_startup_error(mocker):
+    """
+    This test checks that an error in matlab-proxy while waiting for MATLAB to
+    start raises a MATLABConnectionError.
+    """
+    kernel = mocker.MagicMock(spec=MATLABKernelUsingJSP)
+    comm_helper = mocker.Mock()
+    comm_helper.subscribe_to_matlab_proxy_status = mock_status_updates(
+        (True, "down", True)
+    )
+    kernel.startup_monitor = MATLABStartupMonitor()
+    kernel.startup_monitor.start(comm_helper)
+
+    with pytest.raises(MATLABConnectionError):
+        await MATLABKernelUsingJSP.wait_for_matlab_startup(kernel)
+    assert kernel.startup_monitor.state == "error"
+
+
+@pytest.mark.parametrize(
+    "code, cursor_pos, expected_matches",
+    [
+        ("x = 1;\nwh", 9, ["while"]),
+        ("el", 2, ["else", "elseif"]),
+        ("plot", 4, []),
+        ("", 0, []),
+    ],
+)
+def test_get_keyword_completion_results(code, cursor_pos, expected_matches):
+    """
+    This test checks that MATLAB keywords are completed without MATLAB.
+    """
+    results = _get_keyword_completion_results(code, cursor_pos)
+    assert results["matches"] == expected_matches
+    assert results["end"] == cursor_pos
+    assert len(results["completions"]) == len(expected_matches)
+
+
+async def test_do_complete_while_matlab_is_starting(mocker):
+    """
+    This test checks that completion requests are answered without MATLAB while
+    MATLAB is starting.
+    """
+    kernel = mocker.MagicMock(spec=MATLABKernelUsingJSP)
+    kernel.log = mocker.Mock()
+    kernel.startup_monitor = MATLABStartupMonitor()
+    kernel.completion_scheduler = mocker.Mock()
+
+    reply = await MATLABKernelUsingJSP.do_complete(kernel, "swi", 3)
+
+    assert reply["matches"] == ["switch"]
+    assert reply["cursor_start"] == 0
+    kernel.completion_scheduler.should_send.assert_not_called()
+
+
+async def test_warm_up_matlab(mocker, monkeypatch):
+    """
+    This test checks that MATLAB is warmed up once it is up, using the warm-up
+    options from the environment, and that the time taken is recorded.
+    """
+    monkeypatch.setenv("MWI_JUPYTER_WARMUP_PRELOAD_SCRIPT", "/tmp/preload.m")
+    monkeypatch.setenv("MWI_JUPYTER_WARMUP_SYMBOLIC", "true")
+    kernel = mocker.MagicMock(spec=MATLABKernelUsingJSP)
+    kernel.log = mocker.Mock()
+    kernel.mwi_comm_helper = mocker.Mock()
+    kernel.mwi_comm_helper.subscribe_to_matlab_proxy_status = mock_status_updates(
+        (True, "up", False)
+    )
+    kernel.mwi_comm_helper.send_warmup_request_to_matlab = mocker.AsyncMock(
+        return_value={"execute": 1.5, "preload": 0.5, "symbolic": 2, "hasError": False}
+    )
+    kernel.startup_monitor = MATLABStartupMonitor()
+    kernel.startup_monitor.start(kernel.mwi_comm_helper)
+
+    await MATLABKernelUsingJSP._warm_up_matlab(kernel)
+
+    kernel.mwi_comm_helper.send_warmup_request_to_matlab.assert_awaited_once_with(
+        "jupyterWarmup = [];\nclear jupyterWarmup",
+        {"preloadScript": "/tmp/preload.m", "primeSymbolic": True},
+    )
+    assert kernel.warmup_timings["execute"] == 1.5
+    assert kernel.warmup_timings["total"] >= 0
+
+
+async def test_warm_up_matlab_skipped_after_startup_error(mocker):
+    """
+    This test checks that MATLAB is not warmed up if it failed to start.
+    """
+    kernel = mocker.MagicMock(spec=MATLABKernelUsingJSP)
+    kernel.mwi_comm_helper = mocker.Mock()
+    kernel.mwi_comm_helper.subscribe_to_matlab_proxy_status = mock_status_updates(
+        (True, "down", True)
+    )
+    kernel.mwi_comm_helper.send_warmup_request_to_matlab = mocker.AsyncMock()
+    kernel.startup_monitor = MATLABStartupMonitor()
+    kernel.startup_monitor.start(kernel.mwi_comm_helper)
+
+    await MATLABKernelUsingJSP._warm_up_matlab(kernel)
+
+    kernel.mwi_comm_helper.send_warmup_request_to_matlab.assert_not_awaited()
+
+
+def test_display_queue_position(mocker):
+    """
+    This test checks that the position of a cell in the queue of a shared MATLAB is
+    displayed and updated in place, and emptied once the cell is executed.
+    """
+    kernel = mocker.MagicMock(spec=MATLABKernelUsingJSP)
+    kernel._queue_display_id = None
+
+    for ahead in [0, 2, 1, 0]:
+        MATLABKernelUsingJSP._display_queue_position(kernel, ahead)
+
+    outputs = [call.args[0] for call in kernel.display_output.call_args_list]
+    assert [output["type"] for output in outputs] == [
+        "display_data",
+        "update_display_data",
+        "update_display_data",
+    ]
+    assert "behind 2 request(s)" in outputs[0]["content"]["data"]["text/plain"]
+    assert outputs[-1]["content"]["data"]["text/plain"] == ""
+    assert (
+        len({output["content"]["transient"]["display_id"] for output in outputs}) == 1
+    )
+
+
+def test_deferred_figure_updates_placeholder(mocker):
+    """
+    This test checks that a deferred figure is displayed in place of its placeholder,
+    and that display IDs are unique to the cell.
+    """
+    kernel = mocker.MagicMock(spec=MATLABKernelUsingJSP)
+    kernel.figure_store = None
+    kernel.figure_deduplicator = None
+    kernel.figure_policy = None
+    kernel.cell_figure_policy = None
+    kernel.output_pager = None
+    kernel._figure_display_prefix = "cell"
+    kernel.execution_count = 3
+
+    MATLABKernelUsingJSP._send_output(
+        kernel, {"type": "figure_placeholder", "displayId": "1"}
+    )
+    MATLABKernelUsingJSP._send_output(
+        kernel,
+        {
+            "type": "execute_result",
+            "mimetype": ["image/png"],
+            "value": ["iVBORw0"],
+            "displayId": "1",
+        },
+    )
+
+    (_, placeholder_type, placeholder), (_, figure_type, figure) = [
+        call.args for call in kernel.send_response.call_args_list
+    ]
+    assert placeholder_type == "display_data"
+    assert figure_type == "update_display_data"
+    assert figure["data"] == {"image/png": "iVBORw0"}
+    assert placeholder["transient"] == figure["transient"] == {"display_id": "cell-1"}
+
+
+def test_cell_figure_policy_replaces_kernel_policy(mocker):
+    """
+    This test checks that the figure policy set for a cell by the figure_policy magic
+    is applied instead of the figure policy of the kernel.
+    """
+    kernel = mocker.MagicMock(spec=MATLABKernelUsingJSP)
+    kernel.figure_store = None
+    kernel.figure_deduplicator = None
+    kernel.output_pager = None
+    kernel.figure_policy = mocker.MagicMock()
+    kernel.cell_figure_policy = mocker.MagicMock()
+    kernel.cell_figure_policy.apply.side_effect = lambda output: output
+    kernel.execution_count = 1
+
+    MATLABKernelUsingJSP._send_output(
+        kernel,
+        {"type": "execute_result", "mimetype": ["image/png"], "value": ["iVBORw0"]},
+    )
+
+    kernel.cell_figure_policy.apply.assert_called_once()
+    kernel.figure_policy.apply.assert_not_called()
+
+
+def test_skipped_deferred_figure_empties_placeholder(mocker):
+    """
+    This test checks that duplicate figures are not sent in the skip mode, and that
+    the placeholder of a skipped deferred figure is emptied.
+    """
+    kernel = mocker.MagicMock(spec=MATLABKernelUsingJSP)
+    kernel.figure_store = None
+    kernel.figure_deduplicator = FigureDeduplicator(mode="skip")
+    kernel.figure_policy = None
+    kernel.cell_figure_policy = None
+    kernel.output_pager = None
+    kernel._figure_display_prefix = "cell"
+    kernel._cell_id = "cell-id"
+    kernel.execution_count = 1
+
+    for display_id in [None, None, "2"]:
+        output = {"type": "execute_result", "mimetype": ["image/png"], "value": ["a"]}
+        if display_id is not None:
+            output["displayId"] = display_id
+        MATLABKernelUsingJSP._send_output(kernel, output)
+
+    (_, first_type, first), (_, placeholder_type, placeholder) = [
+        call.args for call in kernel.send_response.call_args_list
+    ]
+    assert first_type == "execute_result"
+    assert first["data"] == {"image/png": "a"}
+    assert placeholder_type == "update_display_data"
+    assert placeholder["data"] == {"text/plain": ""}
+
+
+def test_raw_outputs_are_transformed(mocker):
+    """
+    This test checks that the raw outputs of the Live Editor API returned by MATLAB
+    are transformed into Jupyter outputs, and that other outputs are unchanged.
+    """
+    kernel = mocker.MagicMock(spec=MATLABKernelUsingJSP)
+    kernel.defer_figures = False
+    stream = {"type": "stream", "content": {"name": "stdout", "text": "x\n"}}
+    raw_outputs = {
+        "type": "live_editor_response",
+        "response": '{"outputs": [{"type": "text", "outputData": {"text": "x\\n"}}]}',
+        "stashedError": "",
+    }
+
+    assert MATLABKernelUsingJSP._transform_output(kernel, raw_outputs) == [stream]
+    assert MATLABKernelUsingJSP._transform_output(kernel, stream) == [stream]
@@ -110,6 +110,31 @@ def test_get_kernel_spec_env():
     assert len(kernelspec["env"]) == 0
 
 
+def test_get_kernel_spec_figure_policy():
+    """
+    Test that get_kernel_spec() sets the figure policy of the kernel in the env key.
+    """
+    kernelspec = get_kernel_spec(figure_policy="format=auto")
+    assert kernelspec["env"] == {"MWI_JUPYTER_FIGURE_POLICY": "format=auto"}
+
+
+def test_main_invalid_figure_policy(capsys, monkeypatch):
+    """
+    Test that the main function rejects an invalid figure policy without installing the kernelspec.
+    """
+    monkeypatch.setattr(
+        sys, "argv", ["install-matlab-kernelspec", "--figure-policy", "format=svg"]
+    )
+
+    with patch("jupyter_matlab_kernel.kernelspec.install_kernel_spec") as mock_install:
+        with pytest.raises(SystemExit) as excinfo:
+            main()
+
+    assert excinfo.value.code == 2
+    mock_install.assert_not_called()
+    assert "Unknown figure format: svg" in capsys.readouterr().err
+
+
 def test_main_install_kernelspec(capsys, tmp_path, monkeypatch):
     """
     Test the main function for installing the MATLAB kernel spec.
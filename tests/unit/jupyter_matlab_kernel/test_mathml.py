@@ -0,0 +1,110 @@
+# Copyright 2025 The MathWorks, Inc.
+# This file contains tests for jupyter_matlab_kernel.mathml
+
+import pytest
+
+from jupyter_matlab_kernel.mathml import mathml_to_latex, symbolic_output
+
+
+def math(content):
+    """Wraps presentation MathML like the symbolic outputs returned by MATLAB."""
+    return (
+        '<math xmlns="http://www.w3.org/1998/Math/MathML" display="block">'
+        f"{content}</math>"
+    )
+
+
+@pytest.mark.parametrize(
+    "mathml, latex",
+    [
+        (
+            "<mrow><msup><mi>x</mi><mn>2</mn></msup><mo>+</mo><mn>2</mn>"
+            "<mo>&InvisibleTimes;</mo><mi>x</mi><mo>&minus;</mo><mn>1</mn></mrow>",
+            "x^{2}+2x-1",
+        ),
+        ("<mfrac><mn>1</mn><mn>3</mn></mfrac>", r"\frac{1}{3}"),
+        (
+            "<mrow><mi>sin</mi><mo>&ApplyFunction;</mo>"
+            "<mrow><mo>(</mo><mi>x</mi><mo>)</mo></mrow></mrow>",
+            r"\sin(x)",
+        ),
+        (
+            "<mrow><mo>(</mo><mtable>"
+            "<mtr><mtd><mn>1</mn></mtd><mtd><mi>a</mi></mtd></mtr>"
+            "<mtr><mtd><mi>b</mi></mtd><mtd><mn>0</mn></mtd></mtr>"
+            "</mtable><mo>)</mo></mrow>",
+            r"\left(\begin{array}{cc} 1 & a \\ b & 0 \end{array}\right)",
+        ),
+        ("<msqrt><mn>2</mn></msqrt>", r"\sqrt{2}"),
+        ("<mroot><mi>x</mi><mn>3</mn></mroot>", r"\sqrt[3]{x}"),
+        (
+            "<mrow><mi>&alpha;</mi><mo>&InvisibleTimes;</mo><mi>x</mi></mrow>",
+            r"\alpha x",
+        ),
+        (
+            "<mrow><munderover><mo>&sum;</mo><mrow><mi>k</mi><mo>=</mo><mn>1</mn>"
+            "</mrow><mi>n</mi></munderover><msub><mi>a</mi><mi>k</mi></msub></mrow>",
+            r"\sum_{k=1}^{n}a_{k}",
+        ),
+        (
+            "<msup><mi>&ExponentialE;</mi><mrow><mo>&minus;</mo><mi>t</mi></mrow></msup>",
+            r"{\mathrm{e}}^{-t}",
+        ),
+        (
+            "<mrow><mi>abc</mi><mo>+</mo><mi>x_1</mi></mrow>",
+            r"\mathrm{abc}+\mathrm{x\_1}",
+        ),
+        ("<mover><mi>z</mi><mo>&#xAF;</mo></mover>", r"\overline{z}"),
+        ("<mfenced><mi>a</mi><mi>b</mi></mfenced>", r"\left(a,b\right)"),
+        (
+            "<semantics><mrow><mi>&infin;</mi></mrow>"
+            "<annotation encoding='MATLAB'>Inf</annotation></semantics>",
+            r"\infty",
+        ),
+    ],
+)
+def test_mathml_to_latex(mathml, latex):
+    """
+    This test checks the conversion of the MathML of common symbolic expressions.
+    """
+    assert mathml_to_latex(math(mathml)) == latex
+
+
+def test_conversions_are_memoized():
+    """
+    This test checks that an expression converted before is not converted again.
+    """
+    mathml = math("<mfrac><mi>a</mi><mi>b</mi></mfrac>")
+    mathml_to_latex(mathml)
+    hits = mathml_to_latex.cache_info().hits
+
+    mathml_to_latex(mathml)
+
+    assert mathml_to_latex.cache_info().hits == hits + 1
+
+
+def test_symbolic_output():
+    """
+    This test checks that symbolic outputs are displayed as LaTeX, with the name of
+    their variable if there is one.
+    """
+    mathml = math("<mfrac><mn>1</mn><mn>3</mn></mfrac>")
+
+    assert symbolic_output({"type": "symbolic", "name": "x", "value": mathml}) == {
+        "type": "execute_result",
+        "mimetype": ["text/latex"],
+        "value": [r"$x = \frac{1}{3}$"],
+    }
+    output = symbolic_output({"type": "symbolic", "name": "", "value": mathml})
+    assert output["value"] == [r"$\frac{1}{3}$"]
+
+
+def test_invalid_mathml_is_displayed_as_html():
+    """
+    This test checks that MathML which cannot be converted is embedded in HTML, as
+    MATLAB does when it cannot convert symbolic outputs.
+    """
+    output = symbolic_output({"type": "symbolic", "name": "x", "value": "<math><mi>"})
+
+    assert output["mimetype"] == ["text/html", "text/plain"]
+    assert output["value"][1] == "<math><mi>"
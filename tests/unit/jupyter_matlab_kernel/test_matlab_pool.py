@@ -0,0 +1,170 @@
+# Copyright 2025 The MathWorks, Inc.
+# This file contains tests for jupyter_matlab_kernel.matlab_pool
+
+import json
+import os
+import time
+
+import pytest
+
+from jupyter_matlab_kernel.matlab_pool import MATLABPool
+from jupyter_matlab_kernel.mwi_exceptions import MATLABConnectionError
+
+
+@pytest.fixture
+def mpm_lib(mocker):
+    """Proxy manager which starts servers running in the process of the test."""
+
+    async def start_matlab_proxy_for_kernel(caller_id, **kwargs):
+        return {
+            "absolute_url": f"http://127.0.0.1/matlab/{caller_id}",
+            "mwi_base_url": f"/matlab/{caller_id}",
+            "headers": {},
+            "mpm_auth_token": f"token-{caller_id}",
+            "pid": str(os.getpid()),
+        }
+
+    start = mocker.patch(
+        "matlab_proxy_manager.lib.api.start_matlab_proxy_for_kernel",
+        side_effect=start_matlab_proxy_for_kernel,
+    )
+    shutdown = mocker.patch("matlab_proxy_manager.lib.api.shutdown")
+    return start, shutdown
+
+
+@pytest.fixture
+def pool(tmp_path, mpm_lib):
+    return MATLABPool(
+        "1234", min_size=1, max_size=2, idle_timeout=60, pool_dir=tmp_path
+    )
+
+
+async def test_warm_lease_after_replenish(pool, mpm_lib):
+    """
+    This test checks that a session started by replenishing the pool is leased
+    without starting another session.
+    """
+    start, _ = mpm_lib
+    await pool.replenish("kernel-1")
+    assert start.await_count == 1
+
+    lease = await pool.lease("kernel-2")
+
+    assert lease.is_warm
+    assert lease.server["mpm_auth_token"] == "token-jupyter-matlab-pool-0"
+    assert start.await_count == 1
+    assert pool.counters["warm_leases"] == 1
+
+
+async def test_cold_lease_and_exclusive_use(pool, mpm_lib):
+    """
+    This test checks that sessions are started when none is idle, and that a
+    session is leased to a single kernel at a time.
+    """
+    first = await pool.lease("kernel-1")
+    second = await pool.lease("kernel-2")
+
+    assert not first.is_warm and not second.is_warm
+    assert first.slot != second.slot
+    assert pool.counters["cold_leases"] == 2
+
+
+async def test_lease_times_out_when_pool_is_full(tmp_path, mpm_lib):
+    """
+    This test checks that leasing fails once all sessions stayed in use for the
+    lease timeout.
+    """
+    pool = MATLABPool("1234", max_size=1, pool_dir=tmp_path, lease_timeout=0)
+    await pool.lease("kernel-1")
+
+    with pytest.raises(MATLABConnectionError):
+        await pool.lease("kernel-2")
+
+
+async def test_failed_start_releases_slot(pool, mpm_lib):
+    """
+    This test checks that a slot can be used again after its session failed to start.
+    """
+    start, _ = mpm_lib
+    start.side_effect = None
+    start.return_value = {"errors": ["matlab-proxy did not start"]}
+
+    with pytest.raises(MATLABConnectionError):
+        await pool.lease("kernel-1")
+    assert len(pool._get_free_slots()) == 2
+
+
+async def test_release_returns_or_recycles_session(pool, mpm_lib):
+    """
+    This test checks that a released session is leased again, and that a recycled
+    session is shut down.
+    """
+    _, shutdown = mpm_lib
+    lease = await pool.lease("kernel-1")
+    await pool.release(lease)
+
+    lease = await pool.lease("kernel-2")
+    assert lease.is_warm
+    await pool.release(lease, recycle=True)
+
+    shutdown.assert_awaited_once_with(
+        "1234", "jupyter-matlab-pool-0", "token-jupyter-matlab-pool-0"
+    )
+    assert pool._get_idle_sessions() == []
+    assert pool.counters["returned"] == 1
+    assert pool.counters["recycled"] == 1
+
+
+async def test_reap_idle_keeps_min_size(pool, mpm_lib):
+    """
+    This test checks that sessions idle for longer than the idle timeout are shut
+    down, except for min_size sessions.
+    """
+    _, shutdown = mpm_lib
+    leases = [await pool.lease("kernel-1"), await pool.lease("kernel-2")]
+    for lease in leases:
+        await pool.release(lease)
+    idle_since = time.time() - 120
+    for lease in leases:
+        os.utime(pool._get_session_path(lease.slot), (idle_since, idle_since))
+
+    await pool.reap_idle("kernel-3")
+
+    assert shutdown.await_count == 1
+    assert len(pool._get_idle_sessions()) == 1
+    assert pool.counters["reaped"] == 1
+
+
+async def test_stale_lease_is_taken_over(pool, mpm_lib):
+    """
+    This test checks that a session leased by a kernel which is no longer running
+    is leased again.
+    """
+    await pool.replenish("kernel-1")
+    pool._get_lease_path(0).write_text(json.dumps({"owner": "kernel-2", "pid": -1}))
+
+    lease = await pool.lease("kernel-3")
+
+    assert lease.slot == 0
+    assert lease.is_warm
+
+
+async def test_restarted_kernel_reattaches_to_its_session(pool, mpm_lib):
+    """
+    This test checks that a kernel which was restarted without releasing its session
+    leases the same session again, even if other sessions are idle.
+    """
+    start, _ = mpm_lib
+    lease = await pool.lease("kernel-1")
+    await pool.replenish("kernel-2")
+    # The previous process of the kernel is no longer running.
+    pool._get_lease_path(lease.slot).write_text(
+        json.dumps({"owner": "kernel-1", "pid": -1})
+    )
+
+    reattached = await pool.lease("kernel-1")
+
+    assert reattached.slot == lease.slot
+    assert reattached.is_warm
+    assert pool.counters["reattached"] == 1
+    assert start.await_count == 2
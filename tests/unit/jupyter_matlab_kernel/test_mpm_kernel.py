@@ -1,9 +1,12 @@
 # Copyright 2024-2025 The MathWorks, Inc.
 
+import asyncio
+import shutil
 import uuid
 
 import pytest
 
+from jupyter_matlab_kernel import startup_monitor
 from jupyter_matlab_kernel.mpm_kernel import MATLABKernelUsingMPM
 from jupyter_matlab_kernel.mwi_exceptions import MATLABConnectionError
 
@@ -44,10 +47,30 @@ async def test_initialize_matlab_proxy_with_mpm_success(mocker, mpm_kernel_insta
     result = await mpm_kernel_instance._initialize_matlab_proxy_with_mpm(
         mpm_kernel_instance.log
     )
-    expected_response = tuple(mpm_lib_start_matlab_proxy_response.values())
+    expected_response = tuple(mpm_lib_start_matlab_proxy_response.values()) + (None,)
     assert result == expected_response
 
 
+async def test_initialize_matlab_proxy_with_mpm_unix_socket(
+    mocker, mpm_kernel_instance
+):
+    mocker.patch(
+        "matlab_proxy_manager.lib.api.start_matlab_proxy_for_kernel",
+        return_value={
+            "absolute_url": "dummyURL",
+            "mwi_base_url": "/matlab/dummy",
+            "headers": "dummy_header",
+            "mpm_auth_token": "dummy_token",
+            "unix_socket": "/tmp/matlab-proxy.sock",
+        },
+    )
+
+    result = await mpm_kernel_instance._initialize_matlab_proxy_with_mpm(
+        mpm_kernel_instance.log
+    )
+    assert result[-1] == "/tmp/matlab-proxy.sock"
+
+
 async def test_initialize_matlab_proxy_with_mpm_exception(mocker, mpm_kernel_instance):
     # Use pytest-mock's mocker fixture to patch the function
     mocker.patch(
@@ -93,6 +116,7 @@ async def test_initialize_mwi_comm_helper(mocker, mpm_kernel_instance):
         mpm_kernel_instance.control_thread.io_loop.asyncio_loop,
         headers,
         mpm_kernel_instance.log,
+        unix_socket=None,
     )
     mock_mwi_comm_helper_instance.connect.assert_awaited_once()
 
@@ -165,3 +189,395 @@ async def test_do_shutdown_exception(mocker, mpm_kernel_instance):
         mpm_kernel_instance.mpm_auth_token,
     )
     assert not mpm_kernel_instance.is_matlab_assigned
+
+
+async def test_eager_matlab_assignment(mocker, mpm_kernel_instance):
+    """
+    This test checks that an execution request waits for the MATLAB assignment which
+    was started along with the kernel, instead of starting matlab-proxy again.
+    """
+    assignment_started = asyncio.Event()
+    release_assignment = asyncio.Event()
+
+    async def start_matlab_proxy():
+        assignment_started.set()
+        await release_assignment.wait()
+
+    mock_start = mocker.patch.object(
+        mpm_kernel_instance,
+        "_start_matlab_proxy_and_comm_helper",
+        side_effect=start_matlab_proxy,
+    )
+    mocker.patch.object(mpm_kernel_instance, "_start_startup_monitor")
+    mock_base_execute = mocker.patch(
+        "jupyter_matlab_kernel.base_kernel.BaseMATLABKernel.do_execute",
+        return_value={"status": "ok"},
+    )
+
+    mpm_kernel_instance._start_matlab_assignment()
+    await assignment_started.wait()
+    assert not mpm_kernel_instance.is_matlab_assigned
+
+    execution = asyncio.ensure_future(
+        mpm_kernel_instance.do_execute("x = 1", silent=False)
+    )
+    await asyncio.sleep(0)
+    mock_base_execute.assert_not_called()
+
+    release_assignment.set()
+    assert await execution == {"status": "ok"}
+    assert mpm_kernel_instance.is_matlab_assigned
+    mock_start.assert_awaited_once()
+    mpm_kernel_instance._start_startup_monitor.assert_called_once()
+
+
+async def test_failed_matlab_assignment_is_retried(mocker, mpm_kernel_instance):
+    """
+    This test checks that the MATLAB assignment is started again by the next execution
+    request if it failed.
+    """
+    mock_start = mocker.patch.object(
+        mpm_kernel_instance,
+        "_start_matlab_proxy_and_comm_helper",
+        side_effect=[Exception("Unable to connect"), None],
+    )
+    mocker.patch.object(mpm_kernel_instance, "_start_startup_monitor")
+    mocker.patch(
+        "jupyter_matlab_kernel.base_kernel.BaseMATLABKernel.do_execute",
+        return_value={"status": "ok"},
+    )
+
+    with pytest.raises(Exception, match="Unable to connect"):
+        await mpm_kernel_instance._start_matlab_assignment()
+
+    await mpm_kernel_instance.do_execute("x = 1", silent=False)
+    assert mock_start.await_count == 2
+    assert mpm_kernel_instance.is_matlab_assigned
+
+
+async def test_do_shutdown_during_matlab_assignment(mocker, mpm_kernel_instance):
+    """
+    This test checks that shutting down the kernel from the control thread while
+    MATLAB is being assigned cancels the assignment and shuts down matlab-proxy.
+    """
+
+    async def start_matlab_proxy():
+        await asyncio.sleep(60)
+
+    mocker.patch.object(
+        mpm_kernel_instance,
+        "_start_matlab_proxy_and_comm_helper",
+        side_effect=start_matlab_proxy,
+    )
+    mpm_kernel_instance.mwi_comm_helper = mocker.Mock()
+    mpm_kernel_instance.mwi_comm_helper.send_shutdown_request_to_matlab = (
+        mocker.AsyncMock()
+    )
+    mpm_kernel_instance.mwi_comm_helper.disconnect = mocker.AsyncMock()
+    mock_shutdown = mocker.patch(
+        "matlab_proxy_manager.lib.api.shutdown", return_value=mocker.AsyncMock()
+    )
+
+    mpm_kernel_instance.io_loop = mocker.Mock()
+    mpm_kernel_instance.io_loop.asyncio_loop = asyncio.get_running_loop()
+
+    task = mpm_kernel_instance._start_matlab_assignment()
+    await asyncio.sleep(0)
+    # Shutdown requests are handled on the control thread.
+    await asyncio.to_thread(asyncio.run, mpm_kernel_instance.do_shutdown(False))
+
+    await asyncio.sleep(0)
+    assert task.cancelled()
+    mock_shutdown.assert_awaited_once()
+    assert not mpm_kernel_instance.is_matlab_assigned
+
+
+async def test_initialize_matlab_proxy_with_pool(mocker, mpm_kernel_instance):
+    """
+    This test checks that an isolated MATLAB is leased from the pool instead of
+    starting a shared MATLAB, when the pool is enabled.
+    """
+    lease = mocker.Mock()
+    lease.server = {
+        "absolute_url": "dummyURL",
+        "mwi_base_url": "/matlab/jupyter-matlab-pool-0",
+        "headers": "dummy_header",
+        "mpm_auth_token": "dummy_token",
+    }
+    mpm_kernel_instance.matlab_pool = mocker.Mock()
+    mpm_kernel_instance.matlab_pool.lease = mocker.AsyncMock(return_value=lease)
+    mock_start = mocker.patch(
+        "matlab_proxy_manager.lib.api.start_matlab_proxy_for_kernel"
+    )
+
+    result = await mpm_kernel_instance._initialize_matlab_proxy_with_mpm(
+        mpm_kernel_instance.log
+    )
+
+    assert result == tuple(lease.server.values()) + (None,)
+    assert mpm_kernel_instance.matlab_lease is lease
+    mock_start.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    "shutdown_result, expected_recycle",
+    [
+        ({"reset": True}, False),
+        ({"reset": False}, True),
+        (
+            [
+                {
+                    "type": "stream",
+                    "content": {"name": "stderr", "text": "MATLAB Kernel Error"},
+                }
+            ],
+            True,
+        ),
+        (MATLABConnectionError("Test connection error"), True),
+    ],
+    ids=["returned", "reset failed", "MATLAB error", "connection error"],
+)
+async def test_do_shutdown_releases_leased_matlab(
+    mocker, mpm_kernel_instance, shutdown_result, expected_recycle
+):
+    """
+    This test checks that a leased MATLAB is returned to the pool after its workspace
+    is reset, and recycled unless MATLAB confirms the reset.
+    """
+    mpm_kernel_instance.is_matlab_assigned = True
+    lease = mocker.Mock()
+    mpm_kernel_instance.matlab_lease = lease
+    mpm_kernel_instance.matlab_pool = mocker.Mock()
+    mpm_kernel_instance.matlab_pool.release = mocker.AsyncMock()
+    mpm_kernel_instance.mwi_comm_helper = mocker.Mock()
+    mpm_kernel_instance.mwi_comm_helper.send_shutdown_request_to_matlab = (
+        mocker.AsyncMock(side_effect=[shutdown_result])
+    )
+    mpm_kernel_instance.mwi_comm_helper.disconnect = mocker.AsyncMock()
+    mock_shutdown = mocker.patch("matlab_proxy_manager.lib.api.shutdown")
+
+    await mpm_kernel_instance.do_shutdown(False)
+
+    mpm_kernel_instance.mwi_comm_helper.send_shutdown_request_to_matlab.assert_awaited_once_with(
+        {"resetWorkspace": True}
+    )
+    mpm_kernel_instance.matlab_pool.release.assert_awaited_once_with(
+        lease, expected_recycle
+    )
+    mock_shutdown.assert_not_called()
+    assert mpm_kernel_instance.matlab_lease is None
+
+
+MOCK_SNAPSHOT_INFO = {
+    "time": 0.5,
+    "bytes": 2048,
+    "variables": 3,
+    "sessionEpoch": "1234-20250101000000000",
+    "restored": True,
+}
+
+
+@pytest.fixture
+def hibernating_kernel(mocker, mpm_kernel_instance):
+    """Kernel with an assigned MATLAB which is up."""
+    mpm_kernel_instance.is_matlab_assigned = True
+    mpm_kernel_instance.startup_checks_completed = True
+    mpm_kernel_instance.startup_monitor._state = startup_monitor.UP
+    mpm_kernel_instance.mwi_comm_helper = mocker.Mock()
+    mpm_kernel_instance.mwi_comm_helper.send_snapshot_request_to_matlab = (
+        mocker.AsyncMock(return_value=MOCK_SNAPSHOT_INFO)
+    )
+    mocker.patch.object(mpm_kernel_instance, "_release_matlab")
+    yield mpm_kernel_instance
+    if mpm_kernel_instance._snapshot_dir is not None:
+        shutil.rmtree(mpm_kernel_instance._snapshot_dir, ignore_errors=True)
+
+
+async def test_hibernate_saves_workspace_and_releases_matlab(hibernating_kernel):
+    """
+    This test checks that hibernating saves the workspace, releases MATLAB and
+    requires the startup checks to be performed again.
+    """
+    comm_helper = hibernating_kernel.mwi_comm_helper
+
+    await hibernating_kernel._hibernate()
+
+    comm_helper.send_snapshot_request_to_matlab.assert_awaited_once()
+    action, path = comm_helper.send_snapshot_request_to_matlab.await_args.args
+    assert action == "save"
+    assert path.startswith(str(hibernating_kernel._snapshot_dir))
+    assert hibernating_kernel.workspace_snapshot == {
+        "path": path,
+        "sessionEpoch": MOCK_SNAPSHOT_INFO["sessionEpoch"],
+    }
+    assert hibernating_kernel.hibernation_stats["snapshot"]["bytes"] == 2048
+    hibernating_kernel._release_matlab.assert_awaited_once()
+    assert hibernating_kernel.mwi_comm_helper is None
+    assert not hibernating_kernel.startup_checks_completed
+    assert hibernating_kernel.startup_monitor.state == startup_monitor.UNLICENSED
+
+
+async def test_hibernate_keeps_matlab_if_save_fails(hibernating_kernel):
+    """
+    This test checks that MATLAB is not released if the workspace could not be saved.
+    """
+    hibernating_kernel.mwi_comm_helper.send_snapshot_request_to_matlab.return_value = [
+        {"type": "stream", "content": {"name": "stderr", "text": "Error"}}
+    ]
+
+    await hibernating_kernel._hibernate()
+
+    assert hibernating_kernel.workspace_snapshot is None
+    hibernating_kernel._release_matlab.assert_not_awaited()
+
+
+async def test_restore_workspace(mocker, hibernating_kernel):
+    """
+    This test checks that the saved workspace is loaded into the reacquired MATLAB
+    and the snapshot is deleted.
+    """
+    await hibernating_kernel._hibernate()
+    path = hibernating_kernel.workspace_snapshot["path"]
+    comm_helper = mocker.Mock()
+    comm_helper.send_snapshot_request_to_matlab = mocker.AsyncMock(
+        return_value=MOCK_SNAPSHOT_INFO
+    )
+    hibernating_kernel.mwi_comm_helper = comm_helper
+
+    await hibernating_kernel._restore_workspace()
+
+    comm_helper.send_snapshot_request_to_matlab.assert_awaited_once_with(
+        "load", path, MOCK_SNAPSHOT_INFO["sessionEpoch"]
+    )
+    assert hibernating_kernel.workspace_snapshot is None
+    assert hibernating_kernel.hibernation_stats["restore"]["restored"]
+
+
+async def test_execution_stops_hibernation_timer(mocker, hibernating_kernel):
+    """
+    This test checks that the kernel hibernates once it is idle for the hibernation
+    timeout, and that an execution request restarts the timer.
+    """
+    hibernating_kernel.hibernation_timeout = 0.05
+    mocker.patch.object(hibernating_kernel, "_hibernate")
+    mocker.patch(
+        "jupyter_matlab_kernel.base_kernel.BaseMATLABKernel.do_execute",
+        return_value={"status": "ok"},
+    )
+
+    await hibernating_kernel.do_execute("x = 1", silent=False)
+    await asyncio.sleep(0.03)
+    await hibernating_kernel.do_execute("x = 2", silent=False)
+    await asyncio.sleep(0.03)
+    hibernating_kernel._hibernate.assert_not_awaited()
+
+    await asyncio.sleep(0.05)
+    hibernating_kernel._hibernate.assert_awaited_once()
+
+
+@pytest.mark.parametrize(
+    "restart, expected_shutdown",
+    [(True, False), (False, True)],
+    ids=["restart", "stop"],
+)
+async def test_fast_restart_keeps_matlab(
+    mocker, mpm_kernel_instance, restart, expected_shutdown
+):
+    """
+    This test checks that a shared MATLAB is kept running when the kernel is
+    restarted in fast restart mode, and shut down otherwise. The workspace of a
+    shared MATLAB, which other kernels use, is never reset.
+    """
+    mpm_kernel_instance.fast_restart = True
+    mpm_kernel_instance.is_matlab_assigned = True
+    mpm_kernel_instance.mwi_comm_helper = mocker.Mock()
+    mpm_kernel_instance.mwi_comm_helper.send_shutdown_request_to_matlab = (
+        mocker.AsyncMock()
+    )
+    mpm_kernel_instance.mwi_comm_helper.disconnect = mocker.AsyncMock()
+    mock_shutdown = mocker.patch("matlab_proxy_manager.lib.api.shutdown")
+
+    await mpm_kernel_instance.do_shutdown(restart)
+
+    mpm_kernel_instance.mwi_comm_helper.send_shutdown_request_to_matlab.assert_awaited_once_with(
+        None
+    )
+    assert mock_shutdown.await_count == int(expected_shutdown)
+    assert not mpm_kernel_instance.is_matlab_assigned
+
+
+async def test_fast_restart_resets_leased_matlab(mocker, mpm_kernel_instance):
+    """
+    This test checks that a leased MATLAB is reset and kept for the restarted
+    kernel in fast restart mode.
+    """
+    mpm_kernel_instance.fast_restart = True
+    mpm_kernel_instance.is_matlab_assigned = True
+    mpm_kernel_instance.matlab_lease = mocker.Mock()
+    mpm_kernel_instance.matlab_pool = mocker.Mock()
+    mpm_kernel_instance.matlab_pool.release = mocker.AsyncMock()
+    mpm_kernel_instance.mwi_comm_helper = mocker.Mock()
+    mpm_kernel_instance.mwi_comm_helper.send_shutdown_request_to_matlab = (
+        mocker.AsyncMock(return_value={"reset": True})
+    )
+    mpm_kernel_instance.mwi_comm_helper.disconnect = mocker.AsyncMock()
+    mock_shutdown = mocker.patch("matlab_proxy_manager.lib.api.shutdown")
+
+    await mpm_kernel_instance.do_shutdown(True)
+
+    mpm_kernel_instance.mwi_comm_helper.send_shutdown_request_to_matlab.assert_awaited_once_with(
+        {"resetWorkspace": True}
+    )
+    mpm_kernel_instance.matlab_pool.release.assert_not_awaited()
+    mock_shutdown.assert_not_called()
+    assert mpm_kernel_instance.matlab_lease is None
+
+
+async def test_fast_restart_shuts_down_matlab_if_reset_fails(
+    mocker, mpm_kernel_instance
+):
+    """
+    This test checks that MATLAB is shut down on restart if its state could not be reset.
+    """
+    mpm_kernel_instance.fast_restart = True
+    mpm_kernel_instance.is_matlab_assigned = True
+    mpm_kernel_instance.mwi_comm_helper = mocker.Mock()
+    mpm_kernel_instance.mwi_comm_helper.send_shutdown_request_to_matlab = (
+        mocker.AsyncMock(side_effect=MATLABConnectionError())
+    )
+    mock_shutdown = mocker.patch("matlab_proxy_manager.lib.api.shutdown")
+
+    await mpm_kernel_instance.do_shutdown(True)
+
+    mock_shutdown.assert_awaited_once()
+
+
+async def test_fast_restart_recycles_leased_matlab_if_reset_fails(
+    mocker, mpm_kernel_instance
+):
+    """
+    This test checks that a leased MATLAB is not kept for the restarted kernel if
+    MATLAB returns an error instead of confirming the reset.
+    """
+    mpm_kernel_instance.fast_restart = True
+    mpm_kernel_instance.is_matlab_assigned = True
+    lease = mocker.Mock()
+    mpm_kernel_instance.matlab_lease = lease
+    mpm_kernel_instance.matlab_pool = mocker.Mock()
+    mpm_kernel_instance.matlab_pool.release = mocker.AsyncMock()
+    mpm_kernel_instance.mwi_comm_helper = mocker.Mock()
+    mpm_kernel_instance.mwi_comm_helper.send_shutdown_request_to_matlab = (
+        mocker.AsyncMock(
+            return_value=[
+                {
+                    "type": "stream",
+                    "content": {"name": "stderr", "text": "MATLAB Kernel Error"},
+                }
+            ]
+        )
+    )
+    mpm_kernel_instance.mwi_comm_helper.disconnect = mocker.AsyncMock()
+
+    await mpm_kernel_instance.do_shutdown(True)
+
+    mpm_kernel_instance.matlab_pool.release.assert_awaited_once_with(lease, True)
@@ -1,12 +1,21 @@
-# Copyright 2023-2024 The MathWorks, Inc.
+# Copyright 2023-2025 The MathWorks, Inc.
 # This file contains tests for jupyter_matlab_kernel.mwi_comm_helpers
 
 import asyncio
 import http
+import json
+import os
+import tempfile
 
 import aiohttp
 import aiohttp.client_exceptions
 import pytest
+from aiohttp import web
+from mocks.mock_embedded_connector import (
+    MOCK_SESSION_CAPABILITIES,
+    MOCK_WARMUP_TIMINGS,
+    MockEmbeddedConnector,
+)
 from mocks.mock_http_responses import (
     MockMatlabProxyStatusResponse,
     MockSimpleBadResponse,
@@ -29,6 +38,25 @@ async def matlab_proxy_fixture():
     await matlab_proxy.disconnect()
 
 
+@pytest.fixture
+async def embedded_connector_fixture(aiohttp_server):
+    connector = MockEmbeddedConnector(
+        sections=[
+            [{"type": "stream", "content": {"name": "stdout", "text": "first\n"}}],
+            [],
+            [{"type": "stream", "content": {"name": "stdout", "text": "second\n"}}],
+        ]
+    )
+    server = await aiohttp_server(connector.create_app())
+    loop = asyncio.get_event_loop()
+    comm_helper = MWICommHelper(
+        "kernel_id", str(server.make_url("")).rstrip("/"), loop, loop, {}
+    )
+    await comm_helper.connect()
+    yield connector, comm_helper
+    await comm_helper.disconnect()
+
+
 # Testing fetch_matlab_proxy_status
 async def test_fetch_matlab_proxy_status_unauth_request(
     monkeypatch, matlab_proxy_fixture
@@ -138,6 +166,10 @@ async def test_execution_request_invalid_feval_response(
         async def json():
             return {"messages": {}}
 
+        @staticmethod
+        async def read():
+            return b'{"messages": {}}'
+
     async def mock_post(*args, **kwargs):
         return MockSimpleInvalidFevalResponse()
 
@@ -178,6 +210,9 @@ async def test_execution_interrupt(monkeypatch, matlab_proxy_fixture):
                 }
             }
 
+        async def read(self):
+            return json.dumps(await self.json()).encode("utf-8")
+
     async def mock_post(*args, **kwargs):
         return MockResponse()
 
@@ -189,32 +224,51 @@ async def test_execution_interrupt(monkeypatch, matlab_proxy_fixture):
     assert "Operation may have interrupted by user" in str(exceptionInfo.value)
 
 
+class MockFEvalResponse:
+    """A mock of a successful FEval response containing a single result."""
+
+    status = http.HTTPStatus.OK
+
+    def __init__(self, result, num_fevals=1, is_error=False, fault_message=""):
+        self.result = result
+        self.num_fevals = num_fevals
+        self.is_error = is_error
+        self.fault_message = fault_message
+
+    async def json(self):
+        return {
+            "messages": {
+                "FEvalResponse": [{}] * (self.num_fevals - 1)
+                + [
+                    {
+                        "isError": self.is_error,
+                        "results": [self.result],
+                        "messageFaults": [{"message": self.fault_message}],
+                    }
+                ],
+            }
+        }
+
+    async def read(self):
+        return json.dumps(await self.json()).encode("utf-8")
+
+
+def get_feval_messages(kwargs):
+    """Returns the FEval messages sent in a mocked HTTP request."""
+    return json.loads(kwargs["data"])["messages"]["FEval"]
+
+
 async def test_execution_success(monkeypatch, matlab_proxy_fixture):
     """
     This test checks that send_execution_request_to_matlab returns the correct information
     from a valid response from MATLAB.
     """
 
-    class MockResponse:
-        status = http.HTTPStatus.OK
-
-        @staticmethod
-        async def json():
-            return {
-                "messages": {
-                    "FEvalResponse": [
-                        {},
-                        {
-                            "isError": False,
-                            "results": ["Mock results from feval"],
-                            "messageFaults": [{"message": ""}],
-                        },
-                    ],
-                }
-            }
-
     async def mock_post(*args, **kwargs):
-        return MockResponse()
+        fevals = get_feval_messages(kwargs)
+        if len(fevals) == 2:
+            return MockFEvalResponse(MOCK_SESSION_CAPABILITIES, num_fevals=2)
+        return MockFEvalResponse("Mock results from feval")
 
     monkeypatch.setattr(aiohttp.ClientSession, "post", mock_post)
 
@@ -225,3 +279,255 @@ async def test_execution_success(monkeypatch, matlab_proxy_fixture):
         pytest.fail("Unexpected failured in execution request")
 
     assert "Mock results from feval" in outputs
+
+
+async def test_session_handshake_performed_once(monkeypatch, matlab_proxy_fixture):
+    """
+    This test checks that the addpath handshake is sent only with the first request
+    and that later requests send a single FEval.
+    """
+    sent_requests = []
+
+    async def mock_post(*args, **kwargs):
+        fevals = get_feval_messages(kwargs)
+        sent_requests.append(fevals)
+        if len(fevals) == 2:
+            return MockFEvalResponse(MOCK_SESSION_CAPABILITIES, num_fevals=2)
+        return MockFEvalResponse(["output"])
+
+    monkeypatch.setattr(aiohttp.ClientSession, "post", mock_post)
+
+    await matlab_proxy_fixture.send_execution_request_to_matlab("a = 1")
+    await matlab_proxy_fixture.send_completion_request_to_matlab("plo", 3)
+
+    assert len(sent_requests) == 3
+    handshake = sent_requests[0]
+    assert handshake[0]["function"] == "addpath"
+    assert handshake[1]["arguments"][:2] == ["handshake", "feval"]
+    assert all(len(fevals) == 1 for fevals in sent_requests[1:])
+    assert all(
+        fevals[0]["function"] == "processJupyterKernelRequest"
+        and fevals[0]["dequeMode"] == "non_debug_prompt"
+        for fevals in sent_requests[1:]
+    )
+    assert matlab_proxy_fixture.session_capabilities == MOCK_SESSION_CAPABILITIES
+
+
+async def test_session_invalidated_when_matlab_not_up(
+    monkeypatch, matlab_proxy_fixture
+):
+    """
+    This test checks that the cached capabilities are discarded when matlab-proxy
+    reports that MATLAB is no longer up.
+    """
+    matlab_proxy_fixture._session_capabilities = MOCK_SESSION_CAPABILITIES
+
+    async def mock_get(*args, **kwargs):
+        return MockMatlabProxyStatusResponse(
+            lic_type="nlm", matlab_status="starting", has_error=False
+        )
+
+    monkeypatch.setattr(aiohttp.ClientSession, "get", mock_get)
+
+    await matlab_proxy_fixture.fetch_matlab_proxy_status()
+    assert matlab_proxy_fixture.session_capabilities is None
+
+
+async def test_session_handshake_repeated_after_matlab_restart(
+    monkeypatch, matlab_proxy_fixture
+):
+    """
+    This test checks that a request failing because the kernel's MATLAB code is
+    missing from the path triggers a new handshake and a single retry.
+    """
+    matlab_proxy_fixture._session_capabilities = MOCK_SESSION_CAPABILITIES
+    restarted_capabilities = dict(MOCK_SESSION_CAPABILITIES, sessionEpoch="5678-1")
+    sent_requests = []
+
+    async def mock_post(*args, **kwargs):
+        fevals = get_feval_messages(kwargs)
+        sent_requests.append(fevals)
+        if len(fevals) == 2:
+            return MockFEvalResponse(restarted_capabilities, num_fevals=2)
+        if len(sent_requests) == 1:
+            return MockFEvalResponse(
+                None,
+                is_error=True,
+                fault_message="Undefined function 'processJupyterKernelRequest' for input arguments of type 'char'.",
+            )
+        return MockFEvalResponse(["output"])
+
+    monkeypatch.setattr(aiohttp.ClientSession, "post", mock_post)
+
+    outputs = await matlab_proxy_fixture.send_execution_request_to_matlab("a = 1")
+
+    assert outputs == ["output"]
+    assert [len(fevals) for fevals in sent_requests] == [1, 2, 1]
+    assert matlab_proxy_fixture.session_capabilities == restarted_capabilities
+
+
+async def test_stream_execution_yields_outputs_while_executing(
+    embedded_connector_fixture,
+):
+    """
+    This test checks that stream_execution_request_to_matlab yields the outputs of
+    a section before MATLAB has finished executing the remaining sections.
+    """
+    connector, comm_helper = embedded_connector_fixture
+
+    outputs = []
+    streaming_state_at_output = []
+    async for output in comm_helper.stream_execution_request_to_matlab("code"):
+        outputs.append(output["content"]["text"])
+        streaming_state_at_output.append(connector.is_streaming)
+
+    assert outputs == ["first\n", "second\n"]
+    assert streaming_state_at_output == [True, False]
+
+    request_types = [fevals[-1]["arguments"][0] for fevals in connector.requests]
+    assert request_types == [
+        "handshake",
+        "execute_stream",
+        "poll_outputs",
+        "poll_outputs",
+        "poll_outputs",
+    ]
+
+
+async def test_execution_against_embedded_connector(embedded_connector_fixture):
+    """
+    This test checks that the non-streaming execution returns all the outputs at once.
+    """
+    connector, comm_helper = embedded_connector_fixture
+
+    outputs = await comm_helper.send_execution_request_to_matlab("code")
+
+    assert [output["content"]["text"] for output in outputs] == ["first\n", "second\n"]
+    assert connector.is_streaming is False
+
+
+@pytest.mark.skipif(
+    os.name == "nt", reason="Unix domain sockets are not used on Windows"
+)
+async def test_requests_over_unix_socket():
+    """
+    This test checks that requests are sent over the Unix domain socket of a
+    co-located matlab-proxy server when one is provided.
+    """
+    connector = MockEmbeddedConnector(
+        sections=[[{"type": "stream", "content": {"name": "stdout", "text": "1"}}]]
+    )
+    runner = web.AppRunner(connector.create_app())
+    await runner.setup()
+    with tempfile.TemporaryDirectory() as socket_dir:
+        socket_path = os.path.join(socket_dir, "matlab-proxy.sock")
+        site = web.UnixSite(runner, socket_path)
+        await site.start()
+
+        loop = asyncio.get_event_loop()
+        comm_helper = MWICommHelper(
+            "kernel_id",
+            "http://matlab-proxy",
+            loop,
+            loop,
+            {},
+            unix_socket=socket_path,
+        )
+        await comm_helper.connect()
+        try:
+            assert comm_helper._http_shell_client.trust_env is False
+            status = await comm_helper.fetch_matlab_proxy_status()
+            outputs = await comm_helper.send_execution_request_to_matlab("code")
+        finally:
+            await comm_helper.disconnect()
+            await runner.cleanup()
+
+    assert status == (True, "up", False)
+    assert outputs[0]["content"]["text"] == "1"
+
+
+async def collect_status_updates(comm_helper, count):
+    statuses = []
+    status_updates = comm_helper.subscribe_to_matlab_proxy_status()
+    async for status in status_updates:
+        statuses.append(status[1])
+        if len(statuses) == count:
+            break
+    await status_updates.aclose()
+    return statuses
+
+
+async def test_subscribe_to_matlab_proxy_status_polling(aiohttp_server, monkeypatch):
+    """
+    This test checks that the status is polled when matlab-proxy does not push
+    status updates, and that polling backs off while the status stays the same.
+    """
+    monkeypatch.setattr(
+        "jupyter_matlab_kernel.mwi_comm_helpers._STATUS_POLL_MIN_INTERVAL", 0.001
+    )
+    sleeps = []
+    original_sleep = asyncio.sleep
+
+    async def mock_sleep(delay):
+        sleeps.append(delay)
+        await original_sleep(0)
+
+    monkeypatch.setattr(asyncio, "sleep", mock_sleep)
+
+    connector = MockEmbeddedConnector(statuses=["starting", "starting", "up"])
+    server = await aiohttp_server(connector.create_app())
+    loop = asyncio.get_event_loop()
+    comm_helper = MWICommHelper(
+        "kernel_id", str(server.make_url("")).rstrip("/"), loop, loop, {}
+    )
+    await comm_helper.connect()
+    try:
+        statuses = await collect_status_updates(comm_helper, 3)
+    finally:
+        await comm_helper.disconnect()
+
+    assert statuses == ["starting", "starting", "up"]
+    assert comm_helper._is_status_push_supported is False
+    assert connector.status_requests == 3
+    assert sleeps[1] > sleeps[0]
+
+
+async def test_subscribe_to_matlab_proxy_status_push(aiohttp_server):
+    """
+    This test checks that status updates pushed by matlab-proxy are received
+    without polling.
+    """
+    connector = MockEmbeddedConnector(
+        statuses=["down", "starting", "up"], push_status=True
+    )
+    server = await aiohttp_server(connector.create_app())
+    loop = asyncio.get_event_loop()
+    comm_helper = MWICommHelper(
+        "kernel_id", str(server.make_url("")).rstrip("/"), loop, loop, {}
+    )
+    await comm_helper.connect()
+    try:
+        statuses = await collect_status_updates(comm_helper, 3)
+    finally:
+        await comm_helper.disconnect()
+
+    assert statuses == ["down", "starting", "up"]
+    assert comm_helper._is_status_push_supported is True
+    assert connector.status_requests == 1
+
+
+async def test_warmup_request(embedded_connector_fixture):
+    """
+    This test checks that the warm-up request sends the no-op code and the warm-up
+    options to MATLAB, and returns the timings of the warm-up.
+    """
+    connector, comm_helper = embedded_connector_fixture
+
+    timings = await comm_helper.send_warmup_request_to_matlab(
+        "x = 1;", {"primeSymbolic": True}
+    )
+
+    assert timings == MOCK_WARMUP_TIMINGS
+    arguments = connector.requests[-1][-1]["arguments"]
+    assert arguments[0] == "warmup"
+    assert arguments[2:] == ["x = 1;", "kernel_id", '{"primeSymbolic": true}']
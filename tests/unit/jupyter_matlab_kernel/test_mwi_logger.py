@@ -0,0 +1,121 @@
+# Copyright 2025 The MathWorks, Inc.
+# This file contains tests for jupyter_matlab_kernel.mwi_logger
+
+import logging
+import logging.handlers
+
+import pytest
+
+from jupyter_matlab_kernel import mwi_logger
+
+
+class CountingPayload:
+    """Payload which records how often it is formatted."""
+
+    def __init__(self):
+        self.formatted = 0
+
+    def __repr__(self):
+        self.formatted += 1
+        return "payload"
+
+
+def test_payload_is_not_formatted_when_not_logged(caplog):
+    """
+    This test checks that a payload is only formatted if the log record is emitted.
+    """
+    logger = logging.getLogger("test_mwi_logger")
+    value = CountingPayload()
+
+    with caplog.at_level(logging.INFO, logger="test_mwi_logger"):
+        logger.debug("Response:\n%s", mwi_logger.payload(value))
+    assert value.formatted == 0
+
+    with caplog.at_level(logging.DEBUG, logger="test_mwi_logger"):
+        logger.debug("Response:\n%s", mwi_logger.payload(value))
+    assert value.formatted > 0
+    assert "Response:\npayload" in caplog.text
+
+
+def test_small_payload_is_not_truncated():
+    """
+    This test checks that payloads within the size limit are logged in full.
+    """
+    value = {"type": "stream", "content": {"text": "Hello"}}
+    assert str(mwi_logger.payload(value)) == repr(value)
+    assert str(mwi_logger.payload("x = 1;", "code")) == "x = 1;"
+
+
+def test_large_payload_is_truncated(monkeypatch):
+    """
+    This test checks that payloads larger than the size limit are truncated and
+    summarized with their type, size and hash.
+    """
+    monkeypatch.setenv("MWI_JUPYTER_LOG_PAYLOAD_LIMITS", "100")
+
+    text = str(mwi_logger.payload("a" * 1000, "code"))
+
+    assert text.startswith("<truncated str: 1000 bytes, sha256 ")
+    assert text.endswith("a" * 100 + "...")
+
+
+def test_nested_strings_are_summarized(monkeypatch):
+    """
+    This test checks that long strings nested in a payload, such as base64 encoded
+    figures, are summarized instead of being formatted.
+    """
+    monkeypatch.setenv("MWI_JUPYTER_LOG_PAYLOAD_LIMITS", "200")
+    output = {
+        "type": "execute_result",
+        "mimetype": ["image/png"],
+        "value": ["A" * 10**6],
+    }
+
+    text = str(mwi_logger.payload(output, "output"))
+
+    assert "<truncated str: 1000000 bytes, sha256 " in text
+    assert "A" * 200 not in text
+
+
+@pytest.mark.parametrize(
+    "limits, kind, expected_limit",
+    [
+        ("", "code", 4096),
+        ("1024", "code", 1024),
+        ("code=0,default=10", "code", 0),
+        ("code=0,default=10", "response", 10),
+        ("response=10", "code", 4096),
+        ("code=invalid", "code", 4096),
+    ],
+)
+def test_payload_log_limits(monkeypatch, limits, kind, expected_limit):
+    """
+    This test checks that the size limit of each kind of payload is read from the
+    MWI_JUPYTER_LOG_PAYLOAD_LIMITS environment variable.
+    """
+    monkeypatch.setenv("MWI_JUPYTER_LOG_PAYLOAD_LIMITS", limits)
+    assert mwi_logger._get_payload_log_limit(kind) == expected_limit
+
+
+def test_async_logging(monkeypatch):
+    """
+    This test checks that the handlers of the root logger are moved behind a queue
+    when asynchronous logging is enabled.
+    """
+    root_logger = logging.getLogger()
+    handler = logging.handlers.BufferingHandler(capacity=10)
+    monkeypatch.setattr(root_logger, "handlers", [handler])
+    monkeypatch.setenv("MWI_JUPYTER_LOG_ASYNC", "true")
+    stopped_listeners = []
+    monkeypatch.setattr(
+        mwi_logger.atexit, "register", lambda stop: stopped_listeners.append(stop)
+    )
+
+    mwi_logger.get(init=True)
+
+    assert len(root_logger.handlers) == 1
+    assert isinstance(root_logger.handlers[0], logging.handlers.QueueHandler)
+
+    logging.getLogger("test_mwi_logger").warning("Logged in the background")
+    stopped_listeners[0]()
+    assert handler.buffer[0].getMessage() == "Logged in the background"
@@ -0,0 +1,90 @@
+# Copyright 2025 The MathWorks, Inc.
+# This file contains tests for jupyter_matlab_kernel.output_coalescer
+
+import asyncio
+
+import pytest
+
+from jupyter_matlab_kernel.output_coalescer import OutputCoalescer
+
+
+def stream(name, text):
+    return {"type": "stream", "content": {"name": name, "text": text}}
+
+
+FIGURE = {"type": "execute_result", "mimetype": ["image/png"], "value": ["iVBORw0"]}
+
+
+@pytest.fixture
+def sent():
+    return []
+
+
+def test_adjacent_stream_outputs_are_merged(sent):
+    """
+    This test checks that adjacent outputs of the same stream are sent as a single
+    output, once the coalescer is flushed.
+    """
+    coalescer = OutputCoalescer(sent.append, interval=60)
+    for idx in range(3):
+        coalescer.add(stream("stdout", f"{idx}\n"))
+
+    assert sent == []
+
+    coalescer.flush()
+
+    assert sent == [stream("stdout", "0\n1\n2\n")]
+    assert coalescer.counters == {"outputs": 3, "messages": 1, "merged": 2}
+
+
+def test_order_is_preserved_across_output_types(sent):
+    """
+    This test checks that held back outputs are sent before an output of another
+    type or stream.
+    """
+    coalescer = OutputCoalescer(sent.append, interval=60)
+    outputs = [
+        stream("stdout", "a\n"),
+        stream("stdout", "b\n"),
+        stream("stderr", "warning\n"),
+        FIGURE,
+        stream("stdout", "c\n"),
+    ]
+    for output in outputs:
+        coalescer.add(output)
+    coalescer.flush()
+
+    assert sent == [
+        stream("stdout", "a\nb\n"),
+        stream("stderr", "warning\n"),
+        FIGURE,
+        stream("stdout", "c\n"),
+    ]
+
+
+def test_outputs_are_sent_once_max_size_is_reached(sent):
+    """
+    This test checks that merged outputs are sent when their text reaches the
+    maximum size, without waiting for the end of the cell.
+    """
+    coalescer = OutputCoalescer(sent.append, interval=60, max_size=10)
+    for _ in range(7):
+        coalescer.add(stream("stdout", "1234\n"))
+
+    assert sent == [stream("stdout", "1234\n1234\n")] * 3
+
+
+async def test_outputs_are_sent_after_interval(sent):
+    """
+    This test checks that held back outputs are sent once the coalesce interval has
+    elapsed, even if no other output arrives.
+    """
+    coalescer = OutputCoalescer(sent.append, interval=0.01)
+    coalescer.add(stream("stdout", "a\n"))
+    coalescer.add(stream("stdout", "b\n"))
+
+    await asyncio.sleep(0.05)
+
+    assert sent == [stream("stdout", "a\nb\n")]
+    coalescer.flush()
+    assert len(sent) == 1
@@ -0,0 +1,134 @@
+# Copyright 2025 The MathWorks, Inc.
+# This file contains tests for jupyter_matlab_kernel.output_limiter
+
+from jupyter_matlab_kernel.output_limiter import OutputLimiter
+
+
+def stream(name, text):
+    return {"type": "stream", "content": {"name": name, "text": text}}
+
+
+def run_cell(limiter, outputs):
+    """Returns the outputs displayed for a cell, with adjacent stream text joined."""
+    displayed = []
+    for output in outputs:
+        displayed.extend(limiter.filter(output))
+    displayed.extend(limiter.end_cell())
+
+    joined = []
+    for output in displayed:
+        if (
+            joined
+            and output["type"] == "stream"
+            and joined[-1]["type"] == "stream"
+            and joined[-1]["content"]["name"] == output["content"]["name"]
+        ):
+            text = joined[-1]["content"]["text"] + output["content"]["text"]
+            joined[-1] = stream(output["content"]["name"], text)
+        else:
+            joined.append(output)
+    return joined
+
+
+def test_repeated_lines_are_collapsed():
+    """
+    This test checks that identical consecutive lines beyond min_repeats are
+    collapsed into the number of times they were repeated.
+    """
+    limiter = OutputLimiter(min_repeats=2)
+    outputs = [stream("stdout", "start\n")] + [stream("stdout", "same\n")] * 5
+    outputs += [stream("stdout", "end\nend\nend\n")]
+
+    displayed = run_cell(limiter, outputs)
+
+    assert displayed == [
+        stream(
+            "stdout",
+            "start\nsame\nsame\n... previous line repeated 3 more times\n"
+            "end\nend\n... previous line repeated 1 more time\n",
+        )
+    ]
+
+
+def test_repeated_warnings_are_collapsed():
+    """
+    This test checks that identical consecutive multi-line outputs, such as a warning
+    emitted on each iteration of a loop, are collapsed after the default run length.
+    """
+    warning = "Warning: Matrix is singular.\n> In loop (line 3)\n"
+    limiter = OutputLimiter()
+
+    displayed = run_cell(limiter, [stream("stderr", warning)] * 9813)
+
+    assert displayed == [
+        stream(
+            "stderr", warning * 100 + "... previous output repeated 9,713 more times\n"
+        )
+    ]
+
+
+def test_small_matrices_and_tables_are_not_collapsed():
+    """
+    This test checks that short runs of identical lines, such as the rows of a small
+    matrix or table displayed by MATLAB, are displayed unchanged.
+    """
+    matrix = "\nans =\n\n" + "     1     1     1\n" * 4 + "\n"
+    table = (
+        "    Name     Value\n    _____    _____\n\n" + '    "a"        0  \n' * 3 + "\n"
+    )
+    limiter = OutputLimiter()
+
+    displayed = run_cell(
+        limiter, [stream("stdout", matrix), stream("stdout", table)] * 3
+    )
+
+    assert displayed == [stream("stdout", (matrix + table) * 3)]
+
+
+def test_lines_are_not_collapsed_across_other_outputs():
+    """
+    This test checks that a line displayed again after another output is displayed.
+    """
+    figure = {"type": "execute_result", "mimetype": ["image/png"], "value": ["png"]}
+    limiter = OutputLimiter()
+
+    displayed = run_cell(
+        limiter, [stream("stdout", "x\n"), figure, stream("stdout", "x\n")]
+    )
+
+    assert displayed == [stream("stdout", "x\n"), figure, stream("stdout", "x\n")]
+
+
+def test_outputs_over_budget_are_truncated(tmp_path):
+    """
+    This test checks that the stream outputs of a cell over its budget are not
+    displayed, and that the truncation is summarized with the path to the full output.
+    """
+    limiter = OutputLimiter(max_bytes=20, spill_dir=tmp_path)
+    outputs = [stream("stdout", f"line {idx}\n") for idx in range(10)]
+
+    displayed = run_cell(limiter, outputs)
+
+    assert displayed[0] == stream("stdout", "line 0\nline 1\n")
+    summary = displayed[1]["content"]["text"]
+    assert displayed[1]["content"]["name"] == "stderr"
+    assert "Output truncated: 56 bytes in 8 output(s)" in summary
+    (spill_file,) = tmp_path.iterdir()
+    assert str(spill_file) in summary
+    assert spill_file.read_text() == "".join(
+        output["content"]["text"] for output in outputs
+    )
+
+
+def test_budget_is_reset_for_each_cell(tmp_path):
+    """
+    This test checks that each cell has its own budget, and that the full output of
+    a cell displayed in full is not kept.
+    """
+    limiter = OutputLimiter(max_outputs=1, spill_dir=tmp_path)
+    run_cell(limiter, [stream("stdout", "a\n"), stream("stdout", "b\n")])
+
+    displayed = run_cell(limiter, [stream("stdout", "c\n")])
+
+    assert displayed == [stream("stdout", "c\n")]
+    assert len(list(tmp_path.iterdir())) == 1
@@ -0,0 +1,103 @@
+# Copyright 2025 The MathWorks, Inc.
+# This file contains tests for jupyter_matlab_kernel.output_pager
+
+from jupyter_matlab_kernel.output_pager import (
+    PAGED_OUTPUT_MIMETYPE,
+    OutputPager,
+    _split_pages,
+)
+
+
+def text_output(text):
+    return {
+        "type": "execute_result",
+        "mimetype": ["text/html", "text/plain"],
+        "value": [f"<html><body><pre>{text}</pre></body></html>", text],
+    }
+
+
+class MockComm:
+    """Comm which records the messages sent to the front-end."""
+
+    def __init__(self):
+        self.sent = []
+        self.handler = None
+
+    def on_msg(self, handler):
+        self.handler = handler
+        return handler
+
+    def send(self, data):
+        self.sent.append(data)
+
+    def receive(self, data):
+        self.handler({"content": {"data": data}})
+        return self.sent[-1]
+
+
+def test_split_pages_at_line_boundaries():
+    """
+    This test checks that pages end at a line boundary, unless a line is longer
+    than a page.
+    """
+    assert _split_pages("ab\ncd\nef\n", 7) == ["ab\ncd\n", "ef\n"]
+    assert _split_pages("abcdefgh", 3) == ["abc", "def", "gh"]
+
+
+def test_small_outputs_are_not_paged():
+    """
+    This test checks that outputs which fit into a page, and outputs which are not
+    text, are displayed unchanged.
+    """
+    pager = OutputPager(page_size=100)
+    small = text_output("x = 1")
+    figure = {"type": "execute_result", "mimetype": ["image/png"], "value": ["a" * 200]}
+
+    assert pager.paginate(small) is small
+    assert pager.paginate(figure) is figure
+
+
+def test_large_output_is_paged():
+    """
+    This test checks that only the first page of a large output is displayed, and
+    that the other pages are served over the comm.
+    """
+    pager = OutputPager(page_size=30)
+    text = "".join(f"row {idx:02d}\n" for idx in range(10))
+
+    paged = pager.paginate(text_output(text))
+
+    data = dict(zip(paged["mimetype"], paged["value"]))
+    first_page = data[PAGED_OUTPUT_MIMETYPE]
+    assert first_page["text"] == "row 00\nrow 01\nrow 02\nrow 03\n"
+    assert first_page["pages"] == 3
+    assert data["text/plain"].startswith(first_page["text"])
+    assert "42 more characters in 2 page(s)" in data["text/html"]
+
+    comm = MockComm()
+    pager.open_comm(comm, {})
+    pages = [comm.receive({"id": first_page["id"], "page": idx}) for idx in (1, 2)]
+    assert first_page["text"] + "".join(page["text"] for page in pages) == text
+
+
+def test_least_recently_used_outputs_are_evicted():
+    """
+    This test checks that the least recently used outputs are evicted once the pages
+    kept by the kernel exceed their maximum size, and that requests for an evicted
+    output are answered with an error.
+    """
+    pager = OutputPager(page_size=10, max_stored_size=20)
+    ids = []
+    for _ in range(3):
+        paged = pager.paginate(text_output("a" * 20))
+        ids.append(paged["value"][0]["id"])
+        # Using the first output makes the second one the least recently used.
+        pager.get_page(ids[0], 1)
+
+    assert pager.get_page(ids[0], 1) == "a" * 10
+    assert pager.get_page(ids[1], 1) is None
+    assert pager.get_page(ids[2], 1) == "a" * 10
+
+    comm = MockComm()
+    pager.open_comm(comm, {})
+    assert "error" in comm.receive({"id": ids[1], "page": 1})
@@ -0,0 +1,90 @@
+# Copyright 2025 The MathWorks, Inc.
+# This file contains tests for jupyter_matlab_kernel.output_transformer
+
+import json
+from pathlib import Path
+
+import pytest
+
+from jupyter_matlab_kernel.output_transformer import (
+    RAW_OUTPUTS_TYPE,
+    is_raw_outputs,
+    transform_outputs,
+    transform_raw_outputs,
+)
+
+# Responses of the Live Editor API, with the outputs which jupyter.execute returns
+# for them when it post-processes them in MATLAB.
+FIXTURES = json.loads(
+    (Path(__file__).parent / "fixtures" / "live_editor_responses.json").read_text(
+        encoding="utf-8"
+    )
+)
+
+
+def raw_outputs(response, stashed_error=""):
+    return {
+        "type": RAW_OUTPUTS_TYPE,
+        "response": json.dumps(response),
+        "stashedError": stashed_error,
+    }
+
+
+@pytest.mark.parametrize("case", FIXTURES.keys())
+def test_transform_raw_outputs(case):
+    """
+    This test checks that the raw outputs of the Live Editor API are transformed into
+    the outputs which jupyter.execute returns when it post-processes them in MATLAB.
+    """
+    fixture = FIXTURES[case]
+    output = raw_outputs(fixture["response"])
+
+    assert is_raw_outputs(output)
+    assert transform_raw_outputs(output) == fixture["expected"]
+
+
+def test_deferred_figures():
+    """
+    This test checks that figures are replaced by placeholders at their position,
+    and that their images are moved after the other outputs when they are deferred.
+    """
+    records = FIXTURES["figures"]["response"]["outputs"]
+
+    outputs = transform_outputs(records, defer_figures=True)
+
+    assert [output["type"] for output in outputs] == [
+        "figure_placeholder",
+        "stream",
+        "figure_placeholder",
+        "execute_result",
+        "execute_result",
+    ]
+    assert [outputs[0]["displayId"], outputs[2]["displayId"]] == ["f1", "f2"]
+    assert [outputs[3]["displayId"], outputs[4]["displayId"]] == ["f2", "f1"]
+
+
+def test_stashed_error_and_empty_response():
+    """
+    This test checks that the error stashed in older MATLAB versions is displayed
+    after the outputs, and that responses without outputs are supported.
+    """
+    outputs = transform_raw_outputs(raw_outputs({"outputs": []}, "Undefined x"))
+
+    assert outputs == [
+        {"type": "stream", "content": {"name": "stderr", "text": "Undefined x"}}
+    ]
+    assert not is_raw_outputs(FIXTURES["streams"]["expected"][0])
+
+
+def test_invalid_figure_is_ignored():
+    """
+    This test checks that a figure output without an image is not displayed.
+    """
+    records = [
+        {
+            "type": "figure",
+            "outputData": {"figureId": "f1", "figureImage": "data:text/plain;base64,"},
+        }
+    ]
+
+    assert transform_outputs(records) == []
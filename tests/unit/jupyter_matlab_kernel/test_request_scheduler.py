@@ -0,0 +1,136 @@
+# Copyright 2025 The MathWorks, Inc.
+# This file contains tests for jupyter_matlab_kernel.request_scheduler
+
+import asyncio
+import json
+from pathlib import Path
+
+import pytest
+
+from jupyter_matlab_kernel import request_scheduler
+from jupyter_matlab_kernel.request_scheduler import RequestScheduler, _order_tickets
+
+
+@pytest.fixture
+def queue_dir(tmp_path):
+    return tmp_path
+
+
+def get_scheduler(queue_dir, kernel_id):
+    return RequestScheduler("http://localhost:8888/matlab", kernel_id, queue_dir)
+
+
+def test_order_tickets():
+    """
+    This test checks that tickets are ordered by priority, and round-robin across
+    kernels for the same priority.
+    """
+    tickets = [
+        (1, 1, 10, "a", Path("a1")),
+        (1, 2, 10, "a", Path("a2")),
+        (1, 3, 10, "a", Path("a3")),
+        (1, 4, 20, "b", Path("b1")),
+        (0, 5, 20, "b", Path("b2")),
+    ]
+
+    ordered = [ticket[4].name for ticket in _order_tickets(tickets)]
+
+    assert ordered == ["b2", "a1", "b1", "a2", "a3"]
+
+
+async def test_requests_are_served_one_at_a_time(queue_dir):
+    """
+    This test checks that a request waits while another request is served, and
+    that the number of requests ahead of it is reported.
+    """
+    first = get_scheduler(queue_dir, "kernel-a")
+    second = get_scheduler(queue_dir, "kernel-b")
+    positions = []
+    served = []
+
+    async def send(scheduler, name, release, on_wait=None):
+        async with scheduler.schedule(request_scheduler.EXECUTION, on_wait):
+            served.append(name)
+            await release.wait()
+
+    release_first = asyncio.Event()
+    release_second = asyncio.Event()
+    release_second.set()
+    first_task = asyncio.ensure_future(send(first, "a", release_first))
+    await asyncio.sleep(0.05)
+    second_task = asyncio.ensure_future(
+        send(second, "b", release_second, positions.append)
+    )
+    await asyncio.sleep(0.05)
+
+    assert served == ["a"]
+    assert positions == [1]
+
+    release_first.set()
+    await asyncio.gather(first_task, second_task)
+
+    assert served == ["a", "b"]
+    assert positions == [1, 0]
+    assert list(queue_dir.iterdir()) == []
+    assert second.metrics["execution"]["requests"] == 1
+    assert second.metrics["execution"]["wait_time"] > 0
+
+
+async def test_completion_is_served_before_execution(queue_dir):
+    """
+    This test checks that a waiting completion request is served before execution
+    requests which arrived earlier.
+    """
+    scheduler = get_scheduler(queue_dir, "kernel-a")
+    other = get_scheduler(queue_dir, "kernel-b")
+    served = []
+
+    async def send(scheduler, priority, name):
+        async with scheduler.schedule(priority):
+            served.append(name)
+
+    async with scheduler.schedule(request_scheduler.EXECUTION):
+        tasks = [
+            asyncio.ensure_future(send(other, request_scheduler.EXECUTION, "execute")),
+            asyncio.ensure_future(
+                send(scheduler, request_scheduler.COMPLETION, "complete")
+            ),
+        ]
+        await asyncio.sleep(0.05)
+    await asyncio.gather(*tasks)
+
+    assert served == ["complete", "execute"]
+
+
+async def test_cancelled_request_leaves_queue(queue_dir):
+    """
+    This test checks that a request cancelled while waiting is removed from the queue.
+    """
+    scheduler = get_scheduler(queue_dir, "kernel-a")
+
+    async def wait():
+        async with scheduler.schedule(request_scheduler.COMPLETION):
+            pass
+
+    async with scheduler.schedule(request_scheduler.EXECUTION):
+        task = asyncio.ensure_future(wait())
+        await asyncio.sleep(0.05)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert list(queue_dir.glob("*.ticket")) == []
+
+
+async def test_stale_lock_and_tickets_are_discarded(queue_dir):
+    """
+    This test checks that the lock and tickets of kernels which are no longer
+    running do not block other kernels.
+    """
+    (queue_dir / "active.lock").write_text(json.dumps({"pid": -1}))
+    (queue_dir / "0_1_999999999_kernel-b.ticket").touch()
+    scheduler = get_scheduler(queue_dir, "kernel-a")
+
+    async with scheduler.schedule(request_scheduler.EXECUTION):
+        pass
+
+    assert list(queue_dir.iterdir()) == []
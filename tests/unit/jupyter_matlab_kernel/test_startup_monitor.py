@@ -0,0 +1,134 @@
+# Copyright 2025 The MathWorks, Inc.
+# This file contains tests for jupyter_matlab_kernel.startup_monitor
+
+import asyncio
+
+import aiohttp
+import pytest
+
+from jupyter_matlab_kernel import startup_monitor
+from jupyter_matlab_kernel.mwi_exceptions import MATLABConnectionError
+from jupyter_matlab_kernel.startup_monitor import MATLABStartupMonitor
+
+
+class MockCommHelper:
+    """Status subscription whose updates are sent by the test."""
+
+    def __init__(self):
+        self.updates = asyncio.Queue()
+
+    async def subscribe_to_matlab_proxy_status(self):
+        while True:
+            update = await self.updates.get()
+            if isinstance(update, Exception):
+                raise update
+            yield update
+
+
+@pytest.fixture
+async def comm_helper():
+    return MockCommHelper()
+
+
+async def test_initial_state():
+    """
+    This test checks the state of a monitor which has not been started.
+    """
+    monitor = MATLABStartupMonitor()
+
+    assert monitor.state == startup_monitor.UNLICENSED
+    assert monitor.elapsed_time == 0
+    assert monitor.is_running is False
+    with pytest.raises(MATLABConnectionError):
+        await monitor.wait_until_ready()
+
+
+async def test_startup_transitions(comm_helper):
+    """
+    This test checks that the monitor goes through the licensing and starting
+    states until MATLAB is up, and stops following the startup afterwards.
+    """
+    monitor = MATLABStartupMonitor()
+    monitor.start(comm_helper)
+
+    await comm_helper.updates.put((False, "down", False))
+    await monitor.wait_for_status()
+    assert monitor.state == startup_monitor.UNLICENSED
+
+    monitor.set_licensing()
+    await comm_helper.updates.put((False, "down", False))
+    await asyncio.sleep(0)
+    assert monitor.state == startup_monitor.LICENSING
+
+    await comm_helper.updates.put((True, "starting", False))
+    await monitor.wait_until_licensed()
+    assert monitor.state == startup_monitor.STARTING
+
+    await comm_helper.updates.put((True, "up", False))
+    await monitor.wait_until_ready()
+    assert monitor.state == startup_monitor.UP
+    assert monitor.elapsed_time > 0
+
+    await asyncio.sleep(0)
+    assert monitor.is_running is False
+
+
+async def test_startup_timeout(comm_helper):
+    """
+    This test checks that the startup fails if MATLAB is starting for longer than
+    the startup timeout.
+    """
+    monitor = MATLABStartupMonitor(startup_timeout=0.01)
+    monitor.start(comm_helper)
+    await comm_helper.updates.put((True, "starting", False))
+
+    with pytest.raises(MATLABConnectionError):
+        await monitor.wait_until_ready()
+    assert monitor.state == startup_monitor.ERROR
+
+
+async def test_connection_error(comm_helper):
+    """
+    This test checks that an error raised while fetching the status fails the
+    startup with the same error.
+    """
+    monitor = MATLABStartupMonitor()
+    monitor.start(comm_helper)
+    await comm_helper.updates.put(aiohttp.ClientError("matlab-proxy is down"))
+
+    with pytest.raises(aiohttp.ClientError):
+        await monitor.wait_until_ready()
+    assert monitor.state == startup_monitor.ERROR
+
+
+async def test_restart_after_error(comm_helper):
+    """
+    This test checks that the startup can be followed again after it failed.
+    """
+    monitor = MATLABStartupMonitor()
+    monitor.start(comm_helper)
+    await comm_helper.updates.put((True, "down", True))
+    with pytest.raises(MATLABConnectionError):
+        await monitor.wait_until_ready()
+
+    monitor.start(comm_helper)
+    assert monitor.state == startup_monitor.UNLICENSED
+    await comm_helper.updates.put((True, "up", False))
+    await monitor.wait_until_ready()
+    assert monitor.error is None
+
+
+async def test_reset(comm_helper):
+    """
+    This test checks that a reset monitor forgets that MATLAB was up.
+    """
+    monitor = MATLABStartupMonitor()
+    monitor.start(comm_helper)
+    await comm_helper.updates.put((True, "up", False))
+    await monitor.wait_until_ready()
+
+    monitor.reset()
+
+    assert monitor.state == startup_monitor.UNLICENSED
+    assert monitor.elapsed_time == 0
+    assert monitor.is_running is False